@@ -0,0 +1,206 @@
+from weakref import WeakKeyDictionary
+
+from graphene.utils.str_converters import to_camel_case
+from graphql.execution.base import get_operation_root_type
+from graphql.language.ast import (
+    BooleanValue,
+    Field,
+    FragmentDefinition,
+    FragmentSpread,
+    InlineFragment,
+    OperationDefinition,
+    Variable,
+)
+from graphql.type import GraphQLList, GraphQLNonNull, GraphQLObjectType
+
+from .fields import (
+    DjangoPlusListField,
+    PlusConnectionField,
+    PlusField,
+    PlusFilterConnectionField,
+    PlusListField,
+)
+from .permissions import enforce_permission_classes, enforce_throttle_classes
+from .relay.node import PlusNodeField, PlusNodesField
+
+PLUS_FIELDS = (
+    PlusField,
+    PlusListField,
+    PlusConnectionField,
+    PlusFilterConnectionField,
+    DjangoPlusListField,
+    PlusNodeField,
+    PlusNodesField,
+)
+
+_field_checks = WeakKeyDictionary()
+
+
+def get_field_checks(schema):
+    """
+    Map of the (type name, field name) of the fields of `schema` that check
+    permission and throttle classes to their (permission_classes,
+    throttle_classes), built once per schema.
+    """
+    if schema not in _field_checks:
+        auto_camelcase = getattr(schema, "auto_camelcase", True)
+        checks = {}
+        for graphql_type in schema.get_type_map().values():
+            graphene_type = getattr(graphql_type, "graphene_type", None)
+            if not isinstance(graphql_type, GraphQLObjectType) or graphene_type is None:
+                continue
+
+            for name, field in (getattr(graphene_type._meta, "fields", None) or {}).items():
+                if not isinstance(field, PLUS_FIELDS):
+                    continue
+                if field.name:
+                    name = field.name
+                elif auto_camelcase:
+                    name = to_camel_case(name)
+                checks[(graphql_type.name, name)] = (
+                    field.permission_classes,
+                    field.throttle_classes,
+                )
+        _field_checks[schema] = checks
+    return _field_checks[schema]
+
+
+def _is_included(node, variables):
+    for directive in node.directives or []:
+        name = directive.name.value
+        if name not in ("skip", "include"):
+            continue
+
+        value = None
+        for argument in directive.arguments or []:
+            if argument.name.value == "if":
+                value = argument.value
+        if isinstance(value, Variable):
+            value = variables.get(value.name.value)
+        elif isinstance(value, BooleanValue):
+            value = value.value
+        else:
+            value = None
+
+        # Fields whose directives can't be evaluated yet are checked.
+        if value is None:
+            continue
+        if (name == "skip") == bool(value):
+            return False
+    return True
+
+
+class SelectedFields:
+    """
+    Collects the (type name, field name) of the fields of object types
+    selected by an operation, following fragments and the literal or
+    variable `if` of @skip and @include. Fields selected on interfaces and
+    unions aren't collected as the type they are resolved on isn't known.
+    """
+
+    def __init__(self, schema, document_ast, variables=None):
+        self.schema = schema
+        self.variables = variables or {}
+        self.operations = {}
+        self.fragments = {}
+        for definition in document_ast.definitions:
+            if isinstance(definition, OperationDefinition):
+                name = definition.name.value if definition.name else None
+                self.operations[name] = definition
+            elif isinstance(definition, FragmentDefinition):
+                self.fragments[definition.name.value] = definition
+
+    def get_fields(self, operation_name=None):
+        if operation_name is None and len(self.operations) == 1:
+            (operation,) = self.operations.values()
+        else:
+            operation = self.operations.get(operation_name)
+        if operation is None:
+            return []
+
+        try:
+            root_type = get_operation_root_type(self.schema, operation)
+        except Exception:
+            return []
+
+        fields = {}
+        self.collect(root_type, operation.selection_set, frozenset(), fields)
+        return list(fields)
+
+    def collect(self, parent_type, selection_set, fragments, fields):
+        if selection_set is None:
+            return
+
+        for selection in selection_set.selections:
+            if not _is_included(selection, self.variables):
+                continue
+
+            if isinstance(selection, Field):
+                field_def = getattr(parent_type, "fields", {}).get(selection.name.value)
+                if field_def is None:
+                    continue
+                if isinstance(parent_type, GraphQLObjectType):
+                    fields[(parent_type.name, selection.name.value)] = None
+
+                field_type = field_def.type
+                while isinstance(field_type, (GraphQLList, GraphQLNonNull)):
+                    field_type = field_type.of_type
+                self.collect(field_type, selection.selection_set, fragments, fields)
+                continue
+
+            if isinstance(selection, FragmentSpread):
+                name = selection.name.value
+                if name in fragments or name not in self.fragments:
+                    continue
+                fragment = self.fragments[name]
+                if not _is_included(fragment, self.variables):
+                    continue
+                fragments = fragments | {name}
+            elif isinstance(selection, InlineFragment):
+                fragment = selection
+            else:
+                continue
+
+            fragment_type = parent_type
+            if fragment.type_condition is not None:
+                fragment_type = self.schema.get_type(fragment.type_condition.name.value)
+                if fragment_type is None:
+                    continue
+            self.collect(fragment_type, fragment.selection_set, fragments, fields)
+
+
+def authorize_document(schema, document_ast, context, operation_name=None, variables=None):
+    """
+    Checks the permission and throttle classes of the fields selected by the
+    operation before it is executed, raising PermissionDenied or Throttled
+    instead of resolving the fields above the first one that fails.
+
+    The permissions of every field are checked before any throttle, so a
+    forbidden operation doesn't use up the throttles. Throttles are charged
+    for every selected field, even those that won't be resolved because
+    their parent resolves to null. The fields are then added to the
+    context's `authorized_fields`, which their resolvers don't check again.
+    """
+    field_checks = get_field_checks(schema)
+    view = context.get("view")
+    fields = [
+        key
+        for key in SelectedFields(schema, document_ast, variables).get_fields(operation_name)
+        if key in field_checks
+    ]
+
+    for key in fields:
+        permission_classes = field_checks[key][0]
+        if permission_classes is None:
+            permission_classes = view.resolver_permission_classes
+        enforce_permission_classes(context, permission_classes)
+
+    for key in fields:
+        throttle_classes = field_checks[key][1]
+        if throttle_classes is None:
+            throttle_classes = view.resolver_throttle_classes
+        enforce_throttle_classes(context, throttle_classes)
+
+    if context.get("authorized_fields") is None:
+        context["authorized_fields"] = set()
+    context["authorized_fields"].update(fields)
@@ -0,0 +1,143 @@
+from graphene.relay import Connection
+from graphql.execution.base import get_operation_root_type
+from graphql.language.ast import (
+    Field,
+    FragmentDefinition,
+    FragmentSpread,
+    InlineFragment,
+    IntValue,
+    OperationDefinition,
+    Variable,
+)
+from graphql.type import GraphQLList, GraphQLNonNull
+
+
+def is_connection_type(graphql_type):
+    graphene_type = getattr(graphql_type, "graphene_type", None)
+    return isinstance(graphene_type, type) and issubclass(graphene_type, Connection)
+
+
+class DocumentCostAnalysis:
+    """
+    Estimates the cost of executing an operation, after validation and before
+    execution.
+
+    Every field costs 1, plus the cost of its selection times the number of
+    items it returns for list fields: the page size given by the `first`
+    and `last` arguments of connection fields, and `default_list_size` for
+    lists without them. `__typename` and introspection fields are free.
+    """
+
+    def __init__(self, schema, document_ast, variables=None, default_list_size=100):
+        self.schema = schema
+        self.variables = variables or {}
+        self.default_list_size = default_list_size
+        self.operations = {}
+        self.fragments = {}
+        for definition in document_ast.definitions:
+            if isinstance(definition, OperationDefinition):
+                name = definition.name.value if definition.name else None
+                self.operations[name] = definition
+            elif isinstance(definition, FragmentDefinition):
+                self.fragments[definition.name.value] = definition
+
+    def get_cost(self, operation_name=None):
+        if operation_name is None and len(self.operations) == 1:
+            (operation,) = self.operations.values()
+        else:
+            operation = self.operations.get(operation_name)
+        if operation is None:
+            return 0
+
+        try:
+            root_type = get_operation_root_type(self.schema, operation)
+        except Exception:
+            return 0
+        return self.get_selection_set_cost(root_type, operation.selection_set, frozenset())
+
+    def get_list_size(self, field_ast):
+        sizes = []
+        for argument in field_ast.arguments or []:
+            if argument.name.value not in ("first", "last"):
+                continue
+
+            value = argument.value
+            if isinstance(value, Variable):
+                value = self.variables.get(value.name.value)
+            elif isinstance(value, IntValue):
+                value = int(value.value)
+            else:
+                value = None
+
+            if isinstance(value, int):
+                sizes.append(max(value, 0))
+        return min(sizes) if sizes else self.default_list_size
+
+    def get_selection_set_cost(self, parent_type, selection_set, fragments, list_size=None):
+        if selection_set is None:
+            return 0
+
+        cost = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, Field):
+                cost += self.get_field_cost(parent_type, selection, fragments, list_size)
+                continue
+
+            if isinstance(selection, FragmentSpread):
+                name = selection.name.value
+                if name in fragments or name not in self.fragments:
+                    continue
+                fragment = self.fragments[name]
+                fragments = fragments | {name}
+            elif isinstance(selection, InlineFragment):
+                fragment = selection
+            else:
+                continue
+
+            fragment_type = parent_type
+            if fragment.type_condition is not None:
+                fragment_type = self.schema.get_type(fragment.type_condition.name.value)
+                if fragment_type is None:
+                    continue
+            cost += self.get_selection_set_cost(
+                fragment_type, fragment.selection_set, fragments, list_size
+            )
+        return cost
+
+    def get_field_cost(self, parent_type, field_ast, fragments, list_size=None):
+        field_def = getattr(parent_type, "fields", {}).get(field_ast.name.value)
+        if field_def is None:
+            return 0
+
+        field_type = field_def.type
+        if isinstance(field_type, GraphQLNonNull):
+            field_type = field_type.of_type
+
+        count = 1
+        child_list_size = None
+        if isinstance(field_type, GraphQLList):
+            # The edges of a connection are counted with its page size.
+            if list_size is not None and is_connection_type(parent_type):
+                count = list_size
+            else:
+                count = self.get_list_size(field_ast)
+        elif is_connection_type(field_type):
+            child_list_size = self.get_list_size(field_ast)
+
+        while isinstance(field_type, (GraphQLList, GraphQLNonNull)):
+            field_type = field_type.of_type
+
+        return 1 + count * self.get_selection_set_cost(
+            field_type, field_ast.selection_set, fragments, child_list_size
+        )
+
+
+def get_document_cost(
+    schema, document_ast, operation_name=None, variables=None, default_list_size=100
+):
+    """
+    Estimated cost of the operation of `document_ast`, see DocumentCostAnalysis.
+    """
+    return DocumentCostAnalysis(schema, document_ast, variables, default_list_size).get_cost(
+        operation_name
+    )
@@ -7,3 +7,9 @@ class InvalidDocument(exceptions.APIException):
     status_code = status.HTTP_400_BAD_REQUEST
     default_detail = _("Invalid document.")
     default_code = "invalid_document"
+
+
+class OperationCostExceeded(exceptions.APIException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    default_detail = _("The operation costs more than allowed.")
+    default_code = "operation_cost_exceeded"
@@ -0,0 +1,190 @@
+from graphene_django.utils import maybe_queryset
+from graphql.error import GraphQLError
+from graphql.execution import ExecutionResult, MiddlewareManager
+from graphql.execution.base import (
+    ExecutionContext,
+    ResolveInfo,
+    collect_fields,
+    default_resolve_fn,
+    get_field_def,
+    get_operation_root_type,
+)
+from graphql.execution.executor import complete_value_catching_error
+from graphql.execution.executors.sync import SyncExecutor
+from graphql.pyutils.default_ordered_dict import DefaultOrderedDict
+from graphql.type import GraphQLNonNull
+from promise import Promise, is_thenable
+
+from .relay.connection import DjangoConnection
+from .utils import iterate_chunks
+
+
+def _get_single_field(fields, field_name, message):
+    fields = [asts for asts in fields.values() if asts[0].name.value == field_name]
+    if len(fields) != 1:
+        raise GraphQLError(message)
+    return fields[0]
+
+
+class QueryExport:
+    """
+    Exports every node of the connection field selected by a query, instead
+    of a page of them.
+
+    The field is resolved as usual, so its permissions, throttles, filters
+    and optimizations apply, but its page is never loaded. The nodes of its
+    queryset are then fetched in chunks of `chunk_size`, see iterate_chunks,
+    and the `edges { node { ... } }` selection is resolved for each chunk
+    with a new context from `get_context`, so that request caches don't
+    grow with the export. The `shared_context_keys` are carried over to
+    each new context, so permissions and throttles are checked once per
+    export rather than once per chunk.
+    """
+
+    shared_context_keys = ("permission_cache", "throttle_cache", "authorized_fields")
+
+    def __init__(
+        self,
+        schema,
+        document_ast,
+        get_context,
+        root_value=None,
+        variable_values=None,
+        operation_name=None,
+        executor=None,
+        middleware=None,
+        chunk_size=2000,
+    ):
+        if middleware is not None and not isinstance(middleware, MiddlewareManager):
+            middleware = MiddlewareManager(*middleware)
+
+        self.get_context = get_context
+        self.chunk_size = chunk_size
+        self.exe_context = ExecutionContext(
+            schema,
+            document_ast,
+            root_value,
+            get_context(),
+            variable_values or {},
+            operation_name,
+            executor or SyncExecutor(),
+            middleware,
+            False,
+        )
+
+    def _get_info(self, field_name, field_asts, return_type, parent_type, path):
+        exe_context = self.exe_context
+        return ResolveInfo(
+            field_name,
+            field_asts,
+            return_type,
+            parent_type,
+            schema=exe_context.schema,
+            fragments=exe_context.fragments,
+            root_value=exe_context.root_value,
+            operation=exe_context.operation,
+            variable_values=exe_context.variable_values,
+            context=exe_context.context_value,
+            path=path,
+        )
+
+    def resolve_connection(self):
+        """
+        Resolves the connection field, raising the errors it resolves with.
+        """
+        exe_context = self.exe_context
+        operation = exe_context.operation
+        if operation.operation != "query":
+            raise GraphQLError("Only queries can be exported.")
+
+        root_type = get_operation_root_type(exe_context.schema, operation)
+        fields = collect_fields(
+            exe_context, root_type, operation.selection_set, DefaultOrderedDict(list), set()
+        )
+        if len(fields) != 1:
+            raise GraphQLError("An export must select a single field.")
+        (response_name, field_asts), = fields.items()
+        field_name = field_asts[0].name.value
+
+        field_def = get_field_def(exe_context.schema, root_type, field_name)
+        connection_type = field_def.type
+        if isinstance(connection_type, GraphQLNonNull):
+            connection_type = connection_type.of_type
+        graphene_type = getattr(connection_type, "graphene_type", None)
+        if not (isinstance(graphene_type, type) and issubclass(graphene_type, DjangoConnection)):
+            raise GraphQLError("The field {} isn't a connection.".format(field_name))
+
+        message = "An export must select the edges of the connection and their node."
+        edges_asts = _get_single_field(
+            exe_context.get_sub_fields(connection_type, field_asts), "edges", message
+        )
+        edge_type = connection_type.fields["edges"].type
+        while not hasattr(edge_type, "fields"):
+            edge_type = edge_type.of_type
+        node_asts = _get_single_field(
+            exe_context.get_sub_fields(edge_type, edges_asts), "node", message
+        )
+        self.node_asts = node_asts
+        self.node_type = edge_type.fields["node"].type
+        self.edge_type = edge_type
+        self.path = [response_name, edges_asts[0].alias.value if edges_asts[0].alias else "edges"]
+
+        resolve_fn = exe_context.get_field_resolver(field_def.resolver or default_resolve_fn)
+        info = self._get_info(field_name, field_asts, field_def.type, root_type, [response_name])
+        args = exe_context.get_argument_values(field_def, field_asts[0])
+        connection = Promise.resolve(
+            resolve_fn(exe_context.root_value, info, **args)
+        ).get()
+        return maybe_queryset(connection.iterable)
+
+    def _execute_chunk(self, start, chunk):
+        exe_context = self.exe_context
+        previous_context = exe_context.context_value
+        exe_context.context_value = self.get_context()
+        if isinstance(previous_context, dict) and isinstance(exe_context.context_value, dict):
+            for key in self.shared_context_keys:
+                if key in previous_context:
+                    exe_context.context_value[key] = previous_context[key]
+        exe_context.errors = []
+
+        node_name = self.node_asts[0].alias.value if self.node_asts[0].alias else "node"
+        info = self._get_info("node", self.node_asts, self.node_type, self.edge_type, self.path)
+        nodes = [
+            complete_value_catching_error(
+                exe_context,
+                self.node_type,
+                self.node_asts,
+                info,
+                self.path + [index, node_name],
+                node,
+            )
+            for index, node in enumerate(chunk, start)
+        ]
+        if any(is_thenable(node) for node in nodes):
+            promise = Promise.all(nodes)
+            exe_context.executor.wait_until_finished()
+            nodes = promise.get()
+        return nodes, exe_context.errors
+
+    def execute(self):
+        """
+        Resolves the connection field, then returns a generator of the
+        ExecutionResults of its nodes.
+        """
+        iterable = self.resolve_connection()
+
+        def results():
+            start = 0
+            depth = len(self.path)
+            for chunk in iterate_chunks(iterable, self.chunk_size):
+                nodes, errors = self._execute_chunk(start, chunk)
+                for index, node in enumerate(nodes, start):
+                    node_errors = [
+                        error
+                        for error in errors
+                        if (getattr(error, "path", None) or [])[depth : depth + 1] == [index]
+                    ]
+                    yield ExecutionResult(data=node, errors=node_errors or None)
+                start += len(chunk)
+
+        return results()
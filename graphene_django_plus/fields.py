@@ -1,19 +1,84 @@
 from functools import partial
 
+from django.db.models.query import QuerySet
+
 import graphene
 from graphene import Field, List, NonNull, ConnectionField, Connection
 from graphene.types.utils import get_type
 from graphene_django import DjangoConnectionField
 from graphene_django.fields import DjangoListField
 from graphene_django.filter import DjangoFilterConnectionField
-
-from .permissions import check_permission_classes, check_throttle_classes
+from graphene_django.utils import maybe_queryset
+from promise import Promise
+
+from .loaders import load_relation, loader_resolver
+from .permissions import (
+    check_classes,
+    filter_queryset_permissions,
+    has_no_checks,
+)
+from .relay.connection import (
+    DjangoConnection,
+    connection_from_offset,
+    on_connection,
+    set_count_strategy,
+)
+from .relay.facets import get_facet_field_name, get_facets
+from .relay.keyset import keyset_connection_resolver
+
+
+def filters_querysets(permission_classes):
+    return any(hasattr(p, "filter_queryset") for p in permission_classes or ())
+
+
+def permission_queryset_resolver(queryset_resolver, permission_classes):
+    """
+    Wraps the queryset resolver of a connection field so that the
+    filter_queryset of its permission classes is applied in SQL, before the
+    connection is paginated and counted.
+    """
+    if not filters_querysets(permission_classes):
+        return queryset_resolver
+
+    def resolve_queryset(connection, iterable, info, args):
+        def filter_iterable(iterable):
+            iterable = maybe_queryset(iterable)
+            if isinstance(iterable, QuerySet):
+                iterable = filter_queryset_permissions(info, permission_classes, iterable)
+            return iterable
+
+        iterable = queryset_resolver(connection, iterable, info, args)
+        if Promise.is_thenable(iterable):
+            return Promise.resolve(iterable).then(filter_iterable)
+        return filter_iterable(iterable)
+
+    return resolve_queryset
+
+
+def permission_queryset_filter(queryset_filter, permission_classes):
+    """
+    Chains the filter_queryset of the permission classes of a list field to
+    its queryset_filter, so that they are applied wherever the related rows
+    are fetched: prefetched by the optimizer, batched by the loaders or
+    queried per parent.
+    """
+    if not filters_querysets(permission_classes):
+        return queryset_filter
+
+    def filter_queryset(queryset, info, **args):
+        if queryset_filter is not None:
+            queryset = queryset_filter(queryset, info, **args)
+        return filter_queryset_permissions(info, permission_classes, queryset)
+
+    return filter_queryset
 
 
 class PlusConnectionField(DjangoConnectionField):
     def __init__(self, *args, **kwargs):
         self.permission_classes = kwargs.pop("permission_classes", None)
         self.throttle_classes = kwargs.pop("throttle_classes", None)
+        self.keyset_pagination = kwargs.pop("keyset_pagination", False)
+        self.count_strategy = kwargs.pop("count_strategy", None)
 
         super().__init__(*args, **kwargs)
 
@@ -53,11 +118,14 @@ class PlusConnectionField(DjangoConnectionField):
         else:
             return self.model._default_manager
 
+    def get_queryset_resolver(self):
+        return permission_queryset_resolver(
+            super().get_queryset_resolver(), self.permission_classes
+        )
+
     @classmethod
     def resolve_connection(cls, connection, args, iterable, max_limit=None):
-        connection = super().resolve_connection(connection, args, iterable, max_limit)
-        connection.total_count = connection.length
-        return connection
+        return connection_from_offset(iterable, args, connection, max_limit)
 
     @classmethod
     def connection_resolver(
@@ -70,23 +138,32 @@ class PlusConnectionField(DjangoConnectionField):
         enforce_first_or_last,
         permission_classes,
         throttle_classes,
+        keyset_pagination,
+        count_strategy,
         root,
         info,
         **args
     ):
-        check_permission_classes(info, cls, permission_classes)
-        check_throttle_classes(info, cls, throttle_classes)
-
-        return super().connection_resolver(
-            resolver,
-            connection,
-            default_manager,
-            queryset_resolver,
-            max_limit,
-            enforce_first_or_last,
-            root,
-            info,
-            **args
+        check_classes(info, cls, permission_classes, throttle_classes)
+
+        if keyset_pagination:
+            connection_resolver = keyset_connection_resolver
+        else:
+            connection_resolver = super().connection_resolver
+
+        return set_count_strategy(
+            connection_resolver(
+                resolver,
+                connection,
+                default_manager,
+                queryset_resolver,
+                max_limit,
+                enforce_first_or_last,
+                root,
+                info,
+                **args
+            ),
+            count_strategy,
         )
 
     def get_resolver(self, parent_resolver):
@@ -100,6 +177,8 @@ class PlusConnectionField(DjangoConnectionField):
             self.enforce_first_or_last,
             self.permission_classes,
             self.throttle_classes,
+            self.keyset_pagination,
+            self.count_strategy,
         )
 
 
@@ -116,17 +195,59 @@ class PlusFilterConnectionField(DjangoFilterConnectionField):
     ):
         self.permission_classes = kwargs.pop("permission_classes", None)
         self.throttle_classes = kwargs.pop("throttle_classes", None)
+        self.keyset_pagination = kwargs.pop("keyset_pagination", False)
+        self.count_strategy = kwargs.pop("count_strategy", None)
+        self.facets = tuple(kwargs.pop("facets", ()))
 
         super().__init__(
             type, fields, order_by, extra_filter_meta, filterset_class, *args, **kwargs
         )
 
+    @property
+    def type(self):
+        _type = super().type
+        if not self.facets:
+            return _type
+
+        non_null = isinstance(_type, NonNull)
+        connection_type = _type.of_type if non_null else _type
+        assert issubclass(connection_type, DjangoConnection), (
+            "The connection of a field with facets must be a DjangoConnection, got {}"
+        ).format(connection_type.__name__)
+        connection_type = connection_type.get_faceted_connection()
+        return NonNull(connection_type) if non_null else connection_type
+
+    def get_facets_resolver(self):
+        if not self.facets:
+            return None
+
+        node_meta = self.node_type._meta
+        assert (
+            self._provided_filterset_class
+            or self._fields
+            or node_meta.filterset_class
+            or node_meta.filter_fields
+        ), "The facets of a field of {} need a filterset_class or filter_fields".format(
+            self.node_type.__name__
+        )
+
+        filterset_class = self.filterset_class
+        for name in self.facets:
+            assert name in filterset_class.base_filters, (
+                "The facet {} isn't a filter of {}"
+            ).format(name, filterset_class.__name__)
+            get_facet_field_name(filterset_class, name)
+
+        return partial(get_facets, filterset_class, self.filtering_args, self.facets)
+
+    def get_queryset_resolver(self):
+        return permission_queryset_resolver(
+            super().get_queryset_resolver(), self.permission_classes
+        )
+
     @classmethod
     def resolve_connection(cls, connection, args, iterable, max_limit=None):
-        connection = super().resolve_connection(connection, args, iterable, max_limit)
-
-        connection.total_count = connection.length
-        return connection
+        return connection_from_offset(iterable, args, connection, max_limit)
 
     @classmethod
     def connection_resolver(
@@ -139,24 +260,58 @@ class PlusFilterConnectionField(DjangoFilterConnectionField):
         enforce_first_or_last,
         permission_classes,
         throttle_classes,
+        keyset_pagination,
+        count_strategy,
+        facets_resolver,
         root,
         info,
         **args
     ):
-        check_permission_classes(info, cls, permission_classes)
-        check_throttle_classes(info, cls, throttle_classes)
-
-        return super().connection_resolver(
-            resolver,
-            connection,
-            default_manager,
-            queryset_resolver,
-            max_limit,
-            enforce_first_or_last,
-            root,
-            info,
-            **args
+        check_classes(info, cls, permission_classes, throttle_classes)
+
+        if keyset_pagination:
+            connection_resolver = keyset_connection_resolver
+        else:
+            connection_resolver = super().connection_resolver
+
+        if facets_resolver is not None:
+            unfiltered = {}
+            filter_queryset_resolver = queryset_resolver
+
+            def queryset_resolver(connection, iterable, info, args):
+                unfiltered["iterable"] = iterable
+                return filter_queryset_resolver(connection, iterable, info, args)
+
+        ret = set_count_strategy(
+            connection_resolver(
+                resolver,
+                connection,
+                default_manager,
+                queryset_resolver,
+                max_limit,
+                enforce_first_or_last,
+                root,
+                info,
+                **args
+            ),
+            count_strategy,
         )
+        if facets_resolver is None:
+            return ret
+
+        def load_facets():
+            # The facets are counted over the queryset before filtering, each
+            # of them applies the filters but its own.
+            queryset = super(DjangoFilterConnectionField, cls).resolve_queryset(
+                connection, unfiltered["iterable"], info, args
+            )
+            queryset = filter_queryset_permissions(info, permission_classes or (), queryset)
+            return facets_resolver(queryset, args, info.context)
+
+        def set_facets_loader(resolved):
+            resolved.facets_loader = load_facets
+
+        return on_connection(ret, set_facets_loader)
 
     def get_resolver(self, parent_resolver):
         return partial(
@@ -169,6 +324,9 @@ class PlusFilterConnectionField(DjangoFilterConnectionField):
             self.enforce_first_or_last,
             self.permission_classes,
             self.throttle_classes,
+            self.keyset_pagination,
+            self.count_strategy,
+            self.get_facets_resolver(),
         )
 
 
@@ -189,12 +347,14 @@ class PlusField(graphene.Field):
         *args,
         **kwargs
     ):
-        check_permission_classes(info, cls, permission_classes)
-        check_throttle_classes(info, cls, throttle_classes)
+        check_classes(info, cls, permission_classes, throttle_classes)
 
         return resolver(root, info, *args, **kwargs)
 
     def get_resolver(self, parent_resolver):
+        if has_no_checks(self.permission_classes, self.throttle_classes):
+            return self.resolver or parent_resolver
+
         return partial(
             self.field_resolver,
             self.resolver or parent_resolver,
@@ -207,9 +367,20 @@ class DjangoPlusListField(DjangoListField):
     def __init__(self, _type, *args, **kwargs):
         self.permission_classes = kwargs.pop("permission_classes", None)
         self.throttle_classes = kwargs.pop("throttle_classes", None)
+        self.queryset_filter = kwargs.pop("queryset_filter", None)
 
         super(DjangoListField, self).__init__(List(NonNull(_type)), *args, **kwargs)
 
+    @staticmethod
+    def get_prefetch_to_attr(field_ast):
+        """
+        Name of the attribute the query optimizer prefetches this field into.
+        Keyed on the response key so aliased selections with different
+        arguments don't overwrite each other.
+        """
+        response_key = field_ast.alias.value if field_ast.alias else field_ast.name.value
+        return "_prefetched_{}".format(response_key)
+
     @classmethod
     def list_resolver(
         cls,
@@ -220,12 +391,35 @@ class DjangoPlusListField(DjangoListField):
         info,
         permission_classes=None,
         throttle_classes=None,
+        queryset_filter=None,
+        no_checks=False,
         **args
     ):
-        check_permission_classes(info, cls, permission_classes)
-        check_throttle_classes(info, cls, throttle_classes)
+        # The resolver carries the prefetch, loader and queryset_filter
+        # handling, so it is kept and only the checks are skipped.
+        if not no_checks:
+            check_classes(info, cls, permission_classes, throttle_classes)
+
+        # The optimizer has already applied get_queryset and queryset_filter
+        # to the prefetched rows.
+        to_attr = cls.get_prefetch_to_attr(info.field_asts[0])
+        if root is not None and hasattr(root, to_attr):
+            return getattr(root, to_attr)
+
+        # Parent types with `use_loaders` batch the relation per request.
+        if isinstance(resolver, partial) and resolver.func is loader_resolver:
+            loaded = load_relation(
+                info, root, resolver.args[0], django_object_type, queryset_filter, **args
+            )
+            if loaded is not None:
+                return loaded
 
-        return super().list_resolver(django_object_type, resolver, default_queryset, root, info, **args)
+        queryset = super().list_resolver(django_object_type, resolver, default_queryset, root, info, **args)
+
+        if queryset_filter is not None and isinstance(queryset, QuerySet):
+            queryset = queryset_filter(queryset, info, **args)
+
+        return queryset
 
     def get_resolver(self, parent_resolver):
         _type = self.type
@@ -240,6 +434,10 @@ class DjangoPlusListField(DjangoListField):
             self.get_default_queryset(),
             permission_classes=self.permission_classes,
             throttle_classes=self.throttle_classes,
+            queryset_filter=permission_queryset_filter(
+                self.queryset_filter, self.permission_classes
+            ),
+            no_checks=has_no_checks(self.permission_classes, self.throttle_classes),
         )
 
 
@@ -264,12 +462,14 @@ class PlusListField(Field):
         *args,
         **kwargs
     ):
-        check_permission_classes(info, cls, permission_classes)
-        check_throttle_classes(info, cls, throttle_classes)
+        check_classes(info, cls, permission_classes, throttle_classes)
 
         return resolver(root, info, *args, **kwargs)
 
     def get_resolver(self, parent_resolver):
+        if has_no_checks(self.permission_classes, self.throttle_classes):
+            return self.resolver or parent_resolver
+
         return partial(
             self.list_resolver,
             self.resolver or parent_resolver,
@@ -0,0 +1,43 @@
+class IdentityMap:
+    """
+    Request scoped map of the model instances loaded while executing an
+    operation, created by GraphQLAPIView.get_graphene_context. Looking up a
+    row that has already been loaded returns the same instance without a
+    query.
+
+    Instances are mapped per graphene type, as types sharing a model can
+    load different rows, or annotate them, with their get_queryset.
+    """
+
+    def __init__(self):
+        self._instances = {}
+
+    @staticmethod
+    def get_key(graphene_type, field_name, value):
+        return graphene_type, field_name, str(value)
+
+    def get(self, graphene_type, value, field_name="pk"):
+        key = self.get_key(graphene_type, field_name, value)
+        instance = self._instances.get(key)
+
+        # Deleted instances have their pk cleared.
+        if instance is not None and instance.pk is None:
+            del self._instances[key]
+            return None
+
+        return instance
+
+    def add(self, graphene_type, instance, *field_names):
+        for field_name in {"pk"}.union(field_names):
+            key = self.get_key(graphene_type, field_name, getattr(instance, field_name))
+            self._instances[key] = instance
+
+
+def get_identity_map(info):
+    context = getattr(info, "context", None)
+    if not isinstance(context, dict):
+        return IdentityMap()
+
+    if context.get("identity_map") is None:
+        context["identity_map"] = IdentityMap()
+    return context["identity_map"]
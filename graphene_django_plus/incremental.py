@@ -0,0 +1,471 @@
+import copy
+from collections import deque
+from functools import partial
+
+from django.db.models.query import QuerySet
+from graphene_django.utils import maybe_queryset
+from graphql.error import format_error as format_graphql_error
+from graphql.execution import ExecutionResult, MiddlewareManager
+from graphql.execution.base import ExecutionContext, collect_fields
+from graphql.execution.executor import (
+    complete_value_catching_error,
+    execute_fields,
+    execute_operation,
+)
+from graphql.execution.executors.sync import SyncExecutor
+from graphql.execution.values import get_argument_values
+from graphql.language import ast
+from graphql.pyutils.default_ordered_dict import DefaultOrderedDict
+from graphql.type import (
+    GraphQLArgument,
+    GraphQLBoolean,
+    GraphQLInt,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLString,
+)
+from graphql.type.directives import (
+    DirectiveLocation,
+    GraphQLDirective,
+    GraphQLIncludeDirective,
+    GraphQLSkipDirective,
+)
+from promise import Promise, is_thenable
+
+from .utils import iterate_chunks
+
+GraphQLDeferDirective = GraphQLDirective(
+    name="defer",
+    description="Directs the executor to deliver this fragment after the rest of the response.",
+    args={
+        "if": GraphQLArgument(
+            type_=GraphQLBoolean, default_value=True, description="Deferred when true."
+        ),
+        "label": GraphQLArgument(
+            type_=GraphQLString, description="Identifies the payloads of the fragment."
+        ),
+    },
+    locations=[DirectiveLocation.FRAGMENT_SPREAD, DirectiveLocation.INLINE_FRAGMENT],
+)
+
+GraphQLStreamDirective = GraphQLDirective(
+    name="stream",
+    description=(
+        "Directs the executor to deliver the items of this list field after "
+        "the first `initialCount` ones, in several payloads."
+    ),
+    args={
+        "if": GraphQLArgument(
+            type_=GraphQLBoolean, default_value=True, description="Streamed when true."
+        ),
+        "label": GraphQLArgument(
+            type_=GraphQLString, description="Identifies the payloads of the field."
+        ),
+        "initialCount": GraphQLArgument(
+            type_=GraphQLInt,
+            default_value=0,
+            description="Number of items in the initial payload.",
+        ),
+    },
+    locations=[DirectiveLocation.FIELD],
+)
+
+# The directives of a graphene Schema supporting incremental delivery.
+incremental_directives = [
+    GraphQLIncludeDirective,
+    GraphQLSkipDirective,
+    GraphQLDeferDirective,
+    GraphQLStreamDirective,
+]
+
+MARKER_PREFIX = "_gdp_defer_"
+
+
+def _get_directive(node, directive_def, variable_values):
+    """
+    Returns the arguments of the `directive_def` on `node` when it applies.
+    """
+    for directive in node.directives or []:
+        if directive.name.value != directive_def.name:
+            continue
+        args = get_argument_values(directive_def.args, directive.arguments, variable_values)
+        return args if args.get("if", True) else None
+    return None
+
+
+def has_incremental_directives(document_ast):
+    """
+    Whether any selection of the document uses @defer or @stream.
+    """
+    names = {GraphQLDeferDirective.name, GraphQLStreamDirective.name}
+    stack = [
+        definition.selection_set
+        for definition in document_ast.definitions
+        if getattr(definition, "selection_set", None) is not None
+    ]
+    while stack:
+        for selection in stack.pop().selections:
+            if any(d.name.value in names for d in selection.directives or []):
+                return True
+            if getattr(selection, "selection_set", None) is not None:
+                stack.append(selection.selection_set)
+    return False
+
+
+class DeferredFragment:
+    def __init__(self, label, selection_set):
+        self.label = label
+        self.selection_set = selection_set
+
+
+def defer_fragments(document_ast, variable_values=None):
+    """
+    Returns a copy of the document where the fragments with @defer are
+    skipped, and the deferred fragments by the alias of their markers.
+
+    A marker is a `__typename` field with the fragment's type condition put
+    in place of it, so its resolution tells where the fragment applies. The
+    skipped fragment is kept in the document so the optimizer still plans
+    the queries it needs.
+    """
+    document_ast = copy.deepcopy(document_ast)
+    fragments = {
+        definition.name.value: definition
+        for definition in document_ast.definitions
+        if isinstance(definition, ast.FragmentDefinition)
+    }
+    deferred = {}
+    skip = ast.Directive(
+        name=ast.Name(GraphQLSkipDirective.name),
+        arguments=[ast.Argument(name=ast.Name("if"), value=ast.BooleanValue(True))],
+    )
+
+    def transform(selection_set):
+        selections = []
+        for selection in selection_set.selections:
+            if getattr(selection, "selection_set", None) is not None:
+                transform(selection.selection_set)
+            if isinstance(selection, ast.Field):
+                selections.append(selection)
+                continue
+
+            args = _get_directive(selection, GraphQLDeferDirective, variable_values)
+            if args is None:
+                selections.append(selection)
+                continue
+
+            if isinstance(selection, ast.FragmentSpread):
+                fragment = fragments[selection.name.value]
+                type_condition = fragment.type_condition
+                deferred_selection_set = fragment.selection_set
+            else:
+                type_condition = selection.type_condition
+                deferred_selection_set = selection.selection_set
+
+            alias = "{}{}".format(MARKER_PREFIX, len(deferred))
+            deferred[alias] = DeferredFragment(args.get("label"), deferred_selection_set)
+
+            directives = [
+                d for d in selection.directives if d.name.value != GraphQLDeferDirective.name
+            ]
+            selection.directives = directives + [skip]
+            marker = ast.Field(
+                name=ast.Name("__typename"), alias=ast.Name(alias), directives=directives
+            )
+            if type_condition is not None:
+                marker = ast.InlineFragment(
+                    type_condition=type_condition,
+                    selection_set=ast.SelectionSet(selections=[marker]),
+                )
+            selections.extend([selection, marker])
+        selection_set.selections = selections
+
+    # Fragment definitions are transformed first, as the deferred spreads
+    # reference their (transformed) selection sets.
+    definitions = sorted(
+        document_ast.definitions,
+        key=lambda definition: not isinstance(definition, ast.FragmentDefinition),
+    )
+    for definition in definitions:
+        if getattr(definition, "selection_set", None) is not None:
+            transform(definition.selection_set)
+    return document_ast, deferred
+
+
+def _strip_markers(data):
+    if isinstance(data, dict):
+        for key in [key for key in data if key.startswith(MARKER_PREFIX)]:
+            del data[key]
+        for value in data.values():
+            _strip_markers(value)
+    elif isinstance(data, list):
+        for value in data:
+            _strip_markers(value)
+    return data
+
+
+def _result_contains(result, path):
+    """
+    Whether the error `path` is within the data of an incremental `result`,
+    the items of a streamed result starting at the last index of its path.
+    """
+    result_path = result["path"]
+    if "items" not in result:
+        return path[: len(result_path)] == result_path
+
+    prefix, start = result_path[:-1], result_path[-1]
+    if len(path) <= len(prefix) or path[: len(prefix)] != prefix:
+        return False
+    index = path[len(prefix)]
+    return isinstance(index, int) and start <= index < start + len(result["items"] or ())
+
+
+class IncrementalMiddleware:
+    """
+    Records the deferred fragments and streamed fields of an
+    IncrementalExecution while the payloads are executed.
+    """
+
+    def __init__(self, execution):
+        self.execution = execution
+
+    def resolve(self, next, root, info, **args):
+        alias = info.field_asts[0].alias
+        if alias is not None and alias.value in self.execution.deferred:
+            self.execution.defer(self.execution.deferred[alias.value], root, info)
+
+        result = next(root, info, **args)
+
+        stream = _get_directive(info.field_asts[0], GraphQLStreamDirective, info.variable_values)
+        return_type = info.return_type
+        if isinstance(return_type, GraphQLNonNull):
+            return_type = return_type.of_type
+        if stream is None or not isinstance(return_type, GraphQLList):
+            return result
+
+        return Promise.resolve(result).then(
+            partial(
+                self.execution.stream,
+                info,
+                return_type.of_type,
+                stream.get("initialCount") or 0,
+                stream.get("label"),
+            )
+        )
+
+
+class StreamedField:
+    def __init__(self, info, item_type, label, rest, start, chunk_size):
+        self.info = info
+        self.item_type = item_type
+        self.label = label
+        self.start = start
+        self.chunk_size = chunk_size
+        self.exhausted = False
+        self._chunks = iterate_chunks(rest, self.chunk_size)
+
+    def next_chunk(self):
+        chunk = next(self._chunks, [])
+        self.exhausted = len(chunk) < self.chunk_size
+        start = self.start
+        self.start += len(chunk)
+        return start, chunk
+
+
+class IncrementalExecution:
+    """
+    Executes a query using @defer and @stream as an initial payload followed
+    by a payload per deferred fragment and per chunk of `chunk_size` items of
+    each streamed field, in the incremental delivery format.
+
+    Deferred fragments are resolved against the objects they were reached
+    with in a previous payload, nothing is resolved twice. The items of
+    streamed querysets are fetched in chunks, see iterate_chunks.
+    """
+
+    def __init__(
+        self,
+        schema,
+        document_ast,
+        root_value=None,
+        context_value=None,
+        variable_values=None,
+        operation_name=None,
+        executor=None,
+        middleware=None,
+        chunk_size=100,
+        format_error=format_graphql_error,
+    ):
+        variable_values = variable_values or {}
+        document_ast, self.deferred = defer_fragments(document_ast, variable_values)
+        self.chunk_size = chunk_size
+        self.format_error = format_error
+        self.records = deque()
+
+        # A manager keeps its wrap_in_promise, the middleware are appended to.
+        wrap_in_promise = True
+        if isinstance(middleware, MiddlewareManager):
+            wrap_in_promise = middleware.wrap_in_promise
+            middleware = middleware.middlewares
+        middleware = MiddlewareManager(
+            *(middleware or ()), IncrementalMiddleware(self), wrap_in_promise=wrap_in_promise
+        )
+
+        self.exe_context = ExecutionContext(
+            schema,
+            document_ast,
+            root_value,
+            context_value,
+            variable_values,
+            operation_name,
+            executor or SyncExecutor(),
+            middleware,
+            False,
+        )
+
+    def defer(self, fragment, source, info):
+        self.records.append((fragment, source, info.parent_type, info.path[:-1]))
+
+    def stream(self, info, item_type, initial_count, label, result):
+        result = maybe_queryset(result)
+        if isinstance(result, QuerySet) and result._result_cache is None:
+            initial = list(result[:initial_count])
+            rest = result[initial_count:] if len(initial) == initial_count else []
+        else:
+            result = list(result)
+            initial, rest = result[:initial_count], result[initial_count:]
+
+        if isinstance(rest, QuerySet) or rest:
+            self.records.append(
+                StreamedField(info, item_type, label, rest, len(initial), self.chunk_size)
+            )
+        return initial
+
+    def _wait(self, execute):
+        exe_context = self.exe_context
+        exe_context.errors = []
+        promise = Promise.resolve(None).then(lambda v: execute()).catch(self._on_rejected)
+        exe_context.executor.wait_until_finished()
+        return _strip_markers(promise.get()), exe_context.errors
+
+    def _on_rejected(self, error):
+        self.exe_context.errors.append(error)
+        return None
+
+    def execute_initial(self):
+        exe_context = self.exe_context
+        data, errors = self._wait(
+            lambda: execute_operation(exe_context, exe_context.operation, exe_context.root_value)
+        )
+        return ExecutionResult(data=data, errors=errors or None)
+
+    @property
+    def has_next(self):
+        return bool(self.records)
+
+    def _execute_fragments(self, records):
+        """
+        Executes the deferred fragments together, so the data loaders their
+        fields use are batched across them.
+        """
+        exe_context = self.exe_context
+
+        def execute_fragment(record):
+            fragment, source, parent_type, path = record
+            fields = collect_fields(
+                exe_context, parent_type, fragment.selection_set, DefaultOrderedDict(list), set()
+            )
+            return execute_fields(exe_context, parent_type, source, fields, path, None)
+
+        def execute():
+            return Promise.all(
+                [
+                    Promise.resolve(record).then(execute_fragment).catch(self._on_rejected)
+                    for record in records
+                ]
+            )
+
+        data, errors = self._wait(execute)
+        return [
+            ({"data": data, "path": record[3]}, record[0].label)
+            for record, data in zip(records, data)
+        ], errors
+
+    def _execute_items(self, streamed, start, chunk):
+        exe_context = self.exe_context
+        info = streamed.info
+
+        def execute():
+            items = [
+                complete_value_catching_error(
+                    exe_context,
+                    streamed.item_type,
+                    info.field_asts,
+                    info,
+                    info.path + [index],
+                    item,
+                )
+                for index, item in enumerate(chunk, start)
+            ]
+            if any(is_thenable(item) for item in items):
+                return Promise.all(items)
+            return items
+
+        items, errors = self._wait(execute)
+        return [({"items": items, "path": info.path + [start]}, streamed.label)], errors
+
+    def execute_subsequent(self):
+        """
+        Yields the payloads following the initial one, the last one has
+        `hasNext` false.
+        """
+        has_next = self.has_next
+        while self.records:
+            record = self.records.popleft()
+            if isinstance(record, StreamedField):
+                start, chunk = record.next_chunk()
+                if not record.exhausted:
+                    self.records.appendleft(record)
+                if not chunk:
+                    continue
+                results, errors = self._execute_items(record, start, chunk)
+            else:
+                records = [record]
+                streamed = deque()
+                for record in self.records:
+                    (streamed if isinstance(record, StreamedField) else records).append(record)
+                self.records = streamed
+                results, errors = self._execute_fragments(records)
+
+            # Errors are reported with the result they happened in, the one
+            # with the longest path containing theirs, or with the payload.
+            result_errors = [[] for _ in results]
+            payload_errors = []
+            for error in errors:
+                path = getattr(error, "path", None) or []
+                matches = [
+                    (len(result["path"]), idx)
+                    for idx, (result, label) in enumerate(results)
+                    if path and _result_contains(result, path)
+                ]
+                if matches:
+                    result_errors[max(matches)[1]].append(error)
+                else:
+                    payload_errors.append(error)
+
+            incremental = []
+            for (result, label), errors in zip(results, result_errors):
+                if label is not None:
+                    result["label"] = label
+                if errors:
+                    result["errors"] = [self.format_error(e) for e in errors]
+                incremental.append(result)
+
+            has_next = self.has_next
+            payload = {"incremental": incremental, "hasNext": has_next}
+            if payload_errors:
+                payload["errors"] = [self.format_error(e) for e in payload_errors]
+            yield payload
+
+        if has_next:
+            yield {"hasNext": False}
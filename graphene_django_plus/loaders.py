@@ -0,0 +1,220 @@
+from collections import defaultdict
+from functools import partial
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models import F
+from graphene import Connection
+from graphene.types.resolver import get_default_resolver
+from promise import Promise
+from promise.dataloader import DataLoader
+
+
+class NodeLoader(DataLoader):
+    """
+    Loads nodes of one DjangoObjectType by its id_field. Every id requested
+    while the operation is resolving is fetched with a single query.
+    """
+
+    def __init__(self, graphene_type, info, *args, **kwargs):
+        self.graphene_type = graphene_type
+        self.info = info
+        super().__init__(*args, **kwargs)
+
+    def batch_load_fn(self, ids):
+        return Promise.resolve(self.graphene_type.get_nodes(self.info, ids))
+
+
+class ModelLoader(DataLoader):
+    """
+    Loads instances from a queryset by the value of one of their fields.
+    """
+
+    def __init__(self, queryset, field_name, *args, **kwargs):
+        self.queryset = queryset
+        self.field_name = field_name
+        super().__init__(*args, **kwargs)
+
+    def batch_load_fn(self, keys):
+        instances = {
+            str(getattr(instance, self.field_name)): instance
+            for instance in self.queryset.filter(
+                **{"{}__in".format(self.field_name): keys}
+            )
+        }
+        return Promise.resolve([instances.get(str(key)) for key in keys])
+
+
+class ChildrenLoader(DataLoader):
+    """
+    Loads the rows pointing to a parent through a foreign key, keyed by the
+    value the foreign key references on the parent.
+    """
+
+    def __init__(self, queryset, foreign_key, *args, **kwargs):
+        self.queryset = queryset
+        self.foreign_key = foreign_key
+        super().__init__(*args, **kwargs)
+
+    def batch_load_fn(self, keys):
+        attname = self.foreign_key.attname
+        children = defaultdict(list)
+        for child in self.queryset.filter(**{"{}__in".format(attname): keys}):
+            children[str(getattr(child, attname))].append(child)
+        return Promise.resolve([children[str(key)] for key in keys])
+
+
+class ManyToManyLoader(DataLoader):
+    """
+    Loads the targets of a many to many relation, keyed by the source's
+    primary key. `query_name` is the lookup from the target model back to
+    the source model.
+    """
+
+    source_attname = "_loader_source_id"
+
+    def __init__(self, queryset, query_name, *args, **kwargs):
+        self.queryset = queryset
+        self.query_name = query_name
+        super().__init__(*args, **kwargs)
+
+    def batch_load_fn(self, keys):
+        targets = defaultdict(list)
+        queryset = self.queryset.filter(
+            **{"{}__in".format(self.query_name): keys}
+        ).annotate(**{self.source_attname: F(self.query_name)})
+        for target in queryset:
+            targets[str(getattr(target, self.source_attname))].append(target)
+        return Promise.resolve([targets[str(key)] for key in keys])
+
+
+class LoaderRegistry:
+    """
+    Request scoped loaders, created by GraphQLAPIView.get_graphene_context.
+    Loaders are shared by every resolver of the operation that asks for the
+    same key, which is what lets them batch.
+    """
+
+    def __init__(self):
+        self._loaders = {}
+
+    def get_loader(self, key, loader_factory):
+        if key not in self._loaders:
+            self._loaders[key] = loader_factory()
+        return self._loaders[key]
+
+
+def get_loader_registry(info):
+    context = getattr(info, "context", None)
+    if not isinstance(context, dict):
+        return LoaderRegistry()
+
+    if context.get("loaders") is None:
+        context["loaders"] = LoaderRegistry()
+    return context["loaders"]
+
+
+def get_node_loader(info, graphene_type):
+    return get_loader_registry(info).get_loader(
+        ("node", graphene_type), lambda: NodeLoader(graphene_type, info)
+    )
+
+
+def get_relation_field(model, attname):
+    """
+    Returns the relation of `model` that is reachable through the attribute
+    `attname`, or None.
+    """
+    try:
+        field = model._meta.get_field(attname)
+    except FieldDoesNotExist:
+        field = None
+        for related_object in model._meta.related_objects:
+            if related_object.get_accessor_name() == attname:
+                field = related_object
+                break
+
+    if field is None or not field.is_relation:
+        return None
+    # get_field also finds foreign keys by their attname ("publisher_id").
+    if field.concrete and field.name != attname:
+        return None
+    return field
+
+
+def _get_related_queryset(info, model_field, graphene_type, queryset_filter, args):
+    queryset = model_field.related_model._default_manager.all()
+
+    if graphene_type is not None and getattr(graphene_type._meta, "model", None) == model_field.related_model:
+        queryset = graphene_type.get_queryset(queryset, info)
+    if queryset_filter is not None:
+        queryset = queryset_filter(queryset, info, **args)
+    return queryset
+
+
+def load_relation(info, root, attname, graphene_type=None, queryset_filter=None, **args):
+    """
+    Loads the relation `attname` of the model instance `root` through the
+    request's loaders. Returns None when the relation isn't loadable this way
+    or has already been cached or prefetched on the instance.
+    """
+    if not isinstance(root, models.Model):
+        return None
+
+    model_field = get_relation_field(type(root), attname)
+    if model_field is None:
+        return None
+
+    if model_field.concrete and (model_field.many_to_one or model_field.one_to_one):
+        if model_field.is_cached(root):
+            return None
+        key = getattr(root, model_field.attname)
+        if key is None:
+            return Promise.resolve(None)
+        loader_class = partial(ModelLoader, field_name=model_field.target_field.attname)
+    elif model_field.one_to_many or model_field.many_to_many:
+        if getattr(root, attname).get_queryset()._result_cache is not None:
+            return None
+        if model_field.one_to_many:
+            key = getattr(root, model_field.field.target_field.attname)
+            loader_class = partial(ChildrenLoader, foreign_key=model_field.field)
+        elif model_field.concrete:
+            key = root.pk
+            loader_class = partial(ManyToManyLoader, query_name=model_field.related_query_name())
+        else:
+            key = root.pk
+            loader_class = partial(ManyToManyLoader, query_name=model_field.field.name)
+    else:
+        return None
+
+    loader = get_loader_registry(info).get_loader(
+        ("relation", model_field, graphene_type, queryset_filter, repr(sorted(args.items()))),
+        lambda: loader_class(
+            _get_related_queryset(info, model_field, graphene_type, queryset_filter, args)
+        ),
+    )
+    return loader.load(key)
+
+
+def loader_resolver(attname, default_value, root, info, **args):
+    """
+    Default resolver for DjangoObjectTypes with `use_loaders = True`. Model
+    relations are loaded through the request's loaders, everything else is
+    resolved with graphene's default resolver.
+
+    Relations returned as connections are resolved to their manager, as the
+    connection fields filter and paginate it as a queryset.
+    """
+    graphene_type = info.return_type
+    while hasattr(graphene_type, "of_type"):
+        graphene_type = graphene_type.of_type
+    graphene_type = getattr(graphene_type, "graphene_type", None)
+
+    if isinstance(graphene_type, type) and issubclass(graphene_type, Connection):
+        return get_default_resolver()(attname, default_value, root, info, **args)
+
+    loaded = load_relation(info, root, attname, graphene_type, **args)
+    if loaded is not None:
+        return loaded
+
+    return get_default_resolver()(attname, default_value, root, info, **args)
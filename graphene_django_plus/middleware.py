@@ -1,46 +1,56 @@
-# import functools
-#
-# from graphql.execution.middleware import make_it_promise
-#
-# from .fields import PlusFilterConnectionField, PlusField
-# from .permissions import check_permission_classes, check_throttle_classes
-# from .relay.node import PlusNode
-#
-#
-# class TestMiddleware(object):
-#     def resolve(self, next, root, info, **args):
-#         if root is not None:
-#             return next(root, info, **args)
-#
-#         resolver_fn = None
-#         if isinstance(next, functools.partial):
-#             resolver_fn = next
-#             if resolver_fn.func == make_it_promise:
-#                 resolver_fn = resolver_fn.args[0]
-#         #     if resolver_fn.func == DjangoListField.list_resolver:
-#         #         resolver_fn = resolver_fn.args[0]
-#         #     if resolver_fn.func == default_resolver:
-#         #         resolver_fn = resolver_fn.args[0]
-#
-#         # PlusNode
-#         if hasattr(resolver_fn, "func") and (
-#             resolver_fn.func == PlusNode.node_resolver
-#             or resolver_fn.func == PlusFilterConnectionField.connection_resolver
-#             or resolver_fn.func == PlusField.field_resolver
-#         ):
-#             return next(root, info, **args)
-#
-#         # Permission classes
-#         if hasattr(resolver_fn, "permission_classes"):
-#             permission_classes = resolver_fn.permission_classes
-#         else:
-#             permission_classes = info.context.get("view").resolver_permission_classes
-#
-#         check_permission_classes(info, None, permission_classes)
-#
-#         # Throttle classes
-#         if hasattr(resolver_fn, "throttle_classes"):
-#             throttle_classes = resolver_fn.throttle_classes
-#             check_throttle_classes(info, None, throttle_classes)
-#
-#         return next(root, info, **args)
+from weakref import WeakKeyDictionary
+
+from .authorization import get_field_checks
+from .permissions import check_permission_classes
+
+_root_fields = WeakKeyDictionary()
+
+
+def get_checked_root_fields(schema):
+    """
+    Names of the root fields of `schema` per root type name that don't check
+    permission classes themselves, as the Plus fields do, built once per
+    schema.
+    """
+    if schema not in _root_fields:
+        field_checks = get_field_checks(schema)
+        root_fields = {}
+        for root_type in (
+            schema.get_query_type(),
+            schema.get_mutation_type(),
+            schema.get_subscription_type(),
+        ):
+            if root_type is None:
+                continue
+            root_fields[root_type.name] = frozenset(
+                name
+                for name in root_type.fields
+                if (root_type.name, name) not in field_checks and not name.startswith("__")
+            )
+        _root_fields[schema] = root_fields
+    return _root_fields[schema]
+
+
+class RootFieldPermissionMiddleware:
+    """
+    Checks the view's `resolver_permission_classes` before resolving the
+    root fields with plain resolvers, which don't check them like the Plus
+    fields do.
+
+    Nested fields only cost a `root is not None` check, and root fields a
+    lookup in the names returned by get_checked_root_fields. Most of the
+    overhead of a middleware comes from graphql-core wrapping every resolver
+    in a promise, set `graphene_middleware` to
+    `MiddlewareManager(RootFieldPermissionMiddleware(), wrap_in_promise=False)`
+    to avoid it, see tests/bench_middleware.py.
+    """
+
+    def resolve(self, next, root, info, **args):
+        if root is not None:
+            return next(root, info, **args)
+
+        root_fields = get_checked_root_fields(info.schema).get(info.parent_type.name, ())
+        if info.field_name in root_fields:
+            check_permission_classes(info, type(self), None)
+
+        return next(root, info, **args)
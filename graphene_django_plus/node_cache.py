@@ -0,0 +1,179 @@
+import time
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import router
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from .signals import bulk_changed
+
+
+class NodeCache:
+    """
+    Read-through cache for DjangoObjectType.get_node, shared between requests.
+    Enabled per type with `node_cache = True` or a NodeCache instance on its
+    Meta.
+
+    Rows are stored as the values of their loaded concrete fields, so
+    annotations added by get_queryset are not cached. Only enable it on types
+    whose get_queryset doesn't depend on the request, as cached nodes are
+    returned without calling it.
+
+    Every post_save, post_delete, m2m_changed and bulk_changed of the model
+    bumps a version number that is stored along with the entries,
+    invalidating all of them.
+    """
+
+    def __init__(
+        self,
+        cache_alias=DEFAULT_CACHE_ALIAS,
+        timeout=DEFAULT_TIMEOUT,
+        lock_timeout=5,
+        lock_wait=0.05,
+    ):
+        self.cache_alias = cache_alias
+        self.timeout = timeout
+        self.lock_timeout = lock_timeout
+        self.lock_wait = lock_wait
+        self.model = None
+        self.id_field = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def bind(self, model, id_field):
+        assert self.model is None, "A NodeCache can only be used by one type."
+
+        self.model = model._meta.concrete_model
+        self.id_field = id_field
+
+        dispatch_uid = "graphene_django_plus.node_cache.{}".format(id(self))
+        post_save.connect(self._invalidate, sender=self.model, weak=False, dispatch_uid=dispatch_uid)
+        post_delete.connect(self._invalidate, sender=self.model, weak=False, dispatch_uid=dispatch_uid)
+        bulk_changed.connect(self._invalidate, sender=self.model, weak=False, dispatch_uid=dispatch_uid)
+        m2m_changed.connect(self._invalidate_m2m, weak=False, dispatch_uid=dispatch_uid)
+
+    def get_prefix(self):
+        return "gdp:node:{}:{}".format(self.model._meta.label_lower, self.id_field)
+
+    def get_version_key(self):
+        return "{}:version".format(self.get_prefix())
+
+    def get_key(self, id):
+        return "{}:{}".format(self.get_prefix(), id)
+
+    def _init_version(self):
+        # A fresh version when the key is missing (or was evicted), so
+        # entries written with an older one are never read again.
+        self.cache.add(self.get_version_key(), time.time_ns(), None)
+        return self.cache.get(self.get_version_key())
+
+    def invalidate(self):
+        try:
+            self.cache.incr(self.get_version_key())
+        except ValueError:
+            self._init_version()
+
+    def _invalidate(self, sender, **kwargs):
+        self.invalidate()
+
+    def _invalidate_m2m(self, sender, instance, action, model, **kwargs):
+        if not action.startswith("post_"):
+            return
+        if isinstance(instance, self.model) or issubclass(model, self.model):
+            self.invalidate()
+
+    def serialize(self, instance):
+        deferred = instance.get_deferred_fields()
+        fields = [f.attname for f in self.model._meta.concrete_fields if f.attname not in deferred]
+        values = tuple(getattr(instance, attname) for attname in fields)
+        # The field names are only needed when some of them were deferred.
+        return (tuple(fields) if deferred else None), values
+
+    def deserialize(self, data):
+        fields, values = data
+        if fields is None:
+            fields = [f.attname for f in self.model._meta.concrete_fields]
+        return self.model.from_db(router.db_for_read(self.model), fields, values)
+
+    def _get_version(self, cached):
+        version = cached.get(self.get_version_key())
+        return version if version is not None else self._init_version()
+
+    def get_many(self, ids):
+        """
+        Returns the cached instances of `ids`, keyed by their stringified id,
+        and the version to pass to set_many for the ones that were missing.
+        """
+        keys = {self.get_key(id): str(id) for id in ids}
+        cached = self.cache.get_many([self.get_version_key()] + list(keys))
+        version = self._get_version(cached)
+
+        instances = {}
+        for key, id in keys.items():
+            entry = cached.get(key)
+            if entry is not None and entry[0] == version:
+                instances[id] = self.deserialize(entry[1])
+        self.hits += len(instances)
+        self.misses += len(keys) - len(instances)
+        return instances, version
+
+    def set_many(self, instances, version):
+        self.cache.set_many(
+            {
+                self.get_key(getattr(instance, self.id_field)): (version, self.serialize(instance))
+                for instance in instances
+            },
+            self.timeout,
+        )
+
+    def get(self, id, load):
+        """
+        Returns the cached instance of `id`, calling `load()` on a miss.
+
+        Only one caller loads a missing entry at a time, the others wait up
+        to `lock_timeout` seconds for it to be cached before loading it
+        themselves. They stop waiting as soon as the lock is released
+        without an entry, as when the id doesn't exist.
+        """
+        key = self.get_key(id)
+        cached = self.cache.get_many([self.get_version_key(), key])
+        version = self._get_version(cached)
+        entry = cached.get(key)
+        if entry is not None and entry[0] == version:
+            self.hits += 1
+            return self.deserialize(entry[1])
+
+        lock_key = "{}:lock".format(key)
+        if not self.cache.add(lock_key, 1, self.lock_timeout):
+            deadline = time.monotonic() + self.lock_timeout
+            while time.monotonic() < deadline:
+                time.sleep(self.lock_wait)
+                cached = self.cache.get_many([key, lock_key])
+                entry = cached.get(key)
+                if entry is not None and entry[0] == version:
+                    self.hits += 1
+                    return self.deserialize(entry[1])
+                if lock_key not in cached:
+                    break
+            self.misses += 1
+            return load()
+
+        self.misses += 1
+        try:
+            instance = load()
+            # Written with the version read before loading, so an
+            # invalidation that happened meanwhile discards it.
+            if instance is not None:
+                self.set_many([instance], version)
+            return instance
+        finally:
+            self.cache.delete(lock_key)
@@ -14,6 +14,7 @@ from graphql import ResolveInfo
 from graphql.execution.base import (
     get_field_def,
 )
+from graphql.execution.values import get_argument_values
 from graphql.language.ast import (
     FragmentSpread,
     InlineFragment,
@@ -24,6 +25,8 @@ from graphql.type.definition import (
     GraphQLUnionType,
 )
 
+from ..fields import DjangoPlusListField
+from ..loaders import loader_resolver
 from .utils import is_iterable
 
 
@@ -166,8 +169,14 @@ class QueryOptimizer(object):
                                 store.abort_only_optimization(name)
                         else:
                             model = getattr(graphene_type._meta, 'model', None)
-                            if model and name not in optimized_fields_by_model:
-                                field_model = optimized_fields_by_model[name] = model
+                            # Filtered list prefetches are stored per response key,
+                            # so aliases of the same field are optimized separately.
+                            key = name
+                            list_resolver = self._get_plus_list_resolver(selection_field_def.resolver)
+                            if list_resolver and self._needs_filtered_prefetch(list_resolver):
+                                key = DjangoPlusListField.get_prefetch_to_attr(selection)
+                            if model and key not in optimized_fields_by_model:
+                                field_model = optimized_fields_by_model[key] = model
                                 if field_model == model:
                                     self._optimize_field(
                                         store,
@@ -234,7 +243,15 @@ class QueryOptimizer(object):
             id_field = None
             if hasattr(field_def_type, 'graphene_type') and hasattr(field_def_type.graphene_type._meta, 'id_field'):
                 id_field = field_def_type.graphene_type._meta.id_field
-            store.select_related(name, field_store, model_field=model_field, id_field=id_field)
+            related_queryset = None
+            if field_store.annotate_dict:
+                # Annotated relations are prefetched instead of joined.
+                related_queryset = self._get_related_queryset(
+                    model_field, selection, field_def, parent_type
+                )
+            store.select_related(
+                name, field_store, model_field=model_field, id_field=id_field, queryset=related_queryset
+            )
             return True
         if model_field.one_to_many or model_field.many_to_many:
             field_store = self._optimize_gql_selections(
@@ -246,19 +263,85 @@ class QueryOptimizer(object):
             if isinstance(model_field, ManyToOneRel):
                 field_store.only(model_field.field.name)
 
-            related_queryset = model_field.related_model.objects.all()
-            store.prefetch_related(name, field_store, related_queryset)
+            related_queryset = self._get_related_queryset(
+                model_field, selection, field_def, parent_type
+            )
+            to_attr = None
+            list_resolver = self._get_plus_list_resolver(field_def.resolver)
+            if list_resolver and self._needs_filtered_prefetch(list_resolver):
+                related_queryset = self._apply_queryset_filter(
+                    list_resolver, related_queryset, selection, field_def, parent_type
+                )
+                to_attr = DjangoPlusListField.get_prefetch_to_attr(selection)
+            store.prefetch_related(name, field_store, related_queryset, to_attr=to_attr)
             return True
         if not model_field.is_relation:
             store.only(name)
             return True
         return False
 
-    def _get_optimization_hints(self, resolver):
-        resolver_fn = resolver
+    def _get_plus_list_resolver(self, resolver):
+        if isinstance(resolver, functools.partial):
+            if resolver.func == DjangoPlusListField.list_resolver:
+                return resolver
+        return None
+
+    def _unwrap_list_resolver(self, resolver):
         if isinstance(resolver, functools.partial):
-            if resolver.func == DjangoListField.list_resolver:
-                resolver_fn = resolver.args[1]
+            if resolver.func in (DjangoListField.list_resolver, DjangoPlusListField.list_resolver):
+                return resolver.args[1]
+        return resolver
+
+    def _needs_filtered_prefetch(self, list_resolver):
+        # A plain prefetch is only usable when the list resolver doesn't
+        # filter the related manager again for every parent.
+        django_object_type = list_resolver.args[0]
+        return (
+            list_resolver.keywords.get('queryset_filter') is not None
+            or django_object_type.get_queryset.__func__ is not DjangoObjectType.get_queryset.__func__
+        )
+
+    def _get_related_queryset(self, model_field, selection, field_def, parent_type):
+        """
+        Queryset for a relation that is loaded with a separate query, passed
+        through the target type's get_queryset so row-level filtering happens
+        in the batched query instead of once per parent.
+        """
+        queryset = model_field.related_model.objects.all()
+
+        graphene_type = getattr(self._get_type(field_def), 'graphene_type', None)
+        node_type = getattr(getattr(graphene_type, '_meta', None), 'node', None)
+        if node_type is not None:
+            graphene_type = node_type
+
+        if getattr(getattr(graphene_type, '_meta', None), 'model', None) != model_field.related_model:
+            return queryset
+
+        info = self._create_resolve_info(
+            selection.name.value,
+            (selection,),
+            self._get_type(field_def),
+            parent_type,
+        )
+        return graphene_type.get_queryset(queryset, info)
+
+    def _apply_queryset_filter(self, list_resolver, queryset, selection, field_def, parent_type):
+        queryset_filter = list_resolver.keywords.get('queryset_filter')
+        if queryset_filter is not None:
+            info = self._create_resolve_info(
+                selection.name.value,
+                (selection,),
+                self._get_type(field_def),
+                parent_type,
+            )
+            args = get_argument_values(
+                field_def.args, selection.arguments, self.root_info.variable_values
+            )
+            queryset = queryset_filter(queryset, info, **args)
+        return queryset
+
+    def _get_optimization_hints(self, resolver):
+        resolver_fn = self._unwrap_list_resolver(resolver)
 
         return getattr(resolver_fn, 'optimization_hints', None)
 
@@ -329,10 +412,12 @@ class QueryOptimizer(object):
 
             return self.id_field
         elif isinstance(resolver, functools.partial):
-            resolver_fn = resolver
-            if resolver_fn.func != default_resolver:
+            resolver_fn = self._unwrap_list_resolver(resolver)
+            if not isinstance(resolver_fn, functools.partial):
+                return None
+            if resolver_fn.func not in (default_resolver, loader_resolver):
                 resolver_fn = resolver_fn.args[0]
-            if isinstance(resolver_fn, functools.partial) and resolver_fn.func == default_resolver:
+            if isinstance(resolver_fn, functools.partial) and resolver_fn.func in (default_resolver, loader_resolver):
                 return resolver_fn.args[0]
             return resolver_fn
 
@@ -397,10 +482,12 @@ class QueryOptimizerStore():
         self.only_list = []
         self.disable_abort_only = disable_abort_only
 
-    def select_related(self, name, store, model_field=None, id_field=None):
+    def select_related(self, name, store, model_field=None, id_field=None, queryset=None):
         if store.annotate_dict:
+            if queryset is None:
+                queryset = model_field.related_model.objects.all()
             self.only(model_field.attname)
-            self.prefetch_related(name, store, model_field.related_model.objects.all(), id_field=id_field)
+            self.prefetch_related(name, store, queryset, id_field=id_field)
         else:
             if store.select_list:
                 for select in store.select_list:
@@ -422,8 +509,14 @@ class QueryOptimizerStore():
                     for only in store.only_list:
                         self.only_list.append(name + LOOKUP_SEP + only)
 
-    def prefetch_related(self, name, store, queryset, attname=None, id_field=None):
-        if store.select_list or store.only_list:
+    def prefetch_related(self, name, store, queryset, attname=None, id_field=None, to_attr=None):
+        if to_attr:
+            if attname and store.only_list:
+                store.only_list.append(attname)
+
+            queryset = store.optimize_queryset(queryset)
+            self.prefetch_list.append(Prefetch(name, queryset=queryset, to_attr=to_attr))
+        elif store.select_list or store.only_list:
             if attname and store.only_list:
                 store.only_list.append(attname)
             if id_field and store.only_list and id_field != "pk":
@@ -1,6 +1,8 @@
 import warnings
+from collections import defaultdict
 
 from rest_framework.exceptions import PermissionDenied, Throttled
+from rest_framework.throttling import SimpleRateThrottle
 
 
 def check_permission_classes(info, field, permission_classes):
@@ -14,12 +16,60 @@ def check_permission_classes(info, field, permission_classes):
                 )
             )
 
-    if permission_classes is not None:
-        for permission in [p() for p in permission_classes]:
-            if not permission.has_permission(
-                info.context.get("request"), info.context.get("view")
-            ):
-                raise PermissionDenied(detail=getattr(permission, "message", None))
+    if permission_classes and not is_authorized(info):
+        enforce_permission_classes(getattr(info, "context", None), permission_classes)
+
+
+def enforce_permission_classes(context, permission_classes):
+    """
+    Raises PermissionDenied unless every permission class allows the request
+    of `context`.
+    """
+    # Verdicts are memoized per request, unless a class sets
+    # `cacheable = False` as it depends on more than the request.
+    key = tuple(permission_classes)
+    cacheable = all(getattr(p, "cacheable", True) for p in key)
+    cache = _get_context_cache(context, "permission_cache")
+    if cacheable and key in cache:
+        allowed, message = cache[key]
+    else:
+        allowed, message = _has_permission(context, permission_classes)
+        if cacheable:
+            cache[key] = (allowed, message)
+
+    if not allowed:
+        raise PermissionDenied(detail=message)
+
+
+def _has_permission(context, permission_classes):
+    for permission in [p() for p in permission_classes]:
+        if not permission.has_permission(context.get("request"), context.get("view")):
+            return False, getattr(permission, "message", None)
+    return True, None
+
+
+def _get_context_cache(context, name):
+    if not isinstance(context, dict):
+        return {}
+
+    if context.get(name) is None:
+        context[name] = {}
+    return context[name]
+
+
+def get_permission_cache(info):
+    return _get_context_cache(getattr(info, "context", None), "permission_cache")
+
+
+def is_authorized(info):
+    """
+    Whether the permission and throttle classes of the field being resolved
+    have already been checked for the whole operation, see authorize_document.
+    """
+    context = getattr(info, "context", None)
+    if not isinstance(context, dict) or not context.get("authorized_fields"):
+        return False
+    return (info.parent_type.name, info.field_name) in context["authorized_fields"]
 
 
 def check_throttle_classes(info, field, throttle_classes):
@@ -33,9 +83,158 @@ def check_throttle_classes(info, field, throttle_classes):
                 )
             )
 
-    if throttle_classes is not None:
-        for throttle in [t() for t in throttle_classes]:
-            if not throttle.allow_request(
-                info.context.get("request"), info.context.get("view")
-            ):
-                raise Throttled(throttle.wait())
+    if throttle_classes and not is_authorized(info):
+        enforce_throttle_classes(getattr(info, "context", None), throttle_classes)
+
+
+def enforce_throttle_classes(context, throttle_classes):
+    """
+    Raises Throttled unless every throttle class allows the request of
+    `context`.
+    """
+    # Each throttle class is evaluated once per request, a field
+    # resolved for every item of a list only counts as one request.
+    cache = _get_context_cache(context, "throttle_cache")
+    missing = [t for t in dict.fromkeys(throttle_classes) if t not in cache]
+    if missing:
+        cache.update(
+            _allow_request([t() for t in missing], context.get("request"), context.get("view"))
+        )
+
+    for throttle_class in throttle_classes:
+        allowed, wait = cache[throttle_class]
+        if not allowed:
+            raise Throttled(wait)
+
+
+class _PrefetchedCache:
+    """
+    Cache of the SimpleRateThrottles of a request whose histories were read
+    beforehand with a get_many, everything else goes to `cache`.
+    """
+
+    def __init__(self, cache, values):
+        self._cache = cache
+        self._values = values
+
+    def get(self, key, default=None, **kwargs):
+        if key in self._values:
+            value = self._values[key]
+            return default if value is None else value
+        return self._cache.get(key, default, **kwargs)
+
+    def set(self, key, value, *args, **kwargs):
+        if key in self._values:
+            self._values[key] = value
+        return self._cache.set(key, value, *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._cache, name)
+
+
+def _allow_request(throttles, request, view):
+    """
+    Returns whether each throttle allows the request, and its wait.
+
+    Every throttle decides with its own allow_request, so its
+    throttle_success and throttle_failure hooks apply. The histories of the
+    SimpleRateThrottles that don't override allow_request are read with a
+    get_many per cache beforehand, instead of a get each.
+    """
+    rate_throttles = defaultdict(list)
+    for throttle in throttles:
+        if type(throttle).allow_request is not SimpleRateThrottle.allow_request:
+            continue
+        key = None if throttle.rate is None else throttle.get_cache_key(request, view)
+        if key is not None:
+            # DefaultCacheProxy isn't hashable
+            rate_throttles[id(throttle.cache)].append((throttle, key))
+
+    for keyed_throttles in rate_throttles.values():
+        cache = keyed_throttles[0][0].cache
+        keys = [key for throttle, key in keyed_throttles]
+        values = dict.fromkeys(keys)
+        values.update(cache.get_many(keys))
+        prefetched = _PrefetchedCache(cache, values)
+        for throttle, key in keyed_throttles:
+            throttle.cache = prefetched
+
+    verdicts = {}
+    for throttle in throttles:
+        allowed = throttle.allow_request(request, view)
+        verdicts[type(throttle)] = (allowed, None if allowed else throttle.wait())
+    return verdicts
+
+
+def get_throttle_cache(info):
+    return _get_context_cache(getattr(info, "context", None), "throttle_cache")
+
+
+def get_view_checks(context):
+    """
+    Whether the view's resolver_permission_classes and
+    resolver_throttle_classes, used by the fields given None, are non empty.
+    Looked up on the first resolution of a request and kept in the context's
+    "view_checks", or None without a view.
+    """
+    if not isinstance(context, dict):
+        return None
+
+    view_checks = context.get("view_checks")
+    if view_checks is None and context.get("view") is not None:
+        view = context["view"]
+        view_checks = context["view_checks"] = (
+            bool(view.resolver_permission_classes),
+            bool(view.resolver_throttle_classes),
+        )
+    return view_checks
+
+
+def check_classes(info, field, permission_classes, throttle_classes):
+    """
+    Calls check_permission_classes and check_throttle_classes, unless the
+    classes the field would check, its own or the view's, are all empty.
+    """
+    if permission_classes is None or throttle_classes is None:
+        view_checks = get_view_checks(getattr(info, "context", None))
+        if view_checks is None:
+            # Without a view the checks warn
+            has_checks = True
+        else:
+            has_checks = (
+                view_checks[0] if permission_classes is None else bool(permission_classes)
+            ) or (view_checks[1] if throttle_classes is None else bool(throttle_classes))
+    else:
+        has_checks = bool(permission_classes or throttle_classes)
+
+    if has_checks:
+        check_permission_classes(info, field, permission_classes)
+        check_throttle_classes(info, field, throttle_classes)
+
+
+def has_no_checks(permission_classes, throttle_classes):
+    """
+    Whether a field given these classes checks nothing, in which case it
+    doesn't need to wrap its resolver. None means the view's
+    resolver_permission_classes or resolver_throttle_classes, which are only
+    known when a request is resolved.
+    """
+    return (
+        permission_classes is not None
+        and not permission_classes
+        and throttle_classes is not None
+        and not throttle_classes
+    )
+
+
+def filter_queryset_permissions(info, permission_classes, queryset):
+    """
+    Restricts `queryset` to the rows the request may access, with the
+    `filter_queryset(request, queryset)` of the permission classes that
+    define one.
+    """
+    context = getattr(info, "context", None)
+    request = context.get("request") if isinstance(context, dict) else None
+    for permission in [p() for p in permission_classes if hasattr(p, "filter_queryset")]:
+        queryset = permission.filter_queryset(request, queryset)
+    return queryset
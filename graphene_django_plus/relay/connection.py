@@ -1,19 +1,76 @@
-from graphene import Field, Int
-from graphene.relay import Connection
+import re
+from functools import partial
+
+from django.db import models
+from django.db.models.query import QuerySet
+from graphene import Field, Float, Int, List, NonNull, ObjectType
+from graphene.relay import Connection, PageInfo
+from graphene_django.utils import maybe_queryset
+from graphql_relay.connection.arrayconnection import (
+    get_offset_with_default,
+    offset_to_cursor,
+)
+from promise import Promise
+
+from .count import ExactCount, count_iterable, get_count_strategy
+from .facets import Facet
+
+
+class NumericAggregate(ObjectType):
+    sum = Float(description="Sum of the values")
+    avg = Float(description="Average of the values")
+    min = Float(description="Smallest value")
+    max = Float(description="Largest value")
+
+
+AGGREGATE_FUNCTIONS = {
+    "sum": models.Sum,
+    "avg": models.Avg,
+    "min": models.Min,
+    "max": models.Max,
+}
+
+NUMERIC_FIELDS = (models.IntegerField, models.FloatField, models.DecimalField)
+
+
+def create_aggregates_type(node):
+    """
+    Type of the `aggregates` field of `node`'s connections, with the count
+    and the NumericAggregate of each of the numeric model fields in
+    node._meta.aggregates.
+    """
+    model = node._meta.model
+    fields = {
+        "count": Field(NonNull(Int), description="Number of rows"),
+    }
+    for name in node._meta.aggregates:
+        model_field = model._meta.get_field(name)
+        assert isinstance(model_field, NUMERIC_FIELDS), (
+            "Can't aggregate {}.{}, it isn't a numeric field"
+        ).format(model.__name__, name)
+        fields[name] = Field(NumericAggregate)
+
+    return type("{}Aggregates".format(node._meta.name), (ObjectType,), fields)
 
 
 class DjangoConnection(Connection):
     """
-    Since Django anyways always gets the total count of a queryset when
-    paginating a response, this field can be safely added to a relay
-    query response.
+    Connection whose page and total count are only fetched when they are
+    selected, see connection_from_offset. Without a `first` or `last`
+    argument the whole iterable is fetched.
     """
 
+    iterable = None
+    length = None
+    page_loader = None
+    count_strategy = None
+    facets_loader = None
+
     class Meta:
         abstract = True
 
     @classmethod
-    def __init_subclass_with_meta__(cls, node=None, name=None, **options):
+    def __init_subclass_with_meta__(cls, node=None, name=None, facets=False, **options):
         parent = super(DjangoConnection, cls).__init_subclass_with_meta__(
             node, name, **options
         )
@@ -24,5 +81,218 @@ class DjangoConnection(Connection):
             required=True,
             description="Total count for use in pagination",
         )
+        if facets:
+            cls._meta.fields["facets"] = Field(
+                List(NonNull(Facet)),
+                required=True,
+                description="Row counts per value of the facets of the field",
+            )
 
         return parent
+
+    @classmethod
+    def get_faceted_connection(cls):
+        """
+        Subclass of this connection with the `facets` field, for the fields
+        that declare facets. Created once, with the fields this connection
+        has by then, like its aggregates.
+        """
+        faceted = cls.__dict__.get("_faceted_connection")
+        if faceted is None:
+            name = "{}FacetedConnection".format(re.sub("Connection$", "", cls._meta.name))
+            meta = type("Meta", (), {"node": cls._meta.node, "name": name, "facets": True})
+            faceted = type(name, (cls,), {"Meta": meta})
+            for field_name, field in cls._meta.fields.items():
+                faceted._meta.fields.setdefault(field_name, field)
+            cls._faceted_connection = faceted
+        return faceted
+
+    @classmethod
+    def add_aggregates_field(cls, node):
+        """
+        Adds the `aggregates` field, called once `node` has been created as
+        it can't be accessed while its connection is created.
+        """
+        cls._meta.fields["aggregates"] = Field(
+            create_aggregates_type(node),
+            required=True,
+            description="Aggregates of all the rows of the connection",
+        )
+
+    def load_page(self):
+        if self.edges is None and self.page_loader is not None:
+            self.edges, self.page_info = self.page_loader()
+
+    def resolve_total_count(self, info, **kwargs):
+        if self.total_count is None:
+            if self.length is not None:
+                self.total_count = self.length
+            else:
+                count_strategy = get_count_strategy(self.count_strategy)
+                self.total_count = count_iterable(self.iterable, count_strategy)
+                if count_strategy.exact:
+                    self.length = self.total_count
+        return self.total_count
+
+    def resolve_aggregates(self, info, **kwargs):
+        """
+        All the declared aggregates, computed with a single query.
+        """
+        iterable = self.iterable
+        names = self._meta.node._meta.aggregates
+        if not isinstance(iterable, QuerySet):
+            iterable = self._meta.node._meta.model._default_manager.filter(
+                pk__in=[row.pk for row in iterable]
+            )
+
+        aggregates = {"count": models.Count("pk")}
+        for name in names:
+            for function, aggregate in AGGREGATE_FUNCTIONS.items():
+                aggregates["{}__{}".format(name, function)] = aggregate(name)
+        values = iterable.aggregate(**aggregates)
+
+        if self.length is None:
+            self.length = values["count"]
+
+        ret = {"count": values["count"]}
+        for name in names:
+            ret[name] = {
+                function: values["{}__{}".format(name, function)]
+                for function in AGGREGATE_FUNCTIONS
+            }
+        return ret
+
+    def resolve_facets(self, info, **kwargs):
+        if self.facets is None and self.facets_loader is not None:
+            self.facets = self.facets_loader()
+        return self.facets
+
+    def resolve_edges(self, info, **kwargs):
+        self.load_page()
+        return self.edges
+
+    def resolve_page_info(self, info, **kwargs):
+        self.load_page()
+        return self.page_info
+
+
+def lazy_connection(connection_type, iterable, page_loader, length=None):
+    """
+    Instantiates `connection_type` with the page returned by `page_loader`,
+    which is called with the connection. DjangoConnections call it when their
+    edges or page info are resolved.
+    """
+    connection = connection_type()
+    connection.iterable = iterable
+    connection.length = length
+    connection.page_loader = partial(page_loader, connection)
+
+    if not isinstance(connection, DjangoConnection):
+        connection.edges, connection.page_info = connection.page_loader()
+    return connection
+
+
+def on_connection(connection, callback):
+    """
+    Calls `callback` with a resolved connection, or once a promise of one
+    resolves.
+    """
+
+    def on_resolve(connection):
+        callback(connection)
+        return connection
+
+    if Promise.is_thenable(connection):
+        return Promise.resolve(connection).then(on_resolve)
+    return on_resolve(connection)
+
+
+def set_count_strategy(connection, count_strategy):
+    """
+    Sets the strategy totalCount is computed with on a resolved connection,
+    or a promise of one.
+    """
+    if count_strategy is None:
+        return connection
+
+    def callback(connection):
+        connection.count_strategy = count_strategy
+
+    return on_connection(connection, callback)
+
+
+def get_connection_length(connection):
+    if connection.length is None:
+        connection.length = count_iterable(connection.iterable, ExactCount())
+    return connection.length
+
+
+def _load_offset_page(args, connection):
+    iterable = connection.iterable
+    first = args.get("first")
+    last = args.get("last")
+    after_offset = get_offset_with_default(args.get("after"), -1)
+    before_offset = get_offset_with_default(args.get("before"), None)
+    assert first is None or first >= 0, "Argument `first` must be a non-negative integer."
+    assert last is None or last >= 0, "Argument `last` must be a non-negative integer."
+
+    def fetch(start, stop):
+        if stop is not None and stop <= start:
+            return []
+        return list(iterable[start:stop])
+
+    start = after_offset + 1
+    has_next_page = False
+    if first is not None:
+        end = start + first if before_offset is None else min(before_offset, start + first)
+        if before_offset is None:
+            # One extra row tells whether there is a next page without counting.
+            rows = fetch(start, end + 1)
+            has_next_page = len(rows) > end - start
+            rows = rows[: end - start]
+        else:
+            rows = fetch(start, end)
+            has_next_page = start + len(rows) < before_offset
+        if last is not None and len(rows) > last:
+            start += len(rows) - last
+            rows = rows[len(rows) - last :]
+    elif last is not None:
+        end = before_offset if before_offset is not None else get_connection_length(connection)
+        rows = fetch(max(start, end - last), end)
+        if before_offset is not None and (not last or len(rows) < min(last, end - start)):
+            # `before` points past the end of the iterable.
+            end = min(end, get_connection_length(connection))
+            rows = fetch(max(start, end - last), end)
+        start = max(start, end - last)
+    else:
+        rows = fetch(start, before_offset)
+
+    edges = [
+        connection.Edge(node=node, cursor=offset_to_cursor(start + i))
+        for i, node in enumerate(rows)
+    ]
+    page_info = PageInfo(
+        start_cursor=edges[0].cursor if edges else None,
+        end_cursor=edges[-1].cursor if edges else None,
+        has_previous_page=last is not None and start > after_offset + 1,
+        has_next_page=has_next_page,
+    )
+    return edges, page_info
+
+
+def connection_from_offset(iterable, args, connection_type, max_limit=None):
+    """
+    Offset paginated connection of `iterable`, a replacement for
+    DjangoConnectionField.resolve_connection that only counts the iterable
+    when `totalCount` is selected or `last` is given without `before`.
+    """
+    iterable = maybe_queryset(iterable)
+    if max_limit is not None and "first" not in args:
+        args["first"] = max_limit
+
+    return lazy_connection(
+        connection_type,
+        iterable,
+        partial(_load_offset_page, args),
+        length=None if isinstance(iterable, QuerySet) else len(iterable),
+    )
@@ -0,0 +1,203 @@
+import hashlib
+import json
+import time
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.db import connections
+from django.db.models.query import QuerySet
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.utils.module_loading import import_string
+
+from ..signals import bulk_changed
+
+
+class CountStrategy:
+    """
+    Computes DjangoConnection.totalCount for a queryset.
+    """
+
+    # Whether the count can also be used to paginate.
+    exact = False
+
+    def count(self, queryset):
+        raise NotImplementedError(".count() must be overridden.")
+
+    def get_cache_key(self):
+        """
+        Identifies the strategy in CachedCount's keys.
+        """
+        return type(self).__name__
+
+
+class ExactCount(CountStrategy):
+    exact = True
+
+    def count(self, queryset):
+        return queryset.count()
+
+
+class CappedCount(CountStrategy):
+    """
+    Counts up to `cap` rows through a limited subquery, a total count equal
+    to `cap` means "at least `cap`".
+    """
+
+    def __init__(self, cap):
+        self.cap = cap
+
+    def count(self, queryset):
+        return queryset[: self.cap].count()
+
+    def get_cache_key(self):
+        return "{}:{}".format(super().get_cache_key(), self.cap)
+
+
+class EstimatedCount(CountStrategy):
+    """
+    Returns the row estimate of the query planner on PostgreSQL. Estimates
+    below `threshold` and other database backends are counted with
+    `fallback` instead.
+    """
+
+    def __init__(self, threshold=1000, fallback=None):
+        self.threshold = threshold
+        self.fallback = fallback or ExactCount()
+
+    def estimate(self, queryset):
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return None
+
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute("EXPLAIN (FORMAT JSON) {}".format(sql), params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def count(self, queryset):
+        estimate = self.estimate(queryset)
+        if estimate is None or estimate < self.threshold:
+            return self.fallback.count(queryset)
+        return estimate
+
+    def get_cache_key(self):
+        return "{}:{}:{}".format(
+            super().get_cache_key(), self.threshold, self.fallback.get_cache_key()
+        )
+
+
+class CachedCount(CountStrategy):
+    """
+    Caches the counts of `strategy` for `timeout` seconds.
+
+    Counts are keyed by the SQL of the queryset, which covers its model, the
+    filter arguments and whatever get_queryset filtered by for the user.
+    Saving or deleting rows of any table in the query, or changing its many to
+    many relations, bumps that table's version and invalidates the counts, as
+    does the bulk_changed signal of the bulk mutations.
+    """
+
+    def __init__(self, strategy=None, timeout=60, cache_alias=DEFAULT_CACHE_ALIAS):
+        self.strategy = get_count_strategy(strategy)
+        self.timeout = timeout
+        self.cache_alias = cache_alias
+
+        for signal in (post_save, post_delete, m2m_changed, bulk_changed):
+            signal.connect(
+                partial(_invalidate_table_counts, cache_alias),
+                weak=False,
+                dispatch_uid="graphene_django_plus.count.{}".format(cache_alias),
+            )
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def get_cache_key(self):
+        return "Cached:{}".format(self.strategy.get_cache_key())
+
+    def _get_versions(self, cached, version_keys):
+        versions = []
+        for version_key in version_keys:
+            version = cached.get(version_key)
+            if version is None:
+                version = _init_table_version(self.cache, version_key)
+            versions.append(version)
+        return tuple(versions)
+
+    def count(self, queryset):
+        query = queryset.query.clone()
+        sql, params = query.sql_with_params()
+        tables = sorted(
+            {queryset.model._meta.db_table}.union(
+                join.table_name for join in query.alias_map.values()
+            )
+        )
+        digest = hashlib.sha1(
+            repr((queryset.db, sql, params, self.get_cache_key())).encode()
+        ).hexdigest()
+
+        key = "gdp:count:{}".format(digest)
+        version_keys = [get_table_version_key(table) for table in tables]
+        cached = self.cache.get_many([key] + version_keys)
+        versions = self._get_versions(cached, version_keys)
+
+        entry = cached.get(key)
+        if entry is not None and entry[0] == versions:
+            return entry[1]
+
+        count = self.strategy.count(queryset)
+        # Written with the versions read before counting, so an invalidation
+        # that happened meanwhile discards it.
+        self.cache.set(key, (versions, count), self.timeout)
+        return count
+
+
+def get_table_version_key(table):
+    return "gdp:count:version:{}".format(table)
+
+
+def _init_table_version(cache, version_key):
+    cache.add(version_key, time.time_ns(), None)
+    return cache.get(version_key)
+
+
+def _invalidate_table_counts(cache_alias, sender, action=None, **kwargs):
+    # m2m_changed is also sent before the change
+    if action is not None and not action.startswith("post_"):
+        return
+
+    cache = caches[cache_alias]
+    for model in [sender] + sender._meta.get_parent_list():
+        version_key = get_table_version_key(model._meta.db_table)
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            _init_table_version(cache, version_key)
+
+
+def get_count_strategy(count_strategy=None):
+    """
+    Returns `count_strategy`, or the GRAPHENE_DJANGO_PLUS_COUNT_STRATEGY
+    setting when it is None. Strategies may be given as instances, classes or
+    import paths.
+    """
+    if count_strategy is None:
+        count_strategy = getattr(settings, "GRAPHENE_DJANGO_PLUS_COUNT_STRATEGY", None)
+    if count_strategy is None:
+        return ExactCount()
+    if isinstance(count_strategy, str):
+        count_strategy = import_string(count_strategy)
+    if isinstance(count_strategy, type):
+        count_strategy = count_strategy()
+    return count_strategy
+
+
+def count_iterable(iterable, count_strategy=None):
+    if not isinstance(iterable, QuerySet):
+        return len(iterable)
+    return get_count_strategy(count_strategy).count(iterable)
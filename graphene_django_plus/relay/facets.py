@@ -0,0 +1,74 @@
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Count, F
+from graphene import Int, List, NonNull, ObjectType, String
+from graphene.utils.str_converters import to_camel_case
+
+
+class FacetValue(ObjectType):
+    value = String(description="Value of the facet, null for rows without one")
+    count = Int(required=True, description="Number of rows with the value")
+
+
+class Facet(ObjectType):
+    name = String(required=True, description="Name of the filter argument of the facet")
+    values = List(
+        NonNull(FacetValue),
+        required=True,
+        description="Row counts per value, ignoring the facet's own filter",
+    )
+
+
+def get_facet_field_name(filterset_class, name):
+    model = filterset_class._meta.model
+    field_name = filterset_class.base_filters[name].field_name
+    try:
+        model._meta.get_field(field_name.split("__")[0])
+    except FieldDoesNotExist:
+        raise AssertionError(
+            "The filter {} of {} can't be a facet, it doesn't filter a model field".format(
+                name, filterset_class.__name__
+            )
+        )
+    return field_name
+
+
+def get_facets(filterset_class, filtering_args, facets, queryset, args, request):
+    """
+    Counts the rows of `queryset` per value of the field of each facet's
+    filter, with a GROUP BY query per facet. Each facet is filtered by every
+    filter in `args` but its own, so the counts of its other values are
+    still shown when one is selected.
+    """
+    filter_kwargs = {k: v for k, v in args.items() if k in filtering_args}
+
+    ret = []
+    for name in facets:
+        field_name = get_facet_field_name(filterset_class, name)
+        filterset = filterset_class(
+            data={k: v for k, v in filter_kwargs.items() if k != name},
+            queryset=queryset,
+            request=request,
+        )
+        if not filterset.form.is_valid():
+            raise ValidationError(filterset.form.errors.as_json())
+
+        rows = (
+            filterset.qs.order_by()
+            .prefetch_related(None)
+            .values(field_name)
+            .annotate(facet_count=Count("pk"))
+            .order_by("-facet_count", F(field_name).asc(nulls_last=True))
+        )
+        ret.append(
+            Facet(
+                name=to_camel_case(name),
+                values=[
+                    FacetValue(
+                        value=None if row[field_name] is None else str(row[field_name]),
+                        count=row["facet_count"],
+                    )
+                    for row in rows
+                ],
+            )
+        )
+    return ret
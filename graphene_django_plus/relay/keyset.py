@@ -0,0 +1,297 @@
+import datetime
+import json
+from functools import partial
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Q
+from django.db.models.expressions import OrderBy
+from django.db.models.query import QuerySet
+from graphene.relay import PageInfo
+from graphene_django.utils import maybe_queryset
+from graphql_relay.utils import base64, unbase64
+from promise import Promise
+
+from .connection import lazy_connection
+
+PREFIX = "keyset:"
+
+
+class KeysetKey:
+    """
+    One column of a keyset ordering.
+    """
+
+    def __init__(self, name, descending=False, nullable=False):
+        self.name = name
+        self.descending = descending
+        self.nullable = nullable
+
+    def order_by(self, reverse=False):
+        descending = self.descending != reverse
+        if not self.nullable:
+            return OrderBy(F(self.name), descending=descending)
+        # Nulls are always last, so they can be compared against.
+        return OrderBy(
+            F(self.name),
+            descending=descending,
+            nulls_last=not reverse,
+            nulls_first=reverse,
+        )
+
+    def after(self, value, reverse=False):
+        """
+        Filter for the rows that come after `value` on this key, or before it
+        when `reverse`.
+        """
+        if value is None:
+            return Q(**{"{}__isnull".format(self.name): False}) if reverse else None
+
+        lookup = "lt" if self.descending != reverse else "gt"
+        q = Q(**{"{}__{}".format(self.name, lookup): value})
+        if self.nullable and not reverse:
+            q |= Q(**{"{}__isnull".format(self.name): True})
+        return q
+
+    def equals(self, value):
+        if value is None:
+            return Q(**{"{}__isnull".format(self.name): True})
+        return Q(**{self.name: value})
+
+
+def _get_lookup_field(model, name):
+    """
+    Returns the field `name` refers to and whether it can be null, as it is
+    when any relation on the way is nullable.
+    """
+    field = None
+    nullable = False
+    for part in name.split("__"):
+        if model is None:
+            return None, True
+        if part == "pk":
+            field = model._meta.pk
+        else:
+            try:
+                field = model._meta.get_field(part)
+            except FieldDoesNotExist:
+                return None, True
+        nullable = nullable or field.null or (field.is_relation and not field.concrete)
+        model = field.related_model
+    return field, nullable
+
+
+def get_keyset_ordering(queryset, id_field="pk"):
+    """
+    Returns the ordering of `queryset` as KeysetKeys, ending with `id_field`
+    as a tie-breaker.
+    """
+    model = queryset.model
+    query = queryset.query
+    if query.order_by:
+        order_by = query.order_by
+    elif query.default_ordering:
+        order_by = model._meta.ordering
+    else:
+        order_by = []
+
+    keys = []
+    for item in order_by:
+        if isinstance(item, str) and item != "?":
+            name, descending = item.lstrip("-"), item.startswith("-")
+        elif isinstance(item, OrderBy) and isinstance(item.expression, F):
+            name, descending = item.expression.name, item.descending
+        elif isinstance(item, F):
+            name, descending = item.name, False
+        else:
+            raise ValueError(
+                "Keyset pagination only supports ordering by fields, got {!r}".format(item)
+            )
+
+        field, nullable = _get_lookup_field(model, name)
+        if field is not None and field.concrete and (field.many_to_one or field.one_to_one):
+            assert not field.related_model._meta.ordering, (
+                "Keyset pagination can't order by {} as {} has a default ordering"
+            ).format(name, field.related_model.__name__)
+            name = "{}__{}".format(name, field.target_field.name)
+        keys.append(KeysetKey(name, descending, nullable))
+
+    pk_names = {"pk", model._meta.pk.name, model._meta.pk.attname}
+    id_names = pk_names if id_field in pk_names else {id_field}
+    if not any(key.name in id_names for key in keys):
+        keys.append(KeysetKey(id_field, keys[-1].descending if keys else False))
+
+    return keys
+
+
+def get_keyset_filter(keys, values, reverse=False):
+    """
+    Filter for the rows after the one with `values` in the ordering, or
+    before it when `reverse`.
+    """
+    q = None
+    equal = Q()
+    for key, value in zip(keys, values):
+        after = key.after(value, reverse)
+        if after is not None:
+            q = equal & after if q is None else q | (equal & after)
+        equal &= key.equals(value)
+    return q if q is not None else Q(pk__in=[])
+
+
+class KeysetJSONEncoder(DjangoJSONEncoder):
+    """
+    DjangoJSONEncoder that keeps the microseconds of datetimes and times, as
+    the next page compares the rows against the exact values of the cursor.
+    """
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+def encode_keyset_cursor(values):
+    return base64(PREFIX + json.dumps(values, cls=KeysetJSONEncoder))
+
+
+def decode_keyset_cursor(cursor, keys):
+    try:
+        data = unbase64(cursor)
+        assert data.startswith(PREFIX)
+        values = json.loads(data[len(PREFIX):])
+        assert isinstance(values, list) and len(values) == len(keys)
+    except Exception:
+        raise ValueError("Invalid cursor {}".format(cursor))
+    return values
+
+
+def connection_from_keyset(queryset, args, connection_type, id_field="pk", max_limit=None):
+    """
+    Builds a connection of the page of `queryset` selected by the relay
+    arguments, seeking through the ordering instead of using offsets.
+    """
+    queryset = maybe_queryset(queryset)
+    assert isinstance(queryset, QuerySet), "Keyset pagination requires a queryset"
+
+    first = args.get("first")
+    last = args.get("last")
+    after = args.get("after")
+    before = args.get("before")
+    assert first is None or first >= 0, "Argument `first` must be a non-negative integer."
+    assert last is None or last >= 0, "Argument `last` must be a non-negative integer."
+    if max_limit is not None and first is None and last is None:
+        first = max_limit
+
+    keys = get_keyset_ordering(queryset, id_field)
+    annotations = {
+        "_keyset_{}".format(i): F(key.name) for i, key in enumerate(keys) if "__" in key.name
+    }
+
+    iterable = queryset
+    if annotations:
+        queryset = queryset.annotate(**annotations)
+    if after is not None:
+        queryset = queryset.filter(get_keyset_filter(keys, decode_keyset_cursor(after, keys)))
+    if before is not None:
+        queryset = queryset.filter(
+            get_keyset_filter(keys, decode_keyset_cursor(before, keys), reverse=True)
+        )
+
+    def load_page(connection):
+        return _load_keyset_page(connection, queryset, keys, first, last, after, before)
+
+    return lazy_connection(connection_type, iterable, load_page)
+
+
+def _load_keyset_page(connection, queryset, keys, first, last, after, before):
+    has_previous_page = after is not None
+    has_next_page = before is not None
+    if last is not None and first is None:
+        # Seek from the end through the reversed ordering.
+        rows = list(queryset.order_by(*[key.order_by(reverse=True) for key in keys])[: last + 1])
+        has_previous_page = has_previous_page or len(rows) > last
+        rows = rows[:last][::-1]
+    else:
+        queryset = queryset.order_by(*[key.order_by() for key in keys])
+        if first is not None:
+            rows = list(queryset[: first + 1])
+            has_next_page = has_next_page or len(rows) > first
+            rows = rows[:first]
+        else:
+            rows = list(queryset)
+        if last is not None and len(rows) > last:
+            has_previous_page = True
+            rows = rows[-last:]
+
+    def get_value(row, i, key):
+        attname = "_keyset_{}".format(i) if "__" in key.name else key.name
+        return getattr(row, attname)
+
+    edges = [
+        connection.Edge(
+            node=row,
+            cursor=encode_keyset_cursor([get_value(row, i, key) for i, key in enumerate(keys)]),
+        )
+        for row in rows
+    ]
+    page_info = PageInfo(
+        start_cursor=edges[0].cursor if edges else None,
+        end_cursor=edges[-1].cursor if edges else None,
+        has_previous_page=has_previous_page,
+        has_next_page=has_next_page,
+    )
+    return edges, page_info
+
+
+def keyset_connection_resolver(
+    resolver,
+    connection,
+    default_manager,
+    queryset_resolver,
+    max_limit,
+    enforce_first_or_last,
+    root,
+    info,
+    **args
+):
+    """
+    DjangoConnectionField.connection_resolver for connections paginated
+    with connection_from_keyset.
+    """
+    first = args.get("first")
+    last = args.get("last")
+
+    if enforce_first_or_last:
+        assert first or last, (
+            "You must provide a `first` or `last` value to properly paginate the `{}` connection."
+        ).format(info.field_name)
+
+    if max_limit:
+        if first:
+            assert first <= max_limit, (
+                "Requesting {} records on the `{}` connection exceeds the `first` limit of {} records."
+            ).format(first, info.field_name, max_limit)
+        if last:
+            assert last <= max_limit, (
+                "Requesting {} records on the `{}` connection exceeds the `last` limit of {} records."
+            ).format(last, info.field_name, max_limit)
+
+    iterable = resolver(root, info, **args)
+    if iterable is None:
+        iterable = default_manager
+    iterable = queryset_resolver(connection, iterable, info, args)
+
+    id_field = getattr(connection._meta.node._meta, "id_field", None) or "pk"
+    on_resolve = partial(
+        connection_from_keyset,
+        args=args,
+        connection_type=connection,
+        id_field=id_field,
+        max_limit=max_limit,
+    )
+
+    if Promise.is_thenable(iterable):
+        return Promise.resolve(iterable).then(on_resolve)
+
+    return on_resolve(iterable)
@@ -1,5 +1,8 @@
+import re
 from collections import OrderedDict
 
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections, router, transaction
 from django.http import Http404
 from django.utils.encoding import force_str
 from rest_framework import serializers
@@ -18,6 +21,7 @@ from ..registry import get_global_registry
 from ..types import ErrorType
 from ..mutation import SerializerMutationOptions
 from ..serializers import fields_for_serializer
+from ..signals import bulk_changed
 
 global_registry = get_global_registry()
 
@@ -185,11 +189,11 @@ class SerializerBaseClientIDMutation(DjangoClientIDMutation):
             key = to_camel_case(force_str(key))
             if isinstance(value, dict):
                 formatted_errors += cls.format_errors(
-                    value, field=key + ".", path=path + [key]
+                    value, field=field + key + ".", path=path + [key]
                 )
             elif isinstance(value, list) and value and isinstance(value[0], dict):
                 for idx, error in enumerate(value):
-                    idx_key = "{}[{}]".format(key, idx)
+                    idx_key = "{}{}[{}]".format(field, key, idx)
                     formatted_errors += cls.format_errors(
                         error, field=idx_key + ".", path=path + [key, idx]
                     )
@@ -219,9 +223,7 @@ class SerializerBaseClientIDMutation(DjangoClientIDMutation):
             return cls.handle_serializer_errors(serializer)
 
     @classmethod
-    def perform_mutate(cls, serializer, info):
-        obj = serializer.save()
-
+    def get_output_values(cls, serializer, obj):
         kwargs = {}
         for f, field in serializer.fields.items():
             if not field.write_only:
@@ -233,6 +235,14 @@ class SerializerBaseClientIDMutation(DjangoClientIDMutation):
                 except SkipField:
                     pass
 
+        return kwargs
+
+    @classmethod
+    def perform_mutate(cls, serializer, info):
+        obj = serializer.save()
+
+        kwargs = cls.get_output_values(serializer, obj)
+
         value = cls(errors=None, **kwargs)
 
         return value
@@ -243,6 +253,228 @@ class SerializerClientIDCreateMutation(SerializerBaseClientIDMutation):
         abstract = True
 
 
+class SerializerBaseBulkClientIDMutation(SerializerBaseClientIDMutation):
+    """
+    Base of the mutations that write a list of `items` with a single query,
+    each item being validated by `serializer_class`. The payload returns an
+    `items` list typed after the serializer's output fields, or `errors`
+    prefixed with the index of the item, like `items[1].title`, in which
+    case nothing is written.
+    """
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def __init_subclass_with_meta__(
+        cls,
+        lookup_field=None,
+        serializer_class=None,
+        model_class=None,
+        node_class=None,
+        only_fields=(),
+        exclude_fields=(),
+        is_update=False,
+        id_input_field=None,
+        partial=False,
+        batch_size=None,
+        convert_choices_to_enum=True,
+        registry=None,
+        name=None,
+        **options
+    ):
+        if not serializer_class:
+            raise Exception(
+                "serializer_class is required for SerializerBaseBulkClientIDMutation"
+            )
+
+        serializer = serializer_class()
+        if model_class is None:
+            serializer_meta = getattr(serializer_class, "Meta", None)
+            if serializer_meta:
+                model_class = getattr(serializer_meta, "model", None)
+
+        if not model_class:
+            raise Exception(
+                "model_class is required for SerializerBaseBulkClientIDMutation"
+            )
+
+        if node_class and not issubclass(node_class, graphene.relay.Node):
+            raise Exception("node_class must be a subclass of relay.Node")
+
+        if is_update and not node_class:
+            raise Exception(
+                "node_class is required for SerializerClientIDBulkUpdateMutation"
+            )
+
+        if lookup_field is None:
+            lookup_field = model_class._meta.pk.name
+
+        input_fields = fields_for_serializer(
+            serializer,
+            only_fields,
+            exclude_fields,
+            registry,
+            is_input=True,
+            is_update=is_update,
+            is_partial=partial,
+            convert_choices_to_enum=convert_choices_to_enum,
+        )
+        output_fields = fields_for_serializer(
+            serializer,
+            only_fields,
+            exclude_fields,
+            registry,
+            is_input=False,
+            is_update=is_update,
+            is_partial=partial,
+            convert_choices_to_enum=convert_choices_to_enum,
+        )
+
+        if is_update:
+            input_fields = OrderedDict(
+                **{
+                    id_input_field: graphene.ID(
+                        required=True, description="ID of the object to update."
+                    )
+                },
+                **input_fields
+            )
+
+        base_name = re.sub("Payload$", "", name or cls.__name__)
+        item_input = type(
+            "{}ItemInput".format(base_name), (graphene.InputObjectType,), input_fields
+        )
+        item_type = type(
+            "{}Item".format(base_name), (graphene.ObjectType,), output_fields
+        )
+
+        _meta = SerializerMutationOptions(cls)
+        _meta.is_update = is_update
+        _meta.lookup_field = lookup_field
+        _meta.id_input_field = id_input_field
+        _meta.partial = partial
+        _meta.serializer_class = serializer_class
+        _meta.model_class = model_class
+        _meta.registry = registry
+        _meta.batch_size = batch_size
+        _meta.item_type = item_type
+        _meta.fields = OrderedDict(
+            items=Field(
+                graphene.List(graphene.NonNull(item_type)),
+                description="The written objects, null when any item is invalid.",
+            )
+        )
+
+        if node_class:
+            _meta.node_class = node_class
+
+        input_fields = OrderedDict(
+            items=graphene.List(
+                graphene.NonNull(item_input),
+                required=True,
+                description="The objects to write.",
+            )
+        )
+        input_fields = yank_fields_from_attrs(input_fields, _as=InputField)
+        super(SerializerBaseClientIDMutation, cls).__init_subclass_with_meta__(
+            _meta=_meta, input_fields=input_fields, name=name, **options
+        )
+
+    @classmethod
+    def format_item_errors(cls, idx, errors):
+        return cls.format_errors(
+            errors, field="items[{}].".format(idx), path=["items", idx]
+        )
+
+    @classmethod
+    def get_items_payload(cls, serializer, objs):
+        item_type = cls._meta.item_type
+        return cls(
+            errors=None,
+            items=[item_type(**cls.get_output_values(serializer, obj)) for obj in objs],
+        )
+
+
+class SerializerClientIDBulkCreateMutation(SerializerBaseBulkClientIDMutation):
+    """
+    Creates the objects of a list of `items`, validated together with a
+    ListSerializer of `serializer_class` and inserted with a bulk_create in
+    a single transaction.
+
+    On the database backends that don't return the primary keys from bulk
+    inserts, like SQLite, the objects are saved one by one instead so they
+    get their primary keys and many-to-many relations.
+    """
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def get_serializer_kwargs(cls, root, info, **input):
+        kwargs = super().get_serializer_kwargs(root, info, **input)
+        kwargs["data"] = input.get("items", [])
+        kwargs["many"] = True
+        return kwargs
+
+    @classmethod
+    def handle_serializer_errors(cls, serializer):
+        errors = serializer.errors
+        if isinstance(errors, dict):
+            return cls(errors=cls.format_errors(errors))
+
+        formatted_errors = []
+        for idx, item_errors in enumerate(errors):
+            if item_errors:
+                formatted_errors += cls.format_item_errors(idx, item_errors)
+        return cls(errors=formatted_errors)
+
+    @classmethod
+    def perform_bulk_create(cls, serializer, info):
+        """
+        Inserts the validated items with a bulk_create, or a save per object
+        when the database doesn't return their primary keys, then sets their
+        many-to-many relations. Returns the created objects.
+
+        Sends bulk_changed after a bulk_create, which doesn't send post_save,
+        so the node and count caches of the model are invalidated.
+        """
+        model_class = cls._meta.model_class
+        using = router.db_for_write(model_class)
+        many_to_many = [field.name for field in model_class._meta.many_to_many]
+
+        objs = []
+        relations = []
+        for attrs in serializer.validated_data:
+            attrs = dict(attrs)
+            relations.append(
+                {name: attrs.pop(name) for name in many_to_many if name in attrs}
+            )
+            objs.append(model_class(**attrs))
+
+        if connections[using].features.can_return_rows_from_bulk_insert:
+            objs = model_class._default_manager.db_manager(using).bulk_create(
+                objs, batch_size=cls._meta.batch_size
+            )
+            bulk_changed.send(sender=model_class, instances=objs)
+        else:
+            for obj in objs:
+                obj.save(using=using)
+
+        for obj, values in zip(objs, relations):
+            for name, value in values.items():
+                getattr(obj, name).set(value)
+        return objs
+
+    @classmethod
+    def perform_mutate(cls, serializer, info):
+        model_class = cls._meta.model_class
+        with transaction.atomic(using=router.db_for_write(model_class)):
+            objs = cls.perform_bulk_create(serializer, info)
+
+        return cls.get_items_payload(serializer.child, objs)
+
+
 class SerializerClientIDUpdateMutation(SerializerBaseClientIDMutation):
     class Meta:
         abstract = True
@@ -305,3 +537,183 @@ class SerializerClientIDUpdateMutation(SerializerBaseClientIDMutation):
             )
 
         return instance
+
+
+class SerializerClientIDBulkUpdateMutation(SerializerBaseBulkClientIDMutation):
+    """
+    Updates the objects of a list of `items`, each identified by the global
+    ID of its `id_input_field` and validated by its own `serializer_class`,
+    partially when `partial` is set. The objects are loaded with one query
+    per type and saved in a single transaction, with a bulk_update per set
+    of changed fields. Objects that didn't change aren't saved.
+
+    Unlike SerializerClientIDUpdateMutation, an ID that doesn't match any
+    object is reported in the item's `errors` instead of raising Http404.
+    """
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def __init_subclass_with_meta__(cls, id_input_field="id", **options):
+        super(SerializerClientIDBulkUpdateMutation, cls).__init_subclass_with_meta__(
+            is_update=True, id_input_field=id_input_field, **options
+        )
+
+    @classmethod
+    def get_instances(cls, root, info, global_ids):
+        """
+        Decodes `global_ids` and loads their objects with a get_nodes per
+        type, returns them in the order of `global_ids` with None for the
+        IDs that are invalid, of another type or don't match any object.
+        """
+        node_class = cls._meta.node_class
+        registry = cls._meta.registry if cls._meta.registry else global_registry
+        model_type = registry.get_type_for_model(cls._meta.model_class)
+
+        ids_by_type = OrderedDict()
+        keys = []
+        for global_id in global_ids:
+            try:
+                _type, _id = node_class.from_global_id(global_id)
+            except Exception:
+                keys.append(None)
+                continue
+            keys.append((_type, _id))
+            ids_by_type.setdefault(_type, OrderedDict())[_id] = None
+
+        nodes = {}
+        for _type, ids in ids_by_type.items():
+            graphene_type = getattr(info.schema.get_type(_type), "graphene_type", None)
+            if graphene_type is None or graphene_type != model_type:
+                continue
+
+            ids = list(ids)
+            get_nodes = getattr(graphene_type, "get_nodes", None)
+            if get_nodes:
+                loaded = get_nodes(info, ids)
+            else:
+                loaded = [graphene_type.get_node(info, _id) for _id in ids]
+            nodes.update(((_type, _id), node) for _id, node in zip(ids, loaded))
+
+        return [nodes.get(key) for key in keys]
+
+    @classmethod
+    def get_serializers(cls, root, info, instances, **input):
+        id_input_field = cls._meta.id_input_field
+        kwargs = super().get_serializer_kwargs(root, info, **input)
+
+        item_serializers = []
+        for instance, item in zip(instances, input.get("items", [])):
+            data = {k: v for k, v in item.items() if k != id_input_field}
+            item_serializers.append(
+                cls._meta.serializer_class(**dict(kwargs, instance=instance, data=data))
+            )
+        return item_serializers
+
+    @classmethod
+    def mutate_and_get_payload(cls, root, info, **input):
+        id_input_field = cls._meta.id_input_field
+        items = input.get("items", [])
+        instances = cls.get_instances(
+            root, info, [item.get(id_input_field) for item in items]
+        )
+
+        errors = []
+        for idx, instance in enumerate(instances):
+            if instance is None:
+                errors += cls.format_item_errors(
+                    idx,
+                    {
+                        id_input_field: [
+                            "No %s matches the given query."
+                            % cls._meta.model_class._meta.object_name
+                        ]
+                    },
+                )
+        if errors:
+            return cls(errors=errors)
+
+        item_serializers = cls.get_serializers(root, info, instances, **input)
+        for idx, serializer in enumerate(item_serializers):
+            if not serializer.is_valid():
+                errors += cls.format_item_errors(idx, serializer.errors)
+        if errors:
+            return cls(errors=errors)
+
+        return cls.perform_mutate(item_serializers, info)
+
+    @classmethod
+    def has_changed(cls, obj, name, value):
+        """
+        Whether setting `value` on the `name` field changes `obj`, comparing
+        the keys of foreign keys so their objects aren't fetched.
+        """
+        try:
+            field = obj._meta.get_field(name)
+        except FieldDoesNotExist:
+            return True
+
+        if field.many_to_one or field.one_to_one:
+            return getattr(obj, field.attname) != getattr(
+                value, field.target_field.attname, None
+            )
+        return getattr(obj, name) != value
+
+    @classmethod
+    def perform_bulk_update(cls, item_serializers, info):
+        """
+        Sets the validated data of every serializer on its instance, then
+        saves the objects that changed with a bulk_update per set of changed
+        fields and sets the many-to-many relations. Returns the updated
+        objects.
+
+        Sends bulk_changed for the saved objects, as bulk_update doesn't send
+        post_save, so the node and count caches of the model are invalidated.
+        """
+        model_class = cls._meta.model_class
+        many_to_many = {field.name for field in model_class._meta.many_to_many}
+
+        objs = []
+        objs_by_fields = OrderedDict()
+        relations = []
+        for serializer in item_serializers:
+            obj = serializer.instance
+            fields = []
+            values = {}
+            for name, value in serializer.validated_data.items():
+                if name in many_to_many:
+                    values[name] = value
+                elif cls.has_changed(obj, name, value):
+                    setattr(obj, name, value)
+                    fields.append(name)
+            if fields:
+                objs_by_fields.setdefault(tuple(sorted(fields)), []).append(obj)
+            objs.append(obj)
+            relations.append(values)
+
+        changed = []
+        for fields, fields_objs in objs_by_fields.items():
+            model_class._default_manager.bulk_update(
+                fields_objs, fields, batch_size=cls._meta.batch_size
+            )
+            changed += fields_objs
+        if changed:
+            bulk_changed.send(sender=model_class, instances=changed)
+
+        for obj, values in zip(objs, relations):
+            for name, value in values.items():
+                getattr(obj, name).set(value)
+        return objs
+
+    @classmethod
+    def perform_mutate(cls, item_serializers, info):
+        model_class = cls._meta.model_class
+        with transaction.atomic(using=router.db_for_write(model_class)):
+            objs = cls.perform_bulk_update(item_serializers, info)
+
+        if item_serializers:
+            serializer = item_serializers[0]
+        else:
+            serializer = cls._meta.serializer_class()
+        return cls.get_items_payload(serializer, objs)
@@ -1,9 +1,12 @@
 from functools import partial
 
+from graphene import Field, ID, List, NonNull
 from graphene.types.utils import get_type
 from graphene.relay import node as graphene_node
+from promise import Promise
 
-from ..permissions import check_permission_classes, check_throttle_classes
+from ..loaders import get_node_loader
+from ..permissions import check_classes
 
 
 class PlusNodeField(graphene_node.NodeField):
@@ -22,16 +25,82 @@ class PlusNodeField(graphene_node.NodeField):
         )
 
 
+class PlusNodesField(Field):
+    def __init__(self, node, type=False, **kwargs):
+        assert issubclass(node, PlusNode), "PlusNodesField can only operate in PlusNodes"
+        self.node_type = node
+        self.field_type = type
+        self.permission_classes = kwargs.pop("permission_classes", None)
+        self.throttle_classes = kwargs.pop("throttle_classes", None)
+
+        kwargs.setdefault("description", "The IDs of the objects")
+        kwargs.setdefault("required", True)
+
+        super(PlusNodesField, self).__init__(
+            List(type or node), ids=List(NonNull(ID), required=True), **kwargs
+        )
+
+    def get_resolver(self, parent_resolver):
+        return partial(
+            self.node_type.nodes_resolver,
+            get_type(self.field_type),
+            self.permission_classes,
+            self.throttle_classes,
+        )
+
+
 class PlusNode(graphene_node.Node):
     @classmethod
     def Field(cls, *args, **kwargs):  # noqa: N802
         return PlusNodeField(cls, *args, **kwargs)
 
+    @classmethod
+    def NodesField(cls, *args, **kwargs):  # noqa: N802
+        return PlusNodesField(cls, *args, **kwargs)
+
     @classmethod
     def node_resolver(
         cls, only_type, permission_classes, throttle_classes, root, info, id
     ):
-        check_permission_classes(info, cls, permission_classes)
-        check_throttle_classes(info, cls, throttle_classes)
+        check_classes(info, cls, permission_classes, throttle_classes)
+
+        return cls.load_node_from_global_id(info, id, only_type=only_type)
+
+    @classmethod
+    def nodes_resolver(
+        cls, only_type, permission_classes, throttle_classes, root, info, ids
+    ):
+        check_classes(info, cls, permission_classes, throttle_classes)
+
+        return Promise.all(
+            [cls.load_node_from_global_id(info, id, only_type=only_type) for id in ids]
+        )
+
+    @classmethod
+    def load_node_from_global_id(cls, info, global_id, only_type=None):
+        """
+        Like get_node_from_global_id, but types that implement get_nodes are
+        loaded through the request's node loaders so ids of the same type are
+        fetched together.
+        """
+        try:
+            _type, _id = cls.from_global_id(global_id)
+            graphene_type = info.schema.get_type(_type).graphene_type
+        except Exception:
+            return None
+
+        if only_type:
+            assert graphene_type == only_type, ("Must receive a {} id.").format(
+                only_type._meta.name
+            )
+
+        # We make sure the ObjectType implements the "Node" interface
+        if cls not in graphene_type._meta.interfaces:
+            return None
+
+        if getattr(graphene_type, "get_nodes", None):
+            return get_node_loader(info, graphene_type).load(_id)
 
-        return super().node_resolver(only_type, root, info, id)
+        get_node = getattr(graphene_type, "get_node", None)
+        if get_node:
+            return get_node(info, _id)
@@ -0,0 +1,38 @@
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+BOUNDARY = "-"
+MULTIPART_CONTENT_TYPE = 'multipart/mixed; boundary="{}"; deferSpec=20220824'.format(BOUNDARY)
+
+
+def encode_multipart(payloads):
+    """
+    Encodes the payloads of an incremental delivery as the parts of a
+    multipart/mixed body, yielding each part as soon as it's available.
+    """
+    renderer = JSONRenderer()
+    for payload in payloads:
+        yield b"".join(
+            [
+                "\r\n--{}\r\n".format(BOUNDARY).encode(),
+                b"Content-Type: application/json; charset=utf-8\r\n\r\n",
+                renderer.render(payload),
+            ]
+        )
+    yield "\r\n--{}--\r\n".format(BOUNDARY).encode()
+
+
+class MultipartMixedRenderer(BaseRenderer):
+    """
+    Renders a response as a single part multipart/mixed body, for clients
+    that only accept incremental delivery.
+    """
+
+    media_type = "multipart/mixed"
+    format = "multipart"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        response = (renderer_context or {}).get("response")
+        if response is not None:
+            response["Content-Type"] = MULTIPART_CONTENT_TYPE
+        return b"".join(encode_multipart([data]))
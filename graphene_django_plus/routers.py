@@ -51,6 +51,9 @@ class TestRouter:
                                 filterset_class=filterset_class,
                                 permission_classes=permission_classes,
                                 throttle_classes=throttle_classes,
+                                keyset_pagination=field_type.keyset_pagination,
+                                count_strategy=field_type.count_strategy,
+                                facets=field_type.facets,
                             ),
                         )
                     )
@@ -62,6 +65,8 @@ class TestRouter:
                                 field_type.get_object_type("list"),
                                 permission_classes=permission_classes,
                                 throttle_classes=throttle_classes,
+                                keyset_pagination=field_type.keyset_pagination,
+                                count_strategy=field_type.count_strategy,
                             ),
                         )
                     )
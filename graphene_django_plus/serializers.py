@@ -1,6 +1,8 @@
 import binascii
 from collections import OrderedDict
+from collections.abc import Mapping
 
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.utils.translation import gettext_lazy as _
 
 import graphene
@@ -75,7 +77,11 @@ class SerializerRelayIDField(serializers.CharField):
 
                 get_node = getattr(graphene_type, "get_node", None)
                 if get_node:
-                    instance = get_node(info, _id)
+                    nodes = self.get_batched_nodes(info)
+                    if (graphene_type, _id) in nodes:
+                        instance = nodes[(graphene_type, _id)]
+                    else:
+                        instance = get_node(info, _id)
 
                     if not instance:
                         self.fail(
@@ -87,6 +93,95 @@ class SerializerRelayIDField(serializers.CharField):
 
         return None
 
+    def get_batched_nodes(self, info):
+        """
+        Nodes for every relay ID in the root serializer's input, loaded once
+        per serializer with one query per type.
+        """
+        root = self.root
+        if not hasattr(root, "_relay_id_nodes"):
+            root._relay_id_nodes = get_relay_id_nodes(
+                root, getattr(root, "initial_data", None), info
+            )
+        return root._relay_id_nodes
+
+
+def collect_relay_ids(serializer, data):
+    """
+    Returns (field, value) for the values given to SerializerRelayIDFields,
+    including list children and nested serializers, in `data`.
+    """
+    values = []
+
+    if isinstance(serializer, serializers.ListSerializer):
+        if isinstance(data, list):
+            for item in data:
+                values += collect_relay_ids(serializer.child, item)
+        return values
+
+    if not isinstance(data, Mapping):
+        return values
+
+    for field in serializer.fields.values():
+        if field.read_only or data.get(field.field_name) is None:
+            continue
+
+        value = data.get(field.field_name)
+        if isinstance(field, SerializerRelayIDField):
+            values.append((field, value))
+        elif isinstance(field, serializers.ListField) and isinstance(
+            field.child, SerializerRelayIDField
+        ):
+            if isinstance(value, list):
+                values += [(field.child, item) for item in value]
+        elif isinstance(field, serializers.BaseSerializer):
+            values += collect_relay_ids(field, value)
+
+    return values
+
+
+def get_relay_id_nodes(serializer, data, info):
+    """
+    Loads the nodes of the relay IDs in `data` grouped by type, returning
+    {(graphene_type, id): node}. IDs that SerializerRelayIDField would reject
+    before looking them up are left out.
+    """
+    ids_by_type = OrderedDict()
+
+    for field, value in collect_relay_ids(serializer, data):
+        if field.method_name or not isinstance(value, str):
+            continue
+
+        try:
+            _type, _id = from_global_id(value)
+            graphene_type = info.schema.get_type(_type).graphene_type
+        except Exception:
+            continue
+
+        if not _id or (field.object_type and graphene_type != field.object_type):
+            continue
+        if field.node_class not in graphene_type._meta.interfaces:
+            continue
+        if not getattr(graphene_type, "get_nodes", None):
+            continue
+
+        ids = ids_by_type.setdefault(graphene_type, [])
+        if _id not in ids:
+            ids.append(_id)
+
+    nodes = {}
+    for graphene_type, ids in ids_by_type.items():
+        try:
+            batch = graphene_type.get_nodes(info, ids)
+        except (ValueError, TypeError, DjangoValidationError):
+            # Let each field report its own lookup error.
+            continue
+
+        for _id, node in zip(ids, batch):
+            nodes[(graphene_type, _id)] = node
+
+    return nodes
+
 
 def convert_serializer_field(field, registry, is_input=True, is_partial=False, convert_choices_to_enum=True):
     """
@@ -0,0 +1,6 @@
+from django.dispatch import Signal
+
+# Sent by the bulk mutations after writing `instances` of the `sender` model
+# with bulk_create or bulk_update, which don't send post_save. NodeCache and
+# CachedCount are invalidated by it as by post_save.
+bulk_changed = Signal()
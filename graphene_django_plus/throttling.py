@@ -0,0 +1,191 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework.throttling import (
+    AnonRateThrottle,
+    ScopedRateThrottle,
+    SimpleRateThrottle,
+    UserRateThrottle,
+)
+
+from .exceptions import OperationCostExceeded
+
+
+def incr(cache, key, timeout, delta=1, initial=0):
+    """
+    Atomically increments the counter at `key` by `delta`, creating it from
+    `initial` with `timeout` when it doesn't exist.
+    """
+    try:
+        return cache.incr(key, delta)
+    except ValueError:
+        if cache.add(key, initial + delta, timeout):
+            return initial + delta
+        return cache.incr(key, delta)
+
+
+class CounterRateThrottle(SimpleRateThrottle):
+    """
+    Base class of the throttles that count the requests of a key per window
+    of the rate's duration with atomic cache increments, instead of storing
+    the time of every request. Requests that are throttled aren't counted.
+    """
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        self.window = int(self.now // self.duration)
+        self.elapsed = self.now - self.window * self.duration
+        if self.count_request():
+            return True
+
+        self.cache.decr(self.get_window_key(self.window))
+        return False
+
+    def get_window_key(self, window):
+        return "{}:{}".format(self.key, window)
+
+    def count_request(self):
+        """
+        Counts the request in the current window, returning whether it is
+        allowed.
+        """
+        raise NotImplementedError(".count_request() must be overridden")
+
+
+class FixedWindowRateThrottle(CounterRateThrottle):
+    """
+    Allows `num_requests` per window, the count is reset when a window ends.
+    """
+
+    def count_request(self):
+        self.count = incr(self.cache, self.get_window_key(self.window), self.duration)
+        return self.count <= self.num_requests
+
+    def wait(self):
+        return self.duration - self.elapsed
+
+
+class SlidingWindowRateThrottle(CounterRateThrottle):
+    """
+    Allows `num_requests` over the last `duration` seconds, estimated from
+    the counts of the current and the previous windows, the latter weighted
+    by the part of it that is still in the last `duration` seconds.
+    """
+
+    def count_request(self):
+        key = self.get_window_key(self.window)
+        # The count is kept for the following window.
+        self.count = incr(self.cache, key, 2 * self.duration)
+        self.previous_count = self.cache.get(self.get_window_key(self.window - 1), 0)
+        weight = 1 - self.elapsed / self.duration
+        return self.previous_count * weight + self.count <= self.num_requests
+
+    def wait(self):
+        # The request wasn't counted, so `count - 1` requests are in the
+        # current window.
+        count = self.count - 1
+        if count < self.num_requests and self.previous_count:
+            # Until enough of the previous window slides out.
+            ends = 1 - (self.num_requests - count - 1) / self.previous_count
+            return max(0, self.duration * ends - self.elapsed)
+
+        # Until enough of the current window slides out of the next one.
+        ends = max(0, 1 - (self.num_requests - 1) / count) if count else 0
+        return self.duration - self.elapsed + self.duration * ends
+
+
+class FixedWindowAnonRateThrottle(FixedWindowRateThrottle, AnonRateThrottle):
+    pass
+
+
+class FixedWindowUserRateThrottle(FixedWindowRateThrottle, UserRateThrottle):
+    pass
+
+
+class FixedWindowScopedRateThrottle(FixedWindowRateThrottle, ScopedRateThrottle):
+    pass
+
+
+class SlidingWindowAnonRateThrottle(SlidingWindowRateThrottle, AnonRateThrottle):
+    pass
+
+
+class SlidingWindowUserRateThrottle(SlidingWindowRateThrottle, UserRateThrottle):
+    pass
+
+
+class SlidingWindowScopedRateThrottle(SlidingWindowRateThrottle, ScopedRateThrottle):
+    pass
+
+
+class CostRateThrottle(SimpleRateThrottle):
+    """
+    Token bucket charging each operation its estimated cost instead of
+    counting requests, see DocumentCostAnalysis. The bucket holds
+    `num_requests` tokens and is refilled at `num_requests` per `duration`.
+
+    The bucket is stored as the time in milliseconds at which it is full
+    again, pushed back by the cost of each operation with an atomic incr,
+    and refunded with a decr when the operation is throttled. The entry
+    expires when the bucket is full. Operations that cost more than the
+    bucket holds raise OperationCostExceeded.
+
+    GraphQLAPIView checks these throttles once the document has been parsed
+    and its cost set on the request as `graphql_cost`, operations without a
+    cost are charged a single token.
+    """
+
+    def get_cost(self, request, view):
+        cost = getattr(request, "graphql_cost", None)
+        return 1 if cost is None else cost
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.cost = self.get_cost(request, view)
+        if self.cost > self.num_requests:
+            detail = _(
+                "The operation costs {cost}, more than the {limit} allowed "
+                "per {duration} seconds."
+            )
+            raise OperationCostExceeded(
+                detail.format(cost=self.cost, limit=self.num_requests, duration=self.duration)
+            )
+
+        now = int(self.timer() * 1000)
+        capacity = self.duration * 1000
+        charge = int(self.cost * capacity / self.num_requests)
+        full_at = incr(self.cache, self.key, self.duration, charge, now)
+        # A bucket that was full when charged starts from now.
+        self.refill = max(full_at - charge, now) + charge - now
+        if self.refill > capacity:
+            self.cache.decr(self.key, charge)
+            return False
+
+        self.cache.touch(self.key, self.refill / 1000)
+        return True
+
+    def wait(self):
+        return (self.refill - self.duration * 1000) / 1000
+
+
+class CostAnonRateThrottle(CostRateThrottle, AnonRateThrottle):
+    pass
+
+
+class CostUserRateThrottle(CostRateThrottle, UserRateThrottle):
+    pass
+
+
+class CostScopedRateThrottle(CostRateThrottle, ScopedRateThrottle):
+    pass
@@ -6,12 +6,18 @@ from graphene.types.unmountedtype import UnmountedType
 from graphene_django.utils import camelize
 from graphene_django.settings import graphene_settings
 
+from .identity_map import get_identity_map
+from .loaders import loader_resolver
+from .node_cache import NodeCache
 from .registry import get_global_registry
 from .relay.connection import DjangoConnection
 
 
 class DjangoObjectTypeOptions(graphene_django.types.DjangoObjectTypeOptions):
     id_field = None  # type: str
+    use_loaders = False  # type: bool
+    node_cache = None  # type: NodeCache
+    aggregates = ()  # type: tuple
 
 
 class DjangoObjectType(graphene_django.types.DjangoObjectType):
@@ -36,12 +42,18 @@ class DjangoObjectType(graphene_django.types.DjangoObjectType):
         use_connection=None,
         interfaces=(),
         convert_choices_to_enum=True,
+        use_loaders=False,
+        node_cache=None,
+        aggregates=(),
         _meta=None,
         **options
     ):
         if not id_field:
             id_field = "pk"
 
+        if use_loaders:
+            options.setdefault("default_resolver", loader_resolver)
+
         if not _meta:
             _meta = DjangoObjectTypeOptions(cls)
 
@@ -52,8 +64,16 @@ class DjangoObjectType(graphene_django.types.DjangoObjectType):
             registry = get_global_registry()
 
         _meta.id_field = id_field
+        _meta.use_loaders = use_loaders
+        _meta.aggregates = tuple(aggregates)
+
+        if node_cache is True:
+            node_cache = NodeCache()
+        if node_cache:
+            node_cache.bind(model, id_field)
+        _meta.node_cache = node_cache
 
-        return super().__init_subclass_with_meta__(
+        super().__init_subclass_with_meta__(
             model,
             registry,
             skip_registry,
@@ -72,16 +92,74 @@ class DjangoObjectType(graphene_django.types.DjangoObjectType):
             **options
         )
 
+        if _meta.aggregates:
+            assert _meta.connection and issubclass(_meta.connection, DjangoConnection), (
+                "The type {} needs a DjangoConnection to declare aggregates"
+            ).format(cls.__name__)
+            _meta.connection.add_aggregates_field(cls)
+
     def resolve_id(self, info):
         return getattr(self, info.parent_type.graphene_type._meta.id_field)
 
     @classmethod
     def get_node(cls, info, id):
-        queryset = cls.get_queryset(cls._meta.model.objects, info)
-        try:
-            return queryset.get(**{cls._meta.id_field: id})
-        except cls._meta.model.DoesNotExist:
-            return None
+        id_field = cls._meta.id_field
+        identity_map = get_identity_map(info)
+
+        node = identity_map.get(cls, id, id_field)
+        if node is not None:
+            return node
+
+        def load():
+            queryset = cls.get_queryset(cls._meta.model.objects, info)
+            try:
+                return queryset.get(**{id_field: id})
+            except cls._meta.model.DoesNotExist:
+                return None
+
+        node_cache = cls._meta.node_cache
+        node = node_cache.get(id, load) if node_cache else load()
+        if node is not None:
+            identity_map.add(cls, node, id_field)
+        return node
+
+    @classmethod
+    def get_nodes(cls, info, ids):
+        """
+        Batched get_node, returns the nodes in the order of ids with None for
+        the ones that don't exist. Falls back to get_node when it is overridden.
+        """
+        if cls.get_node.__func__ is not DjangoObjectType.get_node.__func__:
+            return [cls.get_node(info, id) for id in ids]
+
+        id_field = cls._meta.id_field
+        identity_map = get_identity_map(info)
+        node_cache = cls._meta.node_cache
+
+        nodes = {}
+        for id in ids:
+            node = identity_map.get(cls, id, id_field)
+            if node is not None:
+                nodes[str(id)] = node
+
+        missing_ids = [id for id in ids if str(id) not in nodes]
+        if node_cache and missing_ids:
+            cached, version = node_cache.get_many(missing_ids)
+            for node in cached.values():
+                identity_map.add(cls, node, id_field)
+            nodes.update(cached)
+            missing_ids = [id for id in missing_ids if str(id) not in nodes]
+
+        if missing_ids:
+            queryset = cls.get_queryset(cls._meta.model.objects, info)
+            loaded = list(queryset.filter(**{"{}__in".format(id_field): missing_ids}))
+            if node_cache and loaded:
+                node_cache.set_many(loaded, version)
+            for node in loaded:
+                identity_map.add(cls, node, id_field)
+                nodes[str(getattr(node, id_field))] = node
+
+        return [nodes.get(str(id)) for id in ids]
 
 
 # from textwrap import dedent
@@ -8,6 +8,13 @@ class RelayTypeSet:
 
     filterset_class = None
 
+    keyset_pagination = False
+    count_strategy = None
+
+    # Filters of filterset_class whose counts per value are returned in the
+    # `facets` field of the connection.
+    facets = ()
+
     @classmethod
     def get_operations(cls):
         assert cls.operations is not None, (
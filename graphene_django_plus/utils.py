@@ -0,0 +1,27 @@
+import itertools
+
+from django.db.models import prefetch_related_objects
+from django.db.models.query import QuerySet
+
+
+def iterate_chunks(iterable, chunk_size):
+    """
+    Yields lists of up to `chunk_size` items of `iterable`.
+
+    Querysets are fetched with iterator(), which uses server-side cursors
+    where supported. As iterator() ignores prefetch_related, the lookups
+    are prefetched per chunk instead.
+    """
+    lookups = ()
+    if isinstance(iterable, QuerySet):
+        lookups = iterable._prefetch_related_lookups
+        iterable = iterable.iterator(chunk_size=chunk_size)
+
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        if lookups:
+            prefetch_related_objects(chunk, *lookups)
+        yield chunk
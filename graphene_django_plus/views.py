@@ -4,7 +4,8 @@ import copy
 
 import six
 
-from graphql import get_default_backend, MiddlewareManager
+from django.http import StreamingHttpResponse
+from graphql import get_default_backend, MiddlewareManager, validate
 from graphql.error import format_error as format_graphql_error
 from graphql.error import GraphQLError
 from graphql.execution import ExecutionResult
@@ -19,8 +20,16 @@ from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.renderers import JSONRenderer, TemplateHTMLRenderer
 
 from graphene_django.settings import graphene_settings
+from .authorization import authorize_document
+from .cost import get_document_cost
 from .exceptions import InvalidDocument
+from .export import QueryExport
+from .identity_map import IdentityMap
+from .incremental import IncrementalExecution, has_incremental_directives
+from .loaders import LoaderRegistry
 from .parsers import GraphQLJSONParser, GraphQLParser, GraphQLPlainParser
+from .renderers import MULTIPART_CONTENT_TYPE, MultipartMixedRenderer, encode_multipart
+from .throttling import CostRateThrottle
 
 
 def exception_handler(exc, context):
@@ -86,8 +95,16 @@ class GraphQLAPIView(APIView):
     graphene_pretty = False
     graphene_validation_classes = []
     graphene_subscription_path = None
-
-    renderer_classes = (JSONRenderer, TemplateHTMLRenderer)
+    # Number of items of a field with @stream sent per payload.
+    graphene_stream_chunk_size = 100
+    # Number of items lists without a `first` or `last` argument are
+    # assumed to return by the cost analysis.
+    graphene_cost_default_list_size = 100
+    # Check the permission and throttle classes of every selected field
+    # before executing the operation, rejecting it as a whole.
+    graphene_authorize_document = False
+
+    renderer_classes = (JSONRenderer, TemplateHTMLRenderer, MultipartMixedRenderer)
     parser_classes = (
         GraphQLJSONParser,
         GraphQLParser,
@@ -158,7 +175,14 @@ class GraphQLAPIView(APIView):
         return self.graphene_middleware
 
     def get_graphene_context(self, request):
-        return {"view": self, "request": request}
+        return {
+            "view": self,
+            "request": request,
+            "loaders": LoaderRegistry(),
+            "identity_map": IdentityMap(),
+            "permission_cache": {},
+            "throttle_cache": {},
+        }
 
     def get_graphene_backend(self, request):
         return self.graphene_backend
@@ -182,6 +206,18 @@ class GraphQLAPIView(APIView):
         """
         return exception_handler
 
+    @staticmethod
+    def accepts_incremental_delivery(request):
+        """
+        Whether the client accepts @defer and @stream results as a
+        multipart/mixed response.
+        """
+        accept = request.META.get("HTTP_ACCEPT", "")
+        return any(
+            media_type.split(";")[0].strip() == "multipart/mixed"
+            for media_type in accept.split(",")
+        )
+
     @classmethod
     def can_display_graphiql(cls, request, data):
         raw = "raw" in request.GET or "raw" in data
@@ -213,7 +249,13 @@ class GraphQLAPIView(APIView):
         return {"message": six.text_type(error)}
 
     def execute_graphql_request(
-        self, request, query, variables, operation_name, show_graphiql=False
+        self,
+        request,
+        query,
+        variables,
+        operation_name,
+        show_graphiql=False,
+        incremental=False,
     ):
         if not query:
             if show_graphiql:
@@ -242,8 +284,37 @@ class GraphQLAPIView(APIView):
         # Check validation
         self.check_document_validators(document)
 
+        extra_options = {}
+        if self.get_cost_throttles():
+            # Invalid documents are rejected before their cost is charged,
+            # they aren't validated again when executed.
+            validation_errors = validate(self.graphene_schema, document.document_ast)
+            if validation_errors:
+                return ExecutionResult(errors=validation_errors, invalid=True)
+            extra_options["validate"] = False
+            self.check_document_cost(request, document, variables, operation_name)
+
+        context = self.get_graphene_context(request)
+        if self.graphene_authorize_document:
+            authorize_document(
+                self.graphene_schema, document.document_ast, context, operation_name, variables
+            )
+
+        if (
+            incremental
+            and document.get_operation_type(operation_name) == "query"
+            and has_incremental_directives(document.document_ast)
+        ):
+            return self.execute_incremental_graphql_request(
+                request,
+                document,
+                variables,
+                operation_name,
+                context,
+                validated=not extra_options.get("validate", True),
+            )
+
         try:
-            extra_options = {}
             if self.graphene_executor:
                 # We only include it optionally since
                 # executor is not a valid argument in all backends
@@ -253,13 +324,43 @@ class GraphQLAPIView(APIView):
                 root_value=self.get_graphene_root_value(request),
                 variable_values=variables,
                 operation_name=operation_name,
-                context_value=self.get_graphene_context(request),
+                context_value=context,
                 middleware=self.get_graphene_middleware(request),
                 **extra_options
             )
         except Exception as e:
             return ExecutionResult(errors=[e], invalid=True)
 
+    def execute_incremental_graphql_request(
+        self, request, document, variables, operation_name, context=None, validated=False
+    ):
+        """
+        Returns an IncrementalExecution of a query using @defer or @stream.
+        """
+        if context is None:
+            context = self.get_graphene_context(request)
+
+        if not validated:
+            validation_errors = validate(self.graphene_schema, document.document_ast)
+            if validation_errors:
+                return ExecutionResult(errors=validation_errors, invalid=True)
+
+        try:
+            return IncrementalExecution(
+                self.graphene_schema,
+                document.document_ast,
+                root_value=self.get_graphene_root_value(request),
+                context_value=context,
+                variable_values=variables,
+                operation_name=operation_name,
+                executor=self.graphene_executor,
+                middleware=self.get_graphene_middleware(request),
+                chunk_size=self.graphene_stream_chunk_size,
+                format_error=lambda error: self.format_graphene_error(error, request),
+            )
+        except Exception as e:
+            return ExecutionResult(errors=[e], invalid=True)
+
     def get(self, request, format=None):
         return self.process_request(request, format)
 
@@ -312,15 +413,31 @@ class GraphQLAPIView(APIView):
                 template_name=self.graphiql_template,
             )
 
+        if inspect.isgenerator(result):
+            return StreamingHttpResponse(
+                encode_multipart(result), content_type=MULTIPART_CONTENT_TYPE
+            )
+
         return Response(result, status=status_code)
 
     def get_response(self, request, data, show_graphiql=False):
         query, variables, operation_name, id = self.get_graphql_params(request, data)
 
         execution_result = self.execute_graphql_request(
-            request, query, variables, operation_name, show_graphiql
+            request,
+            query,
+            variables,
+            operation_name,
+            show_graphiql,
+            incremental=not (self.graphene_batch or show_graphiql)
+            and self.accepts_incremental_delivery(request),
         )
 
+        execution = None
+        if isinstance(execution_result, IncrementalExecution):
+            execution = execution_result
+            execution_result = execution.execute_initial()
+
         status_code = 200
         if execution_result:
             response = {}
@@ -343,8 +460,21 @@ class GraphQLAPIView(APIView):
         else:
             result = None
 
+        if execution is not None and execution.has_next:
+            result = self.get_incremental_payloads(result, execution)
+
         return result, status_code
 
+    @staticmethod
+    def get_incremental_payloads(result, execution):
+        """
+        Yields the initial payload, then executes and yields the following
+        ones as the response is streamed.
+        """
+        result["hasNext"] = True
+        yield result
+        yield from execution.execute_subsequent()
+
     def document_invalid(self, document, message=None):
         """
         If document is invalid, determine what kind of exception to raise.
@@ -369,4 +499,130 @@ class GraphQLAPIView(APIView):
             if not document_validator.allow_document(document, self):
                 self.document_invalid(
                     document, message=getattr(document_validator, "message", None)
-                )
\ No newline at end of file
+                )
+
+    def get_throttles(self):
+        """
+        Instantiates and returns the list of throttles checked before the
+        document is parsed, the CostRateThrottles are checked afterwards.
+        """
+        return [
+            throttle
+            for throttle in super().get_throttles()
+            if not isinstance(throttle, CostRateThrottle)
+        ]
+
+    def get_cost_throttles(self):
+        """
+        Instantiates and returns the list of CostRateThrottles that this view uses.
+        """
+        return [
+            throttle()
+            for throttle in self.throttle_classes
+            if issubclass(throttle, CostRateThrottle)
+        ]
+
+    def get_document_cost(self, request, document, variables, operation_name):
+        return get_document_cost(
+            self.graphene_schema,
+            document.document_ast,
+            operation_name,
+            variables,
+            self.graphene_cost_default_list_size,
+        )
+
+    def check_document_cost(self, request, document, variables, operation_name):
+        """
+        Sets the estimated cost of the operation on the request, and charges
+        it to the CostRateThrottles. Documents are only walked when the view
+        has some, and should be validated first so that invalid ones aren't
+        charged.
+        Raises an appropriate exception if the request is throttled.
+        """
+        throttles = self.get_cost_throttles()
+        if not throttles:
+            return
+
+        request.graphql_cost = self.get_document_cost(
+            request, document, variables, operation_name
+        )
+        for throttle in throttles:
+            if not throttle.allow_request(request, self):
+                self.throttled(request, throttle.wait())
+
+
+class GraphQLExportAPIView(GraphQLAPIView):
+    """
+    Streams every node of the connection field selected by a query as
+    newline delimited JSON, one result per line, instead of paginating it.
+    See QueryExport.
+    """
+
+    graphene_batch = False
+    graphiql = False
+
+    # Number of rows fetched and resolved at a time.
+    graphene_export_chunk_size = 2000
+
+    renderer_classes = (JSONRenderer,)
+
+    def process_request(self, request, format=None):
+        query, variables, operation_name, id = self.get_graphql_params(
+            request, request.data
+        )
+        if not query:
+            raise exceptions.ValidationError({"message": "Must provide query string."})
+
+        try:
+            backend = self.get_graphene_backend(request)
+            document = backend.document_from_string(self.graphene_schema, query)
+            errors = validate(self.graphene_schema, document.document_ast)
+        except Exception as e:
+            errors = [e]
+        if not errors:
+            self.check_document_validators(document)
+            self.check_document_cost(request, document, variables, operation_name)
+            contexts = [self.get_graphene_context(request)]
+            if self.graphene_authorize_document:
+                authorize_document(
+                    self.graphene_schema,
+                    document.document_ast,
+                    contexts[0],
+                    operation_name,
+                    variables,
+                )
+            try:
+                results = QueryExport(
+                    self.graphene_schema,
+                    document.document_ast,
+                    # The authorized context is the first, the next chunks
+                    # share its caches, see QueryExport.shared_context_keys.
+                    lambda: contexts.pop() if contexts else self.get_graphene_context(request),
+                    root_value=self.get_graphene_root_value(request),
+                    variable_values=variables,
+                    operation_name=operation_name,
+                    executor=self.graphene_executor,
+                    middleware=self.get_graphene_middleware(request),
+                    chunk_size=self.graphene_export_chunk_size,
+                ).execute()
+            except exceptions.APIException:
+                raise
+            except Exception as e:
+                errors = [e]
+
+        if errors:
+            return Response(
+                {"errors": [self.format_graphene_error(e, request) for e in errors]},
+                status=400,
+            )
+
+        return StreamingHttpResponse(
+            (self.format_export_line(request, result) for result in results),
+            content_type="application/x-ndjson",
+        )
+
+    def format_export_line(self, request, result):
+        line = {"data": result.data}
+        if result.errors:
+            line["errors"] = [self.format_graphene_error(e, request) for e in result.errors]
+        return JSONRenderer().render(line) + b"\n"
@@ -0,0 +1,91 @@
+"""
+Per-field overhead of RootFieldPermissionMiddleware on a 10,000 field
+response, against no middleware and a no-op one, run with:
+
+    python -m tests.bench_middleware
+
+graphql-core wraps every resolver in a promise once any middleware is
+installed, which costs far more than the middleware itself unless the
+middleware is given as a MiddlewareManager with `wrap_in_promise=False`.
+"""
+import os
+import timeit
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.test_app.test_app.settings")
+django.setup()
+
+import graphene  # noqa: E402
+from graphql import MiddlewareManager  # noqa: E402
+from rest_framework.permissions import AllowAny  # noqa: E402
+
+from graphene_django_plus.middleware import RootFieldPermissionMiddleware  # noqa: E402
+
+ITEMS = 10000
+
+
+class Item(graphene.ObjectType):
+    value = graphene.Int()
+
+
+class Query(graphene.ObjectType):
+    items = graphene.List(Item)
+
+    def resolve_items(self, info):
+        return [{"value": i} for i in range(ITEMS)]
+
+
+class View:
+    resolver_permission_classes = [AllowAny]
+
+
+schema = graphene.Schema(query=Query)
+document = "{ items { value } }"
+
+
+def execute(middleware):
+    result = schema.execute(document, context_value={"view": View()}, middleware=middleware)
+    assert not result.errors, result.errors
+
+
+class NoopMiddleware:
+    def resolve(self, next, root, info, **args):
+        return next(root, info, **args)
+
+
+def timing(middleware, number, repeat):
+    return min(timeit.repeat(lambda: execute(middleware), number=number, repeat=repeat)) / number
+
+
+def main(number=3, repeat=3):
+    fields = ITEMS + 1
+    cases = [
+        ("no middleware", lambda: []),
+        ("no-op middleware", lambda: [NoopMiddleware()]),
+        ("RootFieldPermissionMiddleware", lambda: [RootFieldPermissionMiddleware()]),
+        (
+            "no-op middleware, no promises",
+            lambda: MiddlewareManager(NoopMiddleware(), wrap_in_promise=False),
+        ),
+        (
+            "RootFieldPermissionMiddleware, no promises",
+            lambda: MiddlewareManager(RootFieldPermissionMiddleware(), wrap_in_promise=False),
+        ),
+    ]
+
+    print("{} fields per response".format(fields))
+    baseline = None
+    for name, middleware in cases:
+        seconds = timing(middleware(), number, repeat)
+        if baseline is None:
+            baseline = seconds
+        print(
+            "{:<44} {:8.2f} ms  {:+7.3f} us/field".format(
+                name, seconds * 1000, (seconds - baseline) / fields * 1000000
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ from graphql_relay import to_global_id
 from rest_framework.test import APIClient
 
 from tests import factories
-from tests.test_app.test_app.app.models import Book
+from tests.test_app.test_app.app.models import Author, Book, Publisher
 
 
 class GraphQLClient(APIClient):
@@ -42,6 +42,26 @@ def graphql_depth_client():
     return GraphQLClient("graphql-depth")
 
 
+@pytest.fixture()
+def graphql_cost_client():
+    return GraphQLClient("graphql-cost")
+
+
+@pytest.fixture()
+def graphql_export_client():
+    return GraphQLClient("graphql-export")
+
+
+@pytest.fixture()
+def graphql_export_authorize_client():
+    return GraphQLClient("graphql-export-authorize")
+
+
+@pytest.fixture()
+def graphql_middleware_client():
+    return GraphQLClient("graphql-middleware")
+
+
 @pytest.fixture()
 def graphql_introspection_client():
     return GraphQLClient("graphql-introspection")
@@ -52,6 +72,11 @@ def graphql_auth_client():
     return GraphQLClient("graphql-auth")
 
 
+@pytest.fixture()
+def graphql_authorize_client():
+    return GraphQLClient("graphql-authorize")
+
+
 @pytest.fixture()
 def graphql_admin_client():
     return GraphQLClient("graphql-admin")
@@ -124,3 +149,13 @@ def book_factory(request):
 @pytest.fixture()
 def user_factory(request):
     return _factory(User, factories.UserFactory, request)
+
+
+@pytest.fixture()
+def author_factory(request):
+    return _factory(Author, factories.AuthorFactory, request)
+
+
+@pytest.fixture()
+def publisher_factory(request):
+    return _factory(Publisher, factories.PublisherFactory, request)
@@ -2,7 +2,7 @@ import factory
 from django.contrib.auth.models import User
 from django.utils import timezone
 
-from tests.test_app.test_app.app.models import Book
+from tests.test_app.test_app.app.models import Author, Book, Publisher
 
 
 class UserFactory(factory.django.DjangoModelFactory):
@@ -18,3 +18,19 @@ class BookFactory(factory.django.DjangoModelFactory):
 
     title = "book title"
     publication_date = factory.lazy_attribute(lambda o: timezone.now())
+
+
+class PublisherFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Publisher
+
+    name = factory.sequence(lambda n: f"publisher{n}")
+
+
+class AuthorFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Author
+
+    first_name = factory.sequence(lambda n: f"first{n}")
+    last_name = "last"
+    email = "author@example.com"
@@ -0,0 +1,96 @@
+from functools import partial
+from types import SimpleNamespace
+
+import graphene
+import pytest
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.permissions import IsAdminUser
+
+from graphene_django_plus import fields, permissions
+from graphene_django_plus.fields import DjangoPlusListField, PlusField, PlusListField
+from tests.test_app.test_app.app.types import AuthorType
+
+
+def resolver(root, info):
+    return root
+
+
+def test_fields_without_checks_install_the_bare_resolver():
+    for field_class in (PlusField, PlusListField):
+        field = field_class(
+            graphene.String, resolver=resolver, permission_classes=[], throttle_classes=[]
+        )
+        assert field.get_resolver(None) is resolver
+
+
+def test_fields_with_checks_wrap_the_resolver():
+    for field_class in (PlusField, PlusListField):
+        # The view's classes are only known once a request is resolved
+        field = field_class(graphene.String, resolver=resolver)
+        assert isinstance(field.get_resolver(None), partial)
+
+        field = field_class(
+            graphene.String,
+            resolver=resolver,
+            permission_classes=[IsAdminUser],
+            throttle_classes=[],
+        )
+        assert isinstance(field.get_resolver(None), partial)
+
+
+def test_list_fields_without_checks_skip_them(monkeypatch):
+    def check_classes(*args):
+        raise AssertionError("The field has no classes to check")
+
+    monkeypatch.setattr(fields, "check_classes", check_classes)
+    field_ast = SimpleNamespace(alias=None, name=SimpleNamespace(value="authors"))
+    info = SimpleNamespace(field_asts=[field_ast])
+
+    field_resolver = DjangoPlusListField(
+        AuthorType, permission_classes=[], throttle_classes=[]
+    ).get_resolver(resolver)
+    assert field_resolver(["author"], info) == ["author"]
+
+    field_resolver = DjangoPlusListField(AuthorType).get_resolver(resolver)
+    with pytest.raises(AssertionError):
+        field_resolver(["author"], info)
+
+
+class CountedView:
+    lookups = 0
+    permission_classes = []
+
+    @property
+    def resolver_permission_classes(self):
+        type(self).lookups += 1
+        return self.permission_classes
+
+    resolver_throttle_classes = []
+
+
+def test_fields_skip_the_checks_of_views_without_classes(monkeypatch):
+    def check_permission_classes(*args):
+        raise AssertionError("The view has no classes to check")
+
+    monkeypatch.setattr(permissions, "check_permission_classes", check_permission_classes)
+    CountedView.lookups = 0
+    info = SimpleNamespace(context={"view": CountedView()})
+
+    for field_class in (PlusField, PlusListField):
+        field_resolver = field_class(graphene.String, resolver=resolver).get_resolver(None)
+        for root in range(3):
+            assert field_resolver(root, info) == root
+
+    # The view's classes are looked up once per request
+    assert CountedView.lookups == 1
+
+
+def test_fields_check_the_classes_of_views():
+    view = CountedView()
+    view.permission_classes = [IsAdminUser]
+    request = SimpleNamespace(user=SimpleNamespace(is_staff=False))
+    info = SimpleNamespace(context={"view": view, "request": request})
+
+    field_resolver = PlusField(graphene.String, resolver=resolver).get_resolver(None)
+    with pytest.raises(PermissionDenied):
+        field_resolver(None, info)
@@ -0,0 +1,34 @@
+import pytest
+from rest_framework.utils import json
+
+from tests.test_app.test_app.permissions import (
+    CountedPermission,
+    UncachedCountedPermission,
+)
+
+
+@pytest.mark.django_db()
+def test_list_field_permission_verdicts_are_memoized(graphql_client):
+    CountedPermission.calls = 0
+    UncachedCountedPermission.calls = 0
+
+    response = graphql_client.execute(
+        """
+        query Other {
+            one: otherCounted
+            two: otherCounted
+            three: otherUncached
+            four: otherUncached
+        }"""
+    )
+
+    assert json.loads(response.content) == {
+        "data": {
+            "one": ["1", "2"],
+            "two": ["1", "2"],
+            "three": ["1", "2"],
+            "four": ["1", "2"],
+        }
+    }
+    assert CountedPermission.calls == 1
+    assert UncachedCountedPermission.calls == 2
@@ -1,4 +1,5 @@
 import pytest
+from django.core.cache import cache
 from graphql_relay import to_global_id
 from rest_framework.utils import json
 
@@ -34,3 +35,32 @@ def test_list_field_throttle_classes(graphql_client, user_factory):
             }
         ],
     }
+
+
+@pytest.mark.django_db()
+def test_list_field_throttle_classes_once_per_request(graphql_client, user_factory):
+    # Throttle histories are keyed by the user's pk, which can be reused
+    cache.clear()
+    user = user_factory()
+
+    graphql_client.force_authenticate(user)
+
+    query = """
+        query OtherThrottle {
+            one: otherThrottle
+            two: otherThrottle
+        }"""
+
+    # Request one, both fields count as a single request
+    response = graphql_client.execute(query)
+
+    assert response.status_code == 200
+    assert json.loads(response.content) == {
+        "data": {"one": ["1", "2"], "two": ["1", "2"]}
+    }
+
+    # Request two, throttled
+    response = graphql_client.execute(query)
+
+    assert response.status_code == 200
+    assert json.loads(response.content)["data"] == {"one": None, "two": None}
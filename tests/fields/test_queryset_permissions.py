@@ -0,0 +1,103 @@
+import pytest
+from rest_framework.utils import json
+
+
+@pytest.mark.django_db()
+def test_connection_field_permission_filter_queryset(
+    publisher_factory, book_factory, graphql_client
+):
+    publisher = publisher_factory()
+    book_factory(title="one", publisher=publisher)
+    book_factory(title="two", publisher=publisher, publication_date=None)
+    book_factory(title="three")
+
+    query = """
+        query Books {
+            booksPublished(first: 1) {
+                totalCount
+                edges { node { title } }
+                facets { name values { value count } }
+            }
+        }"""
+
+    response = graphql_client.execute(query)
+
+    assert json.loads(response.content) == {
+        "data": {
+            "booksPublished": {
+                "totalCount": 2,
+                "edges": [{"node": {"title": "one"}}],
+                "facets": [
+                    {
+                        "name": "publisher",
+                        "values": [
+                            {"value": str(publisher.pk), "count": 1},
+                            {"value": None, "count": 1},
+                        ],
+                    }
+                ],
+            }
+        }
+    }
+
+
+@pytest.mark.django_db()
+def test_connection_field_permission_filter_queryset_staff(
+    user_factory, book_factory, graphql_client
+):
+    book_factory(title="one")
+    book_factory(title="two", publication_date=None)
+
+    graphql_client.force_authenticate(user_factory(is_staff=True))
+
+    response = graphql_client.execute(
+        """
+        query Books {
+            booksPublished {
+                totalCount
+                edges { node { title } }
+            }
+        }"""
+    )
+
+    assert json.loads(response.content) == {
+        "data": {
+            "booksPublished": {
+                "totalCount": 2,
+                "edges": [{"node": {"title": "one"}}, {"node": {"title": "two"}}],
+            }
+        }
+    }
+
+
+@pytest.mark.django_db()
+def test_list_field_permission_filter_queryset(
+    django_assert_num_queries, publisher_factory, book_factory, graphql_client
+):
+    publisher1 = publisher_factory(name="one")
+    publisher2 = publisher_factory(name="two")
+    book_factory(title="one", publisher=publisher1)
+    book_factory(title="two", publisher=publisher1, publication_date=None)
+    book_factory(title="three", publisher=publisher2, publication_date=None)
+
+    # The publishers, then their books prefetched by the optimizer with the
+    # permission's filter
+    with django_assert_num_queries(2):
+        response = graphql_client.execute(
+            """
+            query Publishers {
+                publishers {
+                    name
+                    publishedBooks { title }
+                }
+            }"""
+        )
+
+    assert json.loads(response.content) == {
+        "data": {
+            "publishers": [
+                {"name": "one", "publishedBooks": [{"title": "one"}]},
+                {"name": "two", "publishedBooks": []},
+            ]
+        }
+    }
@@ -0,0 +1,126 @@
+import pytest
+from rest_framework.utils import json
+
+from tests.test_app.test_app.app.types import BookType
+
+
+@pytest.mark.django_db()
+def test_list_field_prefetch_with_arguments(
+    django_assert_num_queries, publisher_factory, book_factory, graphql_client
+):
+    publisher_1 = publisher_factory()
+    publisher_2 = publisher_factory()
+    book_factory(title="alpha", publisher=publisher_1)
+    book_factory(title="beta", publisher=publisher_1)
+    book_factory(title="alpha two", publisher=publisher_2)
+
+    with django_assert_num_queries(3):
+        response = graphql_client.execute(
+            """
+            query Publishers {
+                publishers {
+                  name
+                  alphaBooks: books(title: "alpha") {
+                    title
+                  }
+                  books {
+                    title
+                  }
+                }
+            }"""
+        )
+
+    assert json.loads(response.content) == {
+        "data": {
+            "publishers": [
+                {
+                    "name": publisher_1.name,
+                    "alphaBooks": [{"title": "alpha"}],
+                    "books": [{"title": "alpha"}, {"title": "beta"}],
+                },
+                {
+                    "name": publisher_2.name,
+                    "alphaBooks": [{"title": "alpha two"}],
+                    "books": [{"title": "alpha two"}],
+                },
+            ]
+        }
+    }
+
+
+@pytest.mark.django_db()
+def test_list_field_prefetch_with_get_queryset(
+    monkeypatch, django_assert_num_queries, publisher_factory, book_factory, graphql_client
+):
+    monkeypatch.setattr(
+        BookType,
+        "get_queryset",
+        classmethod(lambda cls, queryset, info: queryset.exclude(title="hidden")),
+    )
+
+    publisher_1 = publisher_factory()
+    publisher_2 = publisher_factory()
+    book_factory(title="visible", publisher=publisher_1)
+    book_factory(title="hidden", publisher=publisher_1)
+    book_factory(title="hidden", publisher=publisher_2)
+
+    with django_assert_num_queries(2):
+        response = graphql_client.execute(
+            """
+            query Publishers {
+                publishers {
+                  name
+                  books {
+                    title
+                  }
+                }
+            }"""
+        )
+
+    assert json.loads(response.content) == {
+        "data": {
+            "publishers": [
+                {"name": publisher_1.name, "books": [{"title": "visible"}]},
+                {"name": publisher_2.name, "books": []},
+            ]
+        }
+    }
+
+
+@pytest.mark.django_db()
+def test_prefetch_queryset_uses_get_queryset(
+    monkeypatch, django_assert_num_queries, publisher_factory, book_factory, graphql_client
+):
+    monkeypatch.setattr(
+        BookType,
+        "get_queryset",
+        classmethod(lambda cls, queryset, info: queryset.exclude(title="hidden")),
+    )
+
+    publisher_1 = publisher_factory()
+    publisher_2 = publisher_factory()
+    book_factory(title="visible", publisher=publisher_1)
+    book_factory(title="hidden", publisher=publisher_1)
+    book_factory(title="hidden", publisher=publisher_2)
+
+    with django_assert_num_queries(2):
+        response = graphql_client.execute(
+            """
+            query Publishers {
+                publishers {
+                  name
+                  bookList {
+                    title
+                  }
+                }
+            }"""
+        )
+
+    assert json.loads(response.content) == {
+        "data": {
+            "publishers": [
+                {"name": publisher_1.name, "bookList": [{"title": "visible"}]},
+                {"name": publisher_2.name, "bookList": []},
+            ]
+        }
+    }
@@ -0,0 +1,112 @@
+import pytest
+from graphql_relay import to_global_id
+from rest_framework.utils import json
+
+from tests.test_app.test_app.app.models import Book
+
+CREATE_RELAY_BOOKS = """
+  mutation CreateRelayBooks($input: CreateRelayBooksInput!) {
+    createRelayBooks(input: $input) {
+      items {
+        book {
+          id
+          title
+        }
+      }
+      errors {
+        field
+        messages
+        path
+      }
+    }
+  }
+"""
+
+
+@pytest.mark.django_db()
+def test_relay_mutation_bulk_create_serializer_successful(
+    graphql_client, django_assert_num_queries
+):
+    # SQLite doesn't return the primary keys from bulk inserts, so an INSERT
+    # per book inside the savepoint of the transaction.
+    with django_assert_num_queries(4):
+        response = graphql_client.execute(
+            CREATE_RELAY_BOOKS,
+            {"input": {"items": [{"title": "Book 1"}, {"title": "Book 2"}]}},
+        )
+
+    books = list(Book.objects.order_by("title"))
+    assert [book.title for book in books] == ["Book 1", "Book 2"]
+    assert response.status_code == 200
+    assert json.loads(response.content) == {
+        "data": {
+            "createRelayBooks": {
+                "items": [
+                    {"book": {"id": to_global_id("BookType", book.pk), "title": book.title}}
+                    for book in books
+                ],
+                "errors": None,
+            }
+        }
+    }
+
+
+@pytest.mark.django_db()
+def test_relay_mutation_bulk_create_invalidates_cached_count(
+    graphql_client, book_factory
+):
+    book_factory(title="Book 0")
+    query = """
+        query Books($search: String) {
+            booksFilteredCached(search: $search) {
+              totalCount
+            }
+        }"""
+
+    def total_count():
+        response = graphql_client.execute(query, {"search": "Book"})
+        return json.loads(response.content)["data"]["booksFilteredCached"]["totalCount"]
+
+    assert total_count() == 1
+
+    graphql_client.execute(
+        CREATE_RELAY_BOOKS,
+        {"input": {"items": [{"title": "Book 1"}, {"title": "Book 2"}]}},
+    )
+
+    assert total_count() == 3
+
+
+@pytest.mark.django_db()
+def test_relay_mutation_bulk_create_serializer_validation(graphql_client):
+    response = graphql_client.execute(
+        CREATE_RELAY_BOOKS,
+        {"input": {"items": [{"title": "Book 1"}, {"title": ""}]}},
+    )
+
+    assert response.status_code == 200
+    assert json.loads(response.content) == {
+        "data": {
+            "createRelayBooks": {
+                "items": None,
+                "errors": [
+                    {
+                        "field": "items[1].title",
+                        "messages": ["This field may not be blank."],
+                        "path": ["items", "1", "title"],
+                    }
+                ],
+            }
+        }
+    }
+    assert not Book.objects.exists()
+
+
+@pytest.mark.django_db()
+def test_relay_mutation_bulk_create_serializer_empty_list(graphql_client):
+    response = graphql_client.execute(CREATE_RELAY_BOOKS, {"input": {"items": []}})
+
+    assert response.status_code == 200
+    assert json.loads(response.content) == {
+        "data": {"createRelayBooks": {"items": [], "errors": None}}
+    }
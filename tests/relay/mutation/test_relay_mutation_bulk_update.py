@@ -0,0 +1,261 @@
+import pytest
+from django.core.cache import cache
+from graphql_relay import to_global_id
+from rest_framework.utils import json
+
+from graphene_django_plus.node_cache import NodeCache
+from tests.test_app.test_app.app.models import Book
+
+book_cache = NodeCache()
+book_cache.bind(Book, "pk")
+
+UPDATE_RELAY_BOOKS = """
+  mutation UpdateRelayBooks($input: UpdateRelayBooksInput!) {
+    updateRelayBooks(input: $input) {
+      items {
+        title
+      }
+      errors {
+        field
+        messages
+        path
+      }
+    }
+  }
+"""
+
+UPDATE_RELAY_BOOKS_PARTIAL = """
+  mutation UpdateRelayBooksPartial($input: UpdateRelayBooksPartialInput!) {
+    updateRelayBooksPartial(input: $input) {
+      items {
+        title
+      }
+      errors {
+        field
+        messages
+        path
+      }
+    }
+  }
+"""
+
+
+@pytest.mark.django_db()
+def test_relay_mutation_bulk_update_serializer_successful(
+    graphql_client, book_factory, django_assert_num_queries
+):
+    books = [book_factory() for _ in range(3)]
+
+    # One SELECT for the books, one UPDATE inside the savepoint.
+    with django_assert_num_queries(4):
+        response = graphql_client.execute(
+            UPDATE_RELAY_BOOKS,
+            {
+                "input": {
+                    "items": [
+                        {"id": to_global_id("BookType", book.pk), "title": title}
+                        for book, title in zip(books, ["Book 1", "Book 2", "Book 3"])
+                    ]
+                }
+            },
+        )
+
+    assert response.status_code == 200
+    assert json.loads(response.content) == {
+        "data": {
+            "updateRelayBooks": {
+                "items": [{"title": "Book 1"}, {"title": "Book 2"}, {"title": "Book 3"}],
+                "errors": None,
+            }
+        }
+    }
+    assert [Book.objects.get(pk=book.pk).title for book in books] == [
+        "Book 1",
+        "Book 2",
+        "Book 3",
+    ]
+
+
+@pytest.mark.django_db()
+def test_relay_mutation_bulk_update_unchanged(
+    graphql_client, book_factory, django_assert_num_queries
+):
+    book = book_factory()
+
+    # Nothing changed, so only the SELECT and the savepoint.
+    with django_assert_num_queries(3):
+        response = graphql_client.execute(
+            UPDATE_RELAY_BOOKS,
+            {
+                "input": {
+                    "items": [{"id": to_global_id("BookType", book.pk), "title": book.title}]
+                }
+            },
+        )
+
+    assert response.status_code == 200
+    assert json.loads(response.content) == {
+        "data": {"updateRelayBooks": {"items": [{"title": book.title}], "errors": None}}
+    }
+
+
+@pytest.mark.django_db()
+def test_relay_mutation_bulk_update_serializer_validation(graphql_client, book_factory):
+    books = [book_factory() for _ in range(2)]
+
+    response = graphql_client.execute(
+        UPDATE_RELAY_BOOKS,
+        {
+            "input": {
+                "items": [
+                    {"id": to_global_id("BookType", books[0].pk), "title": "Book 1"},
+                    {"id": to_global_id("BookType", books[1].pk), "title": ""},
+                ]
+            }
+        },
+    )
+
+    assert response.status_code == 200
+    assert json.loads(response.content) == {
+        "data": {
+            "updateRelayBooks": {
+                "items": None,
+                "errors": [
+                    {
+                        "field": "items[1].title",
+                        "messages": ["This field may not be blank."],
+                        "path": ["items", "1", "title"],
+                    }
+                ],
+            }
+        }
+    }
+    assert Book.objects.get(pk=books[0].pk).title == books[0].title
+
+
+@pytest.mark.django_db()
+def test_relay_mutation_bulk_update_invalid_ids(graphql_client, book_factory):
+    book = book_factory()
+
+    response = graphql_client.execute(
+        UPDATE_RELAY_BOOKS,
+        {
+            "input": {
+                "items": [
+                    {"id": to_global_id("BookType", book.pk), "title": "Book 1"},
+                    {"id": "123", "title": "Book 2"},
+                    {"id": to_global_id("PublisherType", book.pk), "title": "Book 3"},
+                    {"id": to_global_id("BookType", book.pk + 1), "title": "Book 4"},
+                ]
+            }
+        },
+    )
+
+    assert response.status_code == 200
+    assert json.loads(response.content) == {
+        "data": {
+            "updateRelayBooks": {
+                "items": None,
+                "errors": [
+                    {
+                        "field": "items[{}].id".format(idx),
+                        "messages": ["No Book matches the given query."],
+                        "path": ["items", str(idx), "id"],
+                    }
+                    for idx in (1, 2, 3)
+                ],
+            }
+        }
+    }
+    assert Book.objects.get(pk=book.pk).title == book.title
+
+
+@pytest.mark.django_db()
+def test_relay_mutation_bulk_update_partial(graphql_client, book_factory):
+    books = [book_factory() for _ in range(2)]
+
+    response = graphql_client.execute(
+        UPDATE_RELAY_BOOKS_PARTIAL,
+        {
+            "input": {
+                "items": [
+                    {"id": to_global_id("BookType", books[0].pk), "title": "Book 1"},
+                    {"id": to_global_id("BookType", books[1].pk)},
+                ]
+            }
+        },
+    )
+
+    assert response.status_code == 200
+    assert json.loads(response.content) == {
+        "data": {
+            "updateRelayBooksPartial": {
+                "items": [{"title": "Book 1"}, {"title": books[1].title}],
+                "errors": None,
+            }
+        }
+    }
+    assert Book.objects.get(pk=books[0].pk).title == "Book 1"
+
+
+@pytest.mark.django_db()
+def test_relay_mutation_bulk_update_by_changed_fields(
+    graphql_client, book_factory, django_assert_num_queries
+):
+    books = [book_factory(num_pages=100) for _ in range(4)]
+
+    # The SELECT, an UPDATE of the titles, an UPDATE of the pages inside the
+    # savepoint, the unchanged book isn't saved.
+    with django_assert_num_queries(5):
+        response = graphql_client.execute(
+            UPDATE_RELAY_BOOKS_PARTIAL,
+            {
+                "input": {
+                    "items": [
+                        {"id": to_global_id("BookType", books[0].pk), "title": "Book 1"},
+                        {"id": to_global_id("BookType", books[1].pk), "numPages": 200},
+                        {"id": to_global_id("BookType", books[2].pk), "title": "Book 3"},
+                        {"id": to_global_id("BookType", books[3].pk), "numPages": 100},
+                    ]
+                }
+            },
+        )
+
+    assert response.status_code == 200
+    assert json.loads(response.content)["data"]["updateRelayBooksPartial"]["errors"] is None
+    assert [
+        (book.title, book.num_pages)
+        for book in Book.objects.filter(pk__in=[book.pk for book in books]).order_by("pk")
+    ] == [
+        ("Book 1", 100),
+        (books[1].title, 200),
+        ("Book 3", 100),
+        (books[3].title, 100),
+    ]
+
+
+@pytest.mark.django_db()
+def test_relay_mutation_bulk_update_invalidates_caches(graphql_client, book_factory):
+    cache.clear()
+    book = book_factory(title="Book 0")
+    query = """
+        query Books($search: String) {
+            booksFilteredCached(search: $search) {
+              totalCount
+            }
+        }"""
+
+    def total_count():
+        response = graphql_client.execute(query, {"search": "Book"})
+        return json.loads(response.content)["data"]["booksFilteredCached"]["totalCount"]
+
+    book_cache.set_many([book], book_cache.get_many([book.pk])[1])
+    assert total_count() == 1
+
+    graphql_client.execute(
+        UPDATE_RELAY_BOOKS,
+        {"input": {"items": [{"id": to_global_id("BookType", book.pk), "title": "Other"}]}},
+    )
+
+    assert book_cache.get_many([book.pk])[0] == {}
+    assert total_count() == 0
@@ -268,3 +268,42 @@ def test_relay_mutation_update_serializer_partial_with_input(
     book.refresh_from_db()
 
     assert book.title == "new title"
+
+
+@pytest.mark.django_db()
+def test_relay_mutation_update_reuses_loaded_instance(
+    django_assert_num_queries, graphql_client, book_factory
+):
+    book = book_factory()
+    book_id = to_global_id("BookType", book.pk)
+
+    # select, update, update
+    with django_assert_num_queries(3):
+        response = graphql_client.execute(
+            """
+  mutation UpdateRelayBook($first: UpdateRelayBookInput!, $second: UpdateRelayBookInput!) {
+    first: updateRelayBook(input: $first) {
+      title
+    }
+    second: updateRelayBook(input: $second) {
+      title
+    }
+  }
+""",
+            {
+                "first": {"id": book_id, "title": "first title"},
+                "second": {"id": book_id, "title": "second title"},
+            },
+        )
+
+    assert response.status_code == 200
+    assert json.loads(response.content) == {
+        "data": {
+            "first": {"title": "first title"},
+            "second": {"title": "second title"},
+        }
+    }
+
+    book.refresh_from_db()
+
+    assert book.title == "second title"
@@ -392,3 +392,101 @@ def test_serializer_base_client_id_mutation_convert_serializer_to_input_type():
     assert json.loads(json.dumps(result.data)) == {
         "serializerMutation": {"errors": None, "value": "123"}
     }
+
+
+@pytest.mark.django_db()
+def test_serializer_base_client_id_mutation_serializer_relay_id_field_list_batched(
+    django_assert_num_queries, book_factory
+):
+    class Serializer(serializers.Serializer):
+        ids = serializers.ListField(
+            child=SerializerRelayIDField(BookType, node_class=PlusNode),
+            source="books",
+            write_only=True,
+        )
+        book = SerializerRelayIDField(BookType, node_class=PlusNode)
+        titles = serializers.ListField(child=serializers.CharField(), read_only=True)
+
+        def create(self, validated_data):
+            return {
+                "titles": [b.title for b in validated_data["books"] + [validated_data["book"]]]
+            }
+
+    class SerializerMutation(SerializerClientIDCreateMutation):
+        class Meta:
+            serializer_class = Serializer
+
+    class Mutation(graphene.ObjectType):
+        serializer_mutation = SerializerMutation.Field()
+
+    schema = graphene.Schema(mutation=Mutation, types=[BookType])
+
+    mutation = """
+    mutation SerializerMutation($input: SerializerMutationInput!) {
+        serializerMutation(input: $input) {
+          titles
+          errors {
+            field
+            messages
+            path
+          }
+        }
+    }
+    """
+
+    books = [book_factory(title="book {}".format(i)) for i in range(3)]
+
+    # Test: Successful
+    with django_assert_num_queries(1), pytest.warns(UserWarning):
+        result = schema.execute(
+            mutation,
+            variables={
+                "input": {
+                    "ids": [to_global_id("BookType", b.pk) for b in books],
+                    "book": to_global_id("BookType", books[0].pk),
+                }
+            },
+            context={},
+        )
+
+    assert json.loads(json.dumps(result.data)) == {
+        "serializerMutation": {
+            "errors": None,
+            "titles": ["book 0", "book 1", "book 2", "book 0"],
+        }
+    }
+
+    # Test: Errors per element
+    with django_assert_num_queries(1), pytest.warns(UserWarning):
+        result = schema.execute(
+            mutation,
+            variables={
+                "input": {
+                    "ids": [
+                        to_global_id("BookType", books[0].pk),
+                        to_global_id("BookType", 0),
+                        "asdf",
+                    ],
+                    "book": to_global_id("BookType", books[1].pk),
+                }
+            },
+            context={},
+        )
+
+    assert json.loads(json.dumps(result.data)) == {
+        "serializerMutation": {
+            "errors": [
+                {
+                    "field": "ids.1",
+                    "messages": ["No Book matches the given query."],
+                    "path": ["ids", "1"],
+                },
+                {
+                    "field": "ids.2",
+                    "messages": ["Not a valid ID."],
+                    "path": ["ids", "2"],
+                },
+            ],
+            "titles": None,
+        }
+    }
@@ -0,0 +1,42 @@
+import pytest
+from rest_framework.utils import json
+
+
+@pytest.mark.django_db()
+def test_connection_aggregates(django_assert_num_queries, book_factory, graphql_client):
+    book_factory(title="one", num_pages=100)
+    book_factory(title="two", num_pages=300)
+    book_factory(title="three", num_pages=None)
+    book_factory(title="four", num_pages=1000)
+
+    # totalCount reuses the count of the aggregates resolved before it
+    with django_assert_num_queries(1):
+        response = graphql_client.execute(
+            """
+            query Books {
+                booksFiltered(search: "t") {
+                  aggregates {
+                    count
+                    numPages {
+                      sum
+                      avg
+                      min
+                      max
+                    }
+                  }
+                  totalCount
+                }
+            }"""
+        )
+
+    assert json.loads(response.content) == {
+        "data": {
+            "booksFiltered": {
+                "aggregates": {
+                    "count": 2,
+                    "numPages": {"sum": 300.0, "avg": 300.0, "min": 300.0, "max": 300.0},
+                },
+                "totalCount": 2,
+            }
+        }
+    }
@@ -8,8 +8,7 @@ def test_django_connection_total_count(django_assert_num_queries, book_factory,
     book_1 = book_factory()
     book_2 = book_factory()
 
-    with django_assert_num_queries(2):
-        # TODO: Is it possble to make this query without selecting all books? (queries: 1, only count)
+    with django_assert_num_queries(1):
         response = graphql_client.execute(
             """
             query Books {
@@ -26,3 +25,86 @@ def test_django_connection_total_count(django_assert_num_queries, book_factory,
                 }
             }
         }
+
+
+@pytest.mark.django_db()
+def test_django_connection_page_without_total_count(
+    django_assert_num_queries, book_factory, graphql_client
+):
+    book_1 = book_factory()
+    book_2 = book_factory()
+    book_factory()
+
+    # only the page, one row more than requested
+    with django_assert_num_queries(1) as captured:
+        response = graphql_client.execute(
+            """
+            query Books {
+                books(first: 2) {
+                  edges {
+                    node {
+                      id
+                    }
+                  }
+                  pageInfo {
+                    hasNextPage
+                    hasPreviousPage
+                  }
+                }
+            }"""
+        )
+
+    assert "COUNT" not in captured.captured_queries[0]["sql"]
+    assert json.loads(response.content) == {
+        "data": {
+            "books": {
+                "edges": [
+                    {"node": {"id": to_global_id("BookType", book_1.pk)}},
+                    {"node": {"id": to_global_id("BookType", book_2.pk)}},
+                ],
+                "pageInfo": {"hasNextPage": True, "hasPreviousPage": False},
+            }
+        }
+    }
+
+
+@pytest.mark.django_db()
+def test_django_connection_last_with_total_count(
+    django_assert_num_queries, book_factory, graphql_client
+):
+    book_factory()
+    book_2 = book_factory()
+    book_3 = book_factory()
+
+    # the count is shared by totalCount and the offset of `last`
+    with django_assert_num_queries(2):
+        response = graphql_client.execute(
+            """
+            query Books {
+                books(last: 2) {
+                  totalCount
+                  edges {
+                    node {
+                      id
+                    }
+                  }
+                  pageInfo {
+                    hasNextPage
+                    hasPreviousPage
+                  }
+                }
+            }"""
+        )
+
+    assert json.loads(response.content) == {
+        "data": {
+            "books": {
+                "totalCount": 3,
+                "edges": [
+                    {"node": {"id": to_global_id("BookType", book_2.pk)}},
+                    {"node": {"id": to_global_id("BookType", book_3.pk)}},
+                ],
+                "pageInfo": {"hasNextPage": False, "hasPreviousPage": True},
+            }
+        }
+    }
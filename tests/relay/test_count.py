@@ -0,0 +1,102 @@
+import pytest
+from graphql_relay import to_global_id
+from rest_framework.utils import json
+
+from graphene_django_plus.relay.count import CappedCount, EstimatedCount
+from graphene_django_plus.signals import bulk_changed
+from tests.test_app.test_app.app.models import Book
+
+
+@pytest.mark.django_db()
+def test_capped_count(django_assert_num_queries, book_factory, graphql_client):
+    book_factory()
+    book_factory()
+    book_factory()
+
+    with django_assert_num_queries(1) as captured:
+        response = graphql_client.execute(
+            """
+            query Books {
+                booksCapped {
+                  totalCount
+                }
+            }"""
+        )
+
+    assert "LIMIT 2" in captured.captured_queries[0]["sql"]
+    assert json.loads(response.content) == {"data": {"booksCapped": {"totalCount": 2}}}
+
+
+@pytest.mark.django_db()
+def test_count_strategy_setting(settings, book_factory, graphql_client):
+    settings.GRAPHENE_DJANGO_PLUS_COUNT_STRATEGY = CappedCount(1)
+    book_factory()
+    book_factory()
+    book_3 = book_factory()
+
+    response = graphql_client.execute(
+        """
+        query Books {
+            books(last: 1) {
+              totalCount
+              edges {
+                node {
+                  id
+                }
+              }
+            }
+        }"""
+    )
+
+    # `last` is still paginated with the exact count
+    assert json.loads(response.content) == {
+        "data": {
+            "books": {
+                "totalCount": 1,
+                "edges": [{"node": {"id": to_global_id("BookType", book_3.pk)}}],
+            }
+        }
+    }
+
+
+@pytest.mark.django_db()
+def test_estimated_count_falls_back_without_planner_estimates(book_factory):
+    book_factory()
+    book_factory()
+
+    assert EstimatedCount(threshold=0).count(Book.objects.all()) == 2
+
+
+@pytest.mark.django_db()
+def test_cached_count(django_assert_num_queries, book_factory, graphql_client):
+    book_factory(title="one")
+    book_factory(title="two")
+
+    query = """
+        query Books($search: String) {
+            booksFilteredCached(search: $search) {
+              totalCount
+            }
+        }"""
+
+    def total_count(search):
+        response = graphql_client.execute(query, {"search": search})
+        return json.loads(response.content)["data"]["booksFilteredCached"]["totalCount"]
+
+    with django_assert_num_queries(1):
+        assert total_count("t") == 1
+    with django_assert_num_queries(0):
+        assert total_count("t") == 1
+    with django_assert_num_queries(1):
+        assert total_count("o") == 1
+
+    book_factory(title="three")
+
+    with django_assert_num_queries(1):
+        assert total_count("t") == 2
+
+    Book.objects.bulk_create([Book(title="ten")])
+    bulk_changed.send(sender=Book, instances=[])
+
+    with django_assert_num_queries(1):
+        assert total_count("t") == 3
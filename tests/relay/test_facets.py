@@ -0,0 +1,86 @@
+import pytest
+from rest_framework.utils import json
+
+from graphene_django_plus.fields import PlusFilterConnectionField
+from tests.test_app.test_app.app.types import AuthorType
+
+
+@pytest.mark.django_db()
+def test_connection_facets(
+    django_assert_num_queries, publisher_factory, book_factory, graphql_client
+):
+    publisher1 = publisher_factory()
+    publisher2 = publisher_factory()
+    book_factory(title="one", publisher=publisher1)
+    book_factory(title="two", publisher=publisher1)
+    book_factory(title="three", publisher=publisher2)
+    book_factory(title="thirty")
+    book_factory(title="four", publisher=publisher2)
+
+    # The publisher lookup of the filter's validation, a query for the page
+    # and a GROUP BY query for the facet, which ignores the publisher filter
+    # but not the search
+    with django_assert_num_queries(3):
+        response = graphql_client.execute(
+            """
+            query Books($publisher: ID) {
+                booksFaceted(search: "t", publisher: $publisher) {
+                  edges {
+                    node {
+                      title
+                    }
+                  }
+                  facets {
+                    name
+                    values {
+                      value
+                      count
+                    }
+                  }
+                }
+            }""",
+            variables={"publisher": publisher2.pk},
+        )
+
+    assert json.loads(response.content) == {
+        "data": {
+            "booksFaceted": {
+                "edges": [{"node": {"title": "three"}}],
+                "facets": [
+                    {
+                        "name": "publisher",
+                        "values": [
+                            {"value": str(publisher1.pk), "count": 1},
+                            {"value": str(publisher2.pk), "count": 1},
+                            {"value": None, "count": 1},
+                        ],
+                    }
+                ],
+            }
+        }
+    }
+
+
+@pytest.mark.django_db()
+def test_connection_without_facets(graphql_client):
+    response = graphql_client.execute(
+        """
+        query Books {
+            booksFiltered {
+              facets {
+                name
+              }
+            }
+        }"""
+    )
+
+    assert json.loads(response.content)["errors"][0]["message"] == (
+        'Cannot query field "facets" on type "BookTypeConnection".'
+    )
+
+
+def test_facets_require_a_filterset():
+    field = PlusFilterConnectionField(AuthorType, facets=("first_name",))
+
+    with pytest.raises(AssertionError, match="need a filterset_class or filter_fields"):
+        field.get_facets_resolver()
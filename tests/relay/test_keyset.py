@@ -0,0 +1,142 @@
+import datetime
+
+import pytest
+from django.contrib.auth.models import User
+from graphql_relay import to_global_id
+from rest_framework.utils import json
+
+from graphene_django_plus.relay.keyset import (
+    decode_keyset_cursor,
+    encode_keyset_cursor,
+    get_keyset_filter,
+    get_keyset_ordering,
+)
+
+
+@pytest.mark.django_db()
+def test_keyset_pagination_first_after(
+    django_assert_num_queries, book_factory, graphql_client
+):
+    book_1 = book_factory(title="one")
+    book_2 = book_factory(title="two")
+    book_3 = book_factory(title="three")
+
+    query = """
+        query Books($after: String) {
+            booksKeyset(first: 2, after: $after) {
+              edges {
+                node {
+                  id
+                }
+              }
+              pageInfo {
+                hasNextPage
+                hasPreviousPage
+                endCursor
+              }
+            }
+        }"""
+
+    response = graphql_client.execute(query)
+    connection = json.loads(response.content)["data"]["booksKeyset"]
+
+    assert [edge["node"]["id"] for edge in connection["edges"]] == [
+        to_global_id("BookType", book_1.pk),
+        to_global_id("BookType", book_2.pk),
+    ]
+    assert connection["pageInfo"]["hasNextPage"] is True
+    assert connection["pageInfo"]["hasPreviousPage"] is False
+
+    with django_assert_num_queries(1) as captured:
+        response = graphql_client.execute(
+            query, {"after": connection["pageInfo"]["endCursor"]}
+        )
+    connection = json.loads(response.content)["data"]["booksKeyset"]
+
+    assert [edge["node"]["id"] for edge in connection["edges"]] == [
+        to_global_id("BookType", book_3.pk),
+    ]
+    assert connection["pageInfo"]["hasNextPage"] is False
+    assert connection["pageInfo"]["hasPreviousPage"] is True
+    assert not any("OFFSET" in q["sql"] for q in captured.captured_queries)
+
+
+@pytest.mark.django_db()
+def test_keyset_pagination_last_before_with_tie_breaker(book_factory, graphql_client):
+    book_1 = book_factory(title="a")
+    book_2 = book_factory(title="b")
+    book_3 = book_factory(title="a")
+
+    query = """
+        query Books($before: String) {
+            booksByTitle(last: 2, before: $before) {
+              edges {
+                node {
+                  id
+                  title
+                }
+              }
+              pageInfo {
+                hasNextPage
+                hasPreviousPage
+                startCursor
+              }
+            }
+        }"""
+
+    response = graphql_client.execute(query)
+    connection = json.loads(response.content)["data"]["booksByTitle"]
+
+    assert [edge["node"] for edge in connection["edges"]] == [
+        {"id": to_global_id("BookType", book_3.pk), "title": "a"},
+        {"id": to_global_id("BookType", book_1.pk), "title": "a"},
+    ]
+    assert connection["pageInfo"]["hasNextPage"] is False
+    assert connection["pageInfo"]["hasPreviousPage"] is True
+
+    response = graphql_client.execute(
+        query, {"before": connection["pageInfo"]["startCursor"]}
+    )
+    connection = json.loads(response.content)["data"]["booksByTitle"]
+
+    assert [edge["node"] for edge in connection["edges"]] == [
+        {"id": to_global_id("BookType", book_2.pk), "title": "b"},
+    ]
+    assert connection["pageInfo"]["hasNextPage"] is True
+    assert connection["pageInfo"]["hasPreviousPage"] is False
+
+
+@pytest.mark.django_db()
+def test_keyset_pagination_invalid_cursor(graphql_client):
+    response = graphql_client.execute(
+        """
+        query Books {
+            booksKeyset(after: "YXJyYXljb25uZWN0aW9uOjE=") {
+              totalCount
+            }
+        }"""
+    )
+
+    assert json.loads(response.content) == {
+        "data": {"booksKeyset": None},
+        "errors": [
+            {
+                "locations": [{"column": 13, "line": 3}],
+                "message": "Invalid cursor YXJyYXljb25uZWN0aW9uOjE=",
+                "path": ["booksKeyset"],
+            }
+        ],
+    }
+
+
+@pytest.mark.django_db()
+def test_keyset_cursor_keeps_microseconds(user_factory):
+    date_joined = datetime.datetime(2020, 1, 1, 12, 0, 0, 123456)
+    users = [user_factory(date_joined=date_joined) for _ in range(3)]
+    queryset = User.objects.order_by("date_joined")
+    keys = get_keyset_ordering(queryset)
+
+    cursor = encode_keyset_cursor([users[0].date_joined, users[0].pk])
+    values = decode_keyset_cursor(cursor, keys)
+
+    assert list(queryset.filter(get_keyset_filter(keys, values)).order_by("pk")) == users[1:]
@@ -0,0 +1,107 @@
+import pytest
+from graphql_relay import to_global_id
+from rest_framework.utils import json
+
+
+@pytest.mark.django_db()
+def test_nodes_batches_lookups_by_type(
+    django_assert_num_queries, publisher_factory, book_factory, graphql_client
+):
+    publisher = publisher_factory()
+    book_1 = book_factory(title="one")
+    book_2 = book_factory(title="two")
+
+    with django_assert_num_queries(2):
+        response = graphql_client.execute(
+            """
+            query Nodes($ids: [ID!]!) {
+                nodes(ids: $ids) {
+                  id
+                  ... on BookType {
+                    title
+                  }
+                  ... on PublisherType {
+                    name
+                  }
+                }
+            }""",
+            variables={
+                "ids": [
+                    to_global_id("BookType", book_2.pk),
+                    to_global_id("PublisherType", publisher.pk),
+                    to_global_id("BookType", 0),
+                    to_global_id("BookType", book_1.pk),
+                ]
+            },
+        )
+
+    assert json.loads(response.content) == {
+        "data": {
+            "nodes": [
+                {"id": to_global_id("BookType", book_2.pk), "title": "two"},
+                {"id": to_global_id("PublisherType", publisher.pk), "name": publisher.name},
+                None,
+                {"id": to_global_id("BookType", book_1.pk), "title": "one"},
+            ]
+        }
+    }
+
+
+@pytest.mark.django_db()
+def test_aliased_node_fields_are_batched(
+    django_assert_num_queries, book_factory, graphql_client
+):
+    book_1 = book_factory(title="one")
+    book_2 = book_factory(title="two")
+
+    with django_assert_num_queries(1):
+        response = graphql_client.execute(
+            """
+            query Books($id1: ID!, $id2: ID!) {
+                first: book(id: $id1) {
+                  title
+                }
+                second: book(id: $id2) {
+                  title
+                }
+            }""",
+            variables={
+                "id1": to_global_id("BookType", book_1.pk),
+                "id2": to_global_id("BookType", book_2.pk),
+            },
+        )
+
+    assert json.loads(response.content) == {
+        "data": {"first": {"title": "one"}, "second": {"title": "two"}}
+    }
+
+
+@pytest.mark.django_db()
+def test_nodes_permission_classes_without_permission(
+    user_factory, book_factory, graphql_client
+):
+    user = user_factory()
+    book = book_factory()
+    graphql_client.force_authenticate(user)
+
+    response = graphql_client.execute(
+        """
+        query NodesAsAdmin($ids: [ID!]!) {
+            nodesAsAdmin(ids: $ids) {
+              id
+            }
+        }""",
+        variables={"ids": [to_global_id("BookType", book.pk)]},
+    )
+
+    assert response.status_code == 200
+    assert json.loads(response.content) == {
+        "data": None,
+        "errors": [
+            {
+                "locations": [{"column": 13, "line": 3}],
+                "message": "You do not have permission to perform this action.",
+                "path": ["nodesAsAdmin"],
+            }
+        ],
+    }
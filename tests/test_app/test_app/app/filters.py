@@ -10,7 +10,7 @@ class BookFilter(django_filters.FilterSet):
 
     class Meta:
         model = Book
-        fields = ("search",)
+        fields = ("search", "publisher")
 
     @classmethod
     def my_search_filter(cls, queryset, name, value):  # pylint: disable=W0613
@@ -29,7 +29,11 @@ class Book(models.Model):
     title = models.CharField(max_length=100)
     authors = models.ManyToManyField(Author)
     publisher = models.ForeignKey(
-        Publisher, null=True, blank=True, on_delete=models.PROTECT
+        Publisher,
+        null=True,
+        blank=True,
+        on_delete=models.PROTECT,
+        related_name="books",
     )
     publication_date = models.DateField(blank=True, null=True)
     num_pages = models.IntegerField(blank=True, null=True)
@@ -1,4 +1,6 @@
 from graphene_django_plus.relay.mutation import (
+    SerializerClientIDBulkCreateMutation,
+    SerializerClientIDBulkUpdateMutation,
     SerializerClientIDCreateMutation,
     SerializerClientIDUpdateMutation,
 )
@@ -6,6 +8,7 @@ from graphene_django_plus.relay.node import PlusNode
 from tests.test_app.test_app.app.serializers import (
     CreateRelayBookSerializer,
     UpdateRelayBookSerializer,
+    UpdateRelayBooksSerializer,
 )
 
 
@@ -15,6 +18,12 @@ class CreateRelayBookMutation(SerializerClientIDCreateMutation):
         name = "CreateRelayBookPayload"
 
 
+class CreateRelayBooksMutation(SerializerClientIDBulkCreateMutation):
+    class Meta:
+        serializer_class = CreateRelayBookSerializer
+        name = "CreateRelayBooksPayload"
+
+
 class UpdateRelayBookMutation(SerializerClientIDUpdateMutation):
     class Meta:
         serializer_class = UpdateRelayBookSerializer
@@ -29,3 +38,19 @@ class UpdateRelayBookPartialMutation(SerializerClientIDUpdateMutation):
         node_class = PlusNode
         partial = True
         name = "UpdateRelayBookPartialPayload"
+
+
+class UpdateRelayBooksMutation(SerializerClientIDBulkUpdateMutation):
+    class Meta:
+        serializer_class = UpdateRelayBooksSerializer
+        node_class = PlusNode
+        partial = False
+        name = "UpdateRelayBooksPayload"
+
+
+class UpdateRelayBooksPartialMutation(SerializerClientIDBulkUpdateMutation):
+    class Meta:
+        serializer_class = UpdateRelayBooksSerializer
+        node_class = PlusNode
+        partial = True
+        name = "UpdateRelayBooksPartialPayload"
@@ -1,13 +1,20 @@
 import graphene
 from rest_framework.permissions import IsAdminUser
 
-from graphene_django_plus.fields import PlusListField
+from graphene_django_plus.fields import PlusConnectionField, PlusListField
+from graphene_django_plus.optimizer import query
+from graphene_django_plus.relay.node import PlusNode
 from graphene_django_plus.routers import TestRouter
+from tests.test_app.test_app.app.models import Book, Publisher
 from tests.test_app.test_app.app.mutations import (
     CreateRelayBookMutation,
+    CreateRelayBooksMutation,
     UpdateRelayBookMutation,
     UpdateRelayBookPartialMutation,
+    UpdateRelayBooksMutation,
+    UpdateRelayBooksPartialMutation,
 )
+from tests.test_app.test_app.app.types import BookType, PublisherType
 from tests.test_app.test_app.app.typesets import (
     BookRelayTypeSet,
     BookRelayAdminTypeSet,
@@ -15,6 +22,15 @@ from tests.test_app.test_app.app.typesets import (
     BookRelayFilteredTypeSet,
     BookRelayFilteredAdminTypeSet,
     BookRelayFilteredThrottleTypeSet,
+    BookRelayKeysetTypeSet,
+    BookRelayCappedTypeSet,
+    BookRelayFilteredCachedTypeSet,
+    BookRelayFacetedTypeSet,
+    BookRelayPublishedTypeSet,
+)
+from tests.test_app.test_app.permissions import (
+    CountedPermission,
+    UncachedCountedPermission,
 )
 from tests.test_app.test_app.throttles import (
     ThrottleEight,
@@ -30,6 +46,11 @@ test_router.register("book_throttle", BookRelayThrottleTypeSet)
 test_router.register("book_filtered", BookRelayFilteredTypeSet)
 test_router.register("book_filtered_admin", BookRelayFilteredAdminTypeSet)
 test_router.register("book_filtered_throttle", BookRelayFilteredThrottleTypeSet)
+test_router.register("book_keyset", BookRelayKeysetTypeSet)
+test_router.register("book_capped", BookRelayCappedTypeSet)
+test_router.register("book_filtered_cached", BookRelayFilteredCachedTypeSet)
+test_router.register("book_faceted", BookRelayFacetedTypeSet)
+test_router.register("book_published", BookRelayPublishedTypeSet)
 
 _query = test_router.query()
 
@@ -37,9 +58,20 @@ _query = test_router.query()
 class Query(_query):
     other = PlusListField(graphene.String)
     other_as_admin = PlusListField(graphene.String, permission_classes=[IsAdminUser])
+    other_counted = PlusListField(
+        graphene.String, permission_classes=[CountedPermission]
+    )
+    other_uncached = PlusListField(
+        graphene.String, permission_classes=[UncachedCountedPermission]
+    )
     other_throttle = PlusListField(
         graphene.String, throttle_classes=[ThrottleThirteen]
     )
+    other_plain = graphene.List(graphene.String)
+    publishers = PlusListField(PublisherType)
+    books_by_title = PlusConnectionField(BookType, keyset_pagination=True)
+    nodes = PlusNode.NodesField()
+    nodes_as_admin = PlusNode.NodesField(permission_classes=[IsAdminUser])
 
     def resolve_other(self, info):
         return ["1", "2"]
@@ -47,9 +79,24 @@ class Query(_query):
     def resolve_other_as_admin(self, info):
         return ["1", "2"]
 
+    def resolve_other_counted(self, info):
+        return ["1", "2"]
+
+    def resolve_other_uncached(self, info):
+        return ["1", "2"]
+
     def resolve_other_throttle(self, info):
         return ["1", "2"]
 
+    def resolve_other_plain(self, info):
+        return ["1", "2"]
+
+    def resolve_books_by_title(self, info, **kwargs):
+        return Book.objects.order_by("-title")
+
+    def resolve_publishers(self, info):
+        return query(Publisher.objects.order_by("pk"), info)
+
 
 class Mutation:
     create_relay_book = CreateRelayBookMutation.Field()
@@ -60,6 +107,8 @@ class Mutation:
         throttle_classes=[ThrottleEight]
     )
 
+    create_relay_books = CreateRelayBooksMutation.Field()
+
     update_relay_book = UpdateRelayBookMutation.Field()
     update_relay_book_admin = UpdateRelayBookMutation.Field(
         permission_classes=[IsAdminUser]
@@ -69,3 +118,6 @@ class Mutation:
     )
 
     update_relay_book_partial = UpdateRelayBookPartialMutation.Field()
+
+    update_relay_books = UpdateRelayBooksMutation.Field()
+    update_relay_books_partial = UpdateRelayBooksPartialMutation.Field()
@@ -19,3 +19,9 @@ class UpdateRelayBookSerializer(serializers.ModelSerializer):
         model = Book
         fields = ["title"]
 
+
+class UpdateRelayBooksSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Book
+        fields = ["title", "num_pages"]
+
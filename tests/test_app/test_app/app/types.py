@@ -2,22 +2,52 @@ import graphene
 from graphene_django.fields import DjangoListField
 
 from graphene_django_plus.fields import DjangoPlusListField
+from graphene_django_plus.optimizer import resolver_hints
 from graphene_django_plus.relay.node import PlusNode
 from graphene_django_plus.types import DjangoObjectType
 from tests.test_app.test_app.app.models import Book, Publisher, Author
+from tests.test_app.test_app.permissions import PublishedBookPermission
+
+
+def filter_books_by_title(queryset, info, title=None):
+    if title is not None:
+        queryset = queryset.filter(title__istartswith=title)
+    return queryset
 
 
 class PublisherType(DjangoObjectType):
     all_books = DjangoPlusListField("tests.test_app.test_app.app.types.BookType")
+    books = DjangoPlusListField(
+        "tests.test_app.test_app.app.types.BookType",
+        title=graphene.String(),
+        queryset_filter=filter_books_by_title,
+    )
+    book_list = graphene.List(
+        graphene.NonNull("tests.test_app.test_app.app.types.BookType")
+    )
+    published_books = DjangoPlusListField(
+        "tests.test_app.test_app.app.types.BookType",
+        permission_classes=[PublishedBookPermission],
+    )
 
     class Meta:
         model = Publisher
         interfaces = (PlusNode,)
+        use_loaders = True
+        node_cache = True
         fields = (
             "name",
             "address",
         )
 
+    @resolver_hints(model_field="books")
+    def resolve_book_list(self, info):
+        return self.books.all()
+
+    @resolver_hints(model_field="books")
+    def resolve_published_books(self, info):
+        return self.books.all()
+
 
 class AuthorType(DjangoObjectType):
     class Meta:
@@ -33,8 +63,11 @@ class AuthorType(DjangoObjectType):
 class BookType(DjangoObjectType):
     publisher = graphene.Field(PublisherType)
     all_authors = DjangoPlusListField(AuthorType)
+    authors = DjangoPlusListField(AuthorType)
 
     class Meta:
         model = Book
         interfaces = (PlusNode,)
+        use_loaders = True
+        aggregates = ("num_pages",)
         fields = ("title",)
@@ -1,9 +1,11 @@
 from rest_framework.permissions import IsAdminUser
 from rest_framework.viewsets import ModelViewSet
 
+from graphene_django_plus.relay.count import CachedCount, CappedCount
 from graphene_django_plus.typesets import RelayTypeSet
 from tests.test_app.test_app.app.filters import BookFilter
 from tests.test_app.test_app.app.types import BookType
+from tests.test_app.test_app.permissions import PublishedBookPermission
 from tests.test_app.test_app.throttles import ThrottleThree, ThrottleFour, ThrottleSix
 
 
@@ -70,3 +72,53 @@ class BookRelayFilteredThrottleTypeSet(RelayTypeSet):
     operations = {
         "list": "books_filtered_throttled",
     }
+
+
+class BookRelayKeysetTypeSet(RelayTypeSet):
+    object_type = BookType
+    keyset_pagination = True
+
+    operations = {
+        "list": "books_keyset",
+    }
+
+
+class BookRelayCappedTypeSet(RelayTypeSet):
+    object_type = BookType
+    count_strategy = CappedCount(2)
+
+    operations = {
+        "list": "books_capped",
+    }
+
+
+class BookRelayFilteredCachedTypeSet(RelayTypeSet):
+    object_type = BookType
+    filterset_class = BookFilter
+    count_strategy = CachedCount()
+
+    operations = {
+        "list": "books_filtered_cached",
+    }
+
+
+class BookRelayFacetedTypeSet(RelayTypeSet):
+    object_type = BookType
+    filterset_class = BookFilter
+    facets = ("publisher",)
+
+    operations = {
+        "list": "books_faceted",
+    }
+
+
+class BookRelayPublishedTypeSet(RelayTypeSet):
+    object_type = BookType
+    filterset_class = BookFilter
+    facets = ("publisher",)
+
+    permission_classes = [PublishedBookPermission]
+
+    operations = {
+        "list": "books_published",
+    }
@@ -2,8 +2,10 @@
 from rest_framework.authentication import SessionAuthentication, BasicAuthentication
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 
-from graphene_django_plus.views import GraphQLAPIView
+from graphene_django_plus.views import GraphQLAPIView, GraphQLExportAPIView
+from tests.test_app.test_app.permissions import CountedPermission, UncachedCountedPermission
 from tests.test_app.test_app.throttles import (
+    CostThrottle,
     ThrottleOne,
     ThrottleTwo,
     ThrottleFive,
@@ -17,6 +19,23 @@ class CustomGraphQLAPIView(GraphQLAPIView):
     pass
 
 
+class ExportGraphQLAPIView(GraphQLExportAPIView):
+    resolver_permission_classes = [CountedPermission]
+    graphene_export_chunk_size = 2
+
+
+class AuthorizeDocumentExportGraphQLAPIView(GraphQLExportAPIView):
+    resolver_permission_classes = [UncachedCountedPermission]
+    graphene_authorize_document = True
+    graphene_export_chunk_size = 2
+
+
+class AuthorizeDocumentGraphQLAPIView(GraphQLAPIView):
+    authentication_classes = [BasicAuthentication, SessionAuthentication]
+    permission_classes = [IsAuthenticated]
+    graphene_authorize_document = True
+
+
 class AuthGraphQLAPIView(GraphQLAPIView):
     authentication_classes = [BasicAuthentication, SessionAuthentication]
     permission_classes = [IsAuthenticated]
@@ -39,6 +58,12 @@ class ThrottleGraphQLAPIView(GraphQLAPIView):
     throttle_classes = [ThrottleOne]
 
 
+class CostThrottleGraphQLAPIView(GraphQLAPIView):
+    authentication_classes = [BasicAuthentication, SessionAuthentication]
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [CostThrottle]
+
+
 class ThrottleResolverGraphQLAPIView(GraphQLAPIView):
     authentication_classes = [BasicAuthentication, SessionAuthentication]
     permission_classes = [IsAuthenticated]
@@ -0,0 +1,20 @@
+from rest_framework import permissions
+
+
+class CountedPermission(permissions.BasePermission):
+    calls = 0
+
+    def has_permission(self, request, view):
+        type(self).calls += 1
+        return True
+
+
+class UncachedCountedPermission(CountedPermission):
+    cacheable = False
+
+
+class PublishedBookPermission(permissions.BasePermission):
+    def filter_queryset(self, request, queryset):
+        if request.user.is_staff:
+            return queryset
+        return queryset.filter(publication_date__isnull=False)
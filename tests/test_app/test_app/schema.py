@@ -1,5 +1,7 @@
 import graphene
 
+from graphene_django_plus.incremental import incremental_directives
+
 from .app import schema as app_schema
 
 
@@ -11,4 +13,6 @@ class Mutation(app_schema.Mutation, graphene.ObjectType):
     pass
 
 
-schema = graphene.Schema(query=Query, mutation=Mutation)
+schema = graphene.Schema(
+    query=Query, mutation=Mutation, directives=incremental_directives
+)
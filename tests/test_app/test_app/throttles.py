@@ -1,5 +1,7 @@
 from rest_framework import throttling
 
+from graphene_django_plus.throttling import CostUserRateThrottle
+
 
 class ThrottleOne(throttling.UserRateThrottle):
     scope = "throttle1"
@@ -90,3 +92,10 @@ class ThrottleThirteen(throttling.UserRateThrottle):
 
     def get_rate(self):
         return "1/day"
+
+
+class CostThrottle(CostUserRateThrottle):
+    scope = "cost"
+
+    def get_rate(self):
+        return "10/min"
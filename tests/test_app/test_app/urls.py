@@ -15,13 +15,18 @@ Including another URLconf
 """
 from django.urls import re_path
 
+from graphene_django_plus.middleware import RootFieldPermissionMiddleware
 from graphene_django_plus.validators import (
     DocumentDepthValidator,
     DisableIntrospectionValidator,
 )
 from tests.test_app.test_app.app.views import (
     CustomGraphQLAPIView,
+    CostThrottleGraphQLAPIView,
+    ExportGraphQLAPIView,
     AuthGraphQLAPIView,
+    AuthorizeDocumentExportGraphQLAPIView,
+    AuthorizeDocumentGraphQLAPIView,
     AdminGraphQLAPIView,
     AdminResolverGraphQLAPIView,
     ThrottleGraphQLAPIView,
@@ -84,11 +89,38 @@ urlpatterns = [
         AdminGraphQLAPIView.as_view(graphene_schema=schema),
         name="graphql-admin",
     ),
+    re_path(
+        r"^graphql-authorize",
+        AuthorizeDocumentGraphQLAPIView.as_view(graphene_schema=schema),
+        name="graphql-authorize",
+    ),
     re_path(
         r"^graphql-auth",
         AuthGraphQLAPIView.as_view(graphene_schema=schema),
         name="graphql-auth",
     ),
+    re_path(
+        r"^graphql-cost",
+        CostThrottleGraphQLAPIView.as_view(graphene_schema=schema),
+        name="graphql-cost",
+    ),
+    re_path(
+        r"^graphql-export-authorize",
+        AuthorizeDocumentExportGraphQLAPIView.as_view(graphene_schema=schema),
+        name="graphql-export-authorize",
+    ),
+    re_path(
+        r"^graphql-export",
+        ExportGraphQLAPIView.as_view(graphene_schema=schema),
+        name="graphql-export",
+    ),
+    re_path(
+        r"^graphql-middleware",
+        AdminResolverGraphQLAPIView.as_view(
+            graphene_schema=schema, graphene_middleware=[RootFieldPermissionMiddleware],
+        ),
+        name="graphql-middleware",
+    ),
     re_path(
         r"^graphql-introspection",
         CustomGraphQLAPIView.as_view(
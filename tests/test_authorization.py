@@ -0,0 +1,121 @@
+import pytest
+from django.core.cache import cache
+from graphql import parse
+from rest_framework.utils import json
+
+from graphene_django_plus.authorization import SelectedFields, get_field_checks
+from tests.test_app.test_app.permissions import UncachedCountedPermission
+from tests.test_app.test_app.schema import schema
+
+
+def test_field_checks():
+    field_checks = get_field_checks(schema)
+
+    assert field_checks[("Query", "otherUncached")] == ([UncachedCountedPermission], None)
+    assert ("PublisherType", "allBooks") in field_checks
+    assert ("PublisherType", "bookList") not in field_checks
+
+
+def test_selected_fields():
+    query = """
+        query Publishers($skip: Boolean!) {
+            publishers {
+                name
+                allBooks @skip(if: $skip) { title }
+                ...PublisherFields @include(if: false)
+            }
+            nodes(ids: []) {
+                ... on BookType { authors { firstName } }
+            }
+        }
+        fragment PublisherFields on PublisherType { books { title } }
+    """
+    document_ast = parse(query)
+
+    assert SelectedFields(schema, document_ast, {"skip": True}).get_fields() == [
+        ("Query", "publishers"),
+        ("PublisherType", "name"),
+        ("Query", "nodes"),
+        ("BookType", "authors"),
+        ("AuthorType", "firstName"),
+    ]
+    assert ("PublisherType", "allBooks") in SelectedFields(
+        schema, document_ast, {"skip": False}
+    ).get_fields()
+
+
+@pytest.mark.django_db()
+def test_authorize_document_permission_classes(
+    graphql_authorize_client, user_factory, publisher_factory, django_assert_num_queries
+):
+    publisher_factory()
+    user = user_factory()
+
+    graphql_authorize_client.force_authenticate(user)
+
+    query = """
+        query Publishers {
+            publishers { name }
+            otherAsAdmin
+        }"""
+
+    # Rejected before the publishers are fetched
+    with django_assert_num_queries(0):
+        response = graphql_authorize_client.execute(query)
+
+    assert response.status_code == 403
+    assert json.loads(response.content) == {
+        "errors": [{"message": "You do not have permission to perform this action."}]
+    }
+
+
+@pytest.mark.django_db()
+def test_authorize_document_throttle_classes(
+    graphql_authorize_client, user_factory, django_assert_num_queries
+):
+    cache.clear()
+    user = user_factory()
+
+    graphql_authorize_client.force_authenticate(user)
+
+    query = """
+        query Publishers {
+            publishers { name }
+            otherThrottle
+        }"""
+
+    response = graphql_authorize_client.execute(query)
+
+    assert response.status_code == 200
+    assert json.loads(response.content) == {
+        "data": {"publishers": [], "otherThrottle": ["1", "2"]}
+    }
+
+    with django_assert_num_queries(0):
+        response = graphql_authorize_client.execute(query)
+
+    assert response.status_code == 429
+    assert json.loads(response.content) == {
+        "errors": [{"message": "Request was throttled. Expected available in 86400 seconds."}]
+    }
+
+
+@pytest.mark.django_db()
+def test_authorize_document_skips_resolver_checks(graphql_authorize_client, user_factory):
+    UncachedCountedPermission.calls = 0
+    user = user_factory()
+
+    graphql_authorize_client.force_authenticate(user)
+
+    response = graphql_authorize_client.execute(
+        """
+        query Other {
+            one: otherUncached
+            two: otherUncached
+        }"""
+    )
+
+    assert json.loads(response.content) == {
+        "data": {"one": ["1", "2"], "two": ["1", "2"]}
+    }
+    assert UncachedCountedPermission.calls == 1
@@ -0,0 +1,169 @@
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from graphql import parse
+from rest_framework.test import APIRequestFactory
+from rest_framework.utils import json
+
+from graphene_django_plus.cost import get_document_cost
+from graphene_django_plus.exceptions import OperationCostExceeded
+from graphene_django_plus.throttling import CostAnonRateThrottle
+from graphene_django_plus.views import GraphQLAPIView
+from tests.test_app.test_app.schema import schema
+
+
+def cost(query, variables=None, default_list_size=100):
+    return get_document_cost(
+        schema, parse(query), variables=variables, default_list_size=default_list_size
+    )
+
+
+def test_document_cost():
+    assert cost("{ other }") == 1
+    assert cost("{ books(first: 5) { totalCount edges { node { id title } } } }") == 18
+    assert (
+        cost(
+            "query Books($first: Int) { books(first: $first) { edges { node { id } } } }",
+            {"first": 2},
+        )
+        == 6
+    )
+    assert cost("{ publishers { name books { title } } }", default_list_size=10) == 121
+
+
+def test_document_cost_fragments():
+    query = """
+        query Books {
+            books(first: 2) {
+                edges {
+                    node {
+                        __typename
+                        ...BookFields
+                        ... on BookType { id }
+                    }
+                }
+            }
+        }
+        fragment BookFields on BookType { title }
+    """
+    assert cost(query) == 8
+
+
+@pytest.mark.django_db()
+def test_cost_throttle(graphql_cost_client, user_factory):
+    cache.clear()
+    user = user_factory()
+
+    graphql_cost_client.force_authenticate(user)
+
+    query = """
+        query Books {
+            books(first: 2) {
+                edges { node { id } }
+            }
+        }"""
+
+    # Costs 6 of 10 tokens
+    response = graphql_cost_client.execute(query)
+
+    assert response.status_code == 200
+    assert json.loads(response.content) == {"data": {"books": {"edges": []}}}
+
+    # Throttled until 2 more tokens are refilled, 1 every 6 seconds
+    response = graphql_cost_client.execute(query)
+
+    assert response.status_code == 429
+    assert json.loads(response.content) == {
+        "errors": [{"message": "Request was throttled. Expected available in 12 seconds."}]
+    }
+
+    # Cheaper operations still fit
+    response = graphql_cost_client.execute("query Other { other }")
+
+    assert response.status_code == 200
+
+
+class Clock:
+    now = 600.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cost_throttle_token_bucket():
+    cache.clear()
+    clock = Clock()
+
+    class Throttle(CostAnonRateThrottle):
+        rate = "10/min"
+        timer = clock
+
+    def charge(cost):
+        request = APIRequestFactory().get("/")
+        request.user = AnonymousUser()
+        request.graphql_cost = cost
+        throttle = Throttle()
+        return throttle.allow_request(request, None), throttle
+
+    assert charge(6)[0]
+
+    allowed, throttle = charge(6)
+    assert not allowed
+    assert throttle.wait() == pytest.approx(12)
+
+    # The throttled request wasn't charged, 6 tokens are refilled in 36s.
+    clock.now += 36
+    assert charge(6)[0]
+    assert charge(4)[0]
+    assert not charge(1)[0]
+
+    with pytest.raises(OperationCostExceeded) as exc_info:
+        charge(11)
+    assert str(exc_info.value.detail) == (
+        "The operation costs 11, more than the 10 allowed per 60 seconds."
+    )
+
+
+@pytest.mark.django_db()
+def test_cost_throttle_rejects_operations_over_capacity(graphql_cost_client, user_factory):
+    cache.clear()
+    graphql_cost_client.force_authenticate(user_factory())
+
+    response = graphql_cost_client.execute(
+        "query Books { books(first: 5) { edges { node { id } } } }"
+    )
+
+    assert response.status_code == 400
+    assert json.loads(response.content) == {
+        "errors": [
+            {"message": "The operation costs 12, more than the 10 allowed per 60 seconds."}
+        ]
+    }
+
+
+@pytest.mark.django_db()
+def test_cost_throttle_skips_invalid_documents(graphql_cost_client, user_factory):
+    cache.clear()
+    graphql_cost_client.force_authenticate(user_factory())
+
+    response = graphql_cost_client.execute(
+        "query Books { books(first: 2) { edges { node { id unknown } } } }"
+    )
+    assert response.status_code == 400
+
+    # The invalid document would have cost 6 of the 10 tokens.
+    response = graphql_cost_client.execute(
+        "query Books { books(first: 2) { edges { node { id } } } }"
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db()
+def test_document_cost_without_cost_throttles(graphql_client, monkeypatch):
+    def get_document_cost(*args, **kwargs):
+        raise AssertionError("The cost is only estimated for cost throttles")
+
+    monkeypatch.setattr(GraphQLAPIView, "get_document_cost", get_document_cost)
+
+    response = graphql_client.execute("query Other { other }")
+    assert response.status_code == 200
@@ -0,0 +1,146 @@
+import pytest
+from rest_framework.utils import json
+
+from tests.test_app.test_app.permissions import CountedPermission, UncachedCountedPermission
+
+
+@pytest.mark.django_db()
+def test_export_connection(
+    django_assert_num_queries, publisher_factory, book_factory, graphql_export_client
+):
+    publisher1 = publisher_factory(name="publisher one")
+    publisher2 = publisher_factory(name="publisher two")
+    book_factory(title="one", publisher=publisher1)
+    book_factory(title="two", publisher=publisher1)
+    book_factory(title="three")
+    book_factory(title="four", publisher=publisher1)
+    book_factory(title="thirty", publisher=publisher2)
+
+    response = graphql_export_client.execute(
+        """
+        query Books {
+            booksFiltered(search: "t", first: 1) {
+              totalCount
+              edges {
+                node {
+                  title
+                  publisher {
+                    name
+                  }
+                }
+              }
+            }
+        }"""
+    )
+
+    assert response["Content-Type"] == "application/x-ndjson"
+    # The books are fetched with a single iterator() query, and their
+    # publishers by a loader query per chunk of 2 books
+    with django_assert_num_queries(3):
+        lines = b"".join(response.streaming_content).decode().splitlines()
+
+    assert [json.loads(line) for line in lines] == [
+        {"data": {"title": "two", "publisher": {"name": "publisher one"}}},
+        {"data": {"title": "three", "publisher": None}},
+        {"data": {"title": "thirty", "publisher": {"name": "publisher two"}}},
+    ]
+
+
+@pytest.mark.django_db()
+def test_export_checks_permissions_once(
+    publisher_factory, book_factory, author_factory, graphql_export_client
+):
+    author = author_factory(first_name="author")
+    for title in ("one", "two", "three"):
+        book_factory(title=title).authors.add(author)
+    CountedPermission.calls = 0
+
+    response = graphql_export_client.execute(
+        """
+        query Books {
+            books {
+              edges {
+                node {
+                  title
+                  authors {
+                    firstName
+                  }
+                }
+              }
+            }
+        }"""
+    )
+    lines = b"".join(response.streaming_content).decode().splitlines()
+
+    assert len(lines) == 3
+    # The connection and the authors of the nodes of both chunks share the
+    # view's resolver_permission_classes, which are checked once.
+    assert CountedPermission.calls == 1
+
+
+@pytest.mark.django_db()
+def test_export_authorizes_document(
+    book_factory, author_factory, graphql_export_authorize_client
+):
+    author = author_factory(first_name="author")
+    for title in ("one", "two", "three"):
+        book_factory(title=title).authors.add(author)
+    UncachedCountedPermission.calls = 0
+
+    response = graphql_export_authorize_client.execute(
+        """
+        query Books {
+            books {
+              edges {
+                node {
+                  title
+                  authors {
+                    firstName
+                  }
+                }
+              }
+            }
+        }"""
+    )
+    lines = b"".join(response.streaming_content).decode().splitlines()
+
+    assert len(lines) == 3
+    # Checked for the connection and the authors before the export, which
+    # don't check them again while resolving either chunk.
+    assert UncachedCountedPermission.calls == 2
+
+
+@pytest.mark.django_db()
+def test_export_permission_denied(graphql_export_client):
+    response = graphql_export_client.execute(
+        """
+        query Books {
+            booksAsAdmin {
+              edges {
+                node {
+                  title
+                }
+              }
+            }
+        }"""
+    )
+
+    assert response.status_code == 403
+    assert json.loads(response.content) == {
+        "errors": [{"message": "You do not have permission to perform this action."}]
+    }
+
+
+@pytest.mark.django_db()
+def test_export_requires_connection(graphql_export_client):
+    response = graphql_export_client.execute(
+        """
+        query Other {
+            other
+        }"""
+    )
+
+    assert response.status_code == 400
+    assert json.loads(response.content) == {
+        "errors": [{"message": "The field other isn't a connection."}]
+    }
@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+
+import pytest
+
+from graphene_django_plus.identity_map import IdentityMap
+from graphene_django_plus.types import DjangoObjectType
+from tests.test_app.test_app.app.models import Book
+
+
+class AnyBookType(DjangoObjectType):
+    class Meta:
+        model = Book
+        skip_registry = True
+        fields = ("title",)
+
+
+class PublishedBookType(DjangoObjectType):
+    class Meta:
+        model = Book
+        skip_registry = True
+        fields = ("title",)
+
+    @classmethod
+    def get_queryset(cls, queryset, info):
+        return queryset.filter(publication_date__isnull=False)
+
+
+@pytest.mark.django_db()
+def test_identity_map_returns_loaded_instance(django_assert_num_queries, book_factory):
+    book = book_factory()
+    info = SimpleNamespace(context={"identity_map": IdentityMap()})
+
+    node = AnyBookType.get_node(info, book.pk)
+    assert node == book
+
+    with django_assert_num_queries(0):
+        assert AnyBookType.get_node(info, book.pk) is node
+        assert AnyBookType.get_nodes(info, [book.pk]) == [node]
+
+
+@pytest.mark.django_db()
+def test_identity_map_is_scoped_by_type(book_factory):
+    book = book_factory(publication_date=None)
+    info = SimpleNamespace(context={"identity_map": IdentityMap()})
+
+    assert AnyBookType.get_node(info, book.pk) == book
+    assert PublishedBookType.get_node(info, book.pk) is None
+    assert PublishedBookType.get_nodes(info, [book.pk]) == [None]
@@ -0,0 +1,240 @@
+import graphene
+import pytest
+from graphql import parse
+from graphql.execution import MiddlewareManager
+from rest_framework.utils import json
+
+from graphene_django_plus.incremental import IncrementalExecution, incremental_directives
+
+
+def parse_multipart(response):
+    assert response["Content-Type"].startswith("multipart/mixed")
+    content = b"".join(response.streaming_content).decode()
+    assert content.endswith("\r\n-----\r\n")
+    parts = content[: -len("\r\n-----\r\n")].split("\r\n---\r\n")[1:]
+    return [json.loads(part.split("\r\n\r\n", 1)[1]) for part in parts]
+
+
+@pytest.mark.django_db()
+def test_incremental_defer_and_stream(
+    django_assert_num_queries, publisher_factory, book_factory, graphql_client
+):
+    publisher1 = publisher_factory(name="publisher one")
+    publisher2 = publisher_factory(name="publisher two")
+    publisher3 = publisher_factory(name="publisher three")
+    book_factory(title="book one", publisher=publisher1)
+    book_factory(title="book two", publisher=publisher3)
+
+    response = graphql_client.execute(
+        """
+        query Publishers {
+            publishers @stream(initialCount: 1) {
+              name
+              ... on PublisherType @defer(label: "books") {
+                books {
+                  title
+                }
+              }
+            }
+        }""",
+        HTTP_ACCEPT="multipart/mixed, application/json",
+    )
+
+    # The first publisher is fetched before streaming the response, then
+    # the others, and the books of the deferred fragments in a batch.
+    with django_assert_num_queries(2):
+        payloads = parse_multipart(response)
+
+    assert payloads == [
+        {"data": {"publishers": [{"name": "publisher one"}]}, "hasNext": True},
+        {
+            "incremental": [
+                {
+                    "items": [{"name": "publisher two"}, {"name": "publisher three"}],
+                    "path": ["publishers", 1],
+                }
+            ],
+            "hasNext": True,
+        },
+        {
+            "incremental": [
+                {
+                    "data": {"books": [{"title": "book one"}]},
+                    "path": ["publishers", 0],
+                    "label": "books",
+                },
+                {"data": {"books": []}, "path": ["publishers", 1], "label": "books"},
+                {
+                    "data": {"books": [{"title": "book two"}]},
+                    "path": ["publishers", 2],
+                    "label": "books",
+                },
+            ],
+            "hasNext": False,
+        },
+    ]
+
+
+@pytest.mark.django_db()
+def test_incremental_without_multipart(publisher_factory, graphql_client):
+    publisher_factory(name="publisher one")
+
+    response = graphql_client.execute(
+        """
+        query Publishers {
+            publishers @stream {
+              ... on PublisherType @defer {
+                name
+              }
+            }
+        }"""
+    )
+
+    assert json.loads(response.content) == {"data": {"publishers": [{"name": "publisher one"}]}}
+
+
+class IncrementalItem(graphene.ObjectType):
+    name = graphene.String()
+    fail = graphene.String()
+    child = graphene.Field(lambda: IncrementalItem)
+
+    def resolve_fail(root, info):
+        raise Exception("{} failed".format(root["name"]))
+
+    def resolve_child(root, info):
+        return {"name": "{} child".format(root["name"])}
+
+
+class IncrementalQuery(graphene.ObjectType):
+    item = graphene.Field(IncrementalItem)
+    items = graphene.List(IncrementalItem)
+
+    def resolve_item(root, info):
+        return {"name": "item"}
+
+    def resolve_items(root, info):
+        return [{"name": "item {}".format(idx)} for idx in range(3)]
+
+
+incremental_schema = graphene.Schema(
+    query=IncrementalQuery, directives=incremental_directives
+)
+
+
+def execute_incremental(query, **kwargs):
+    execution = IncrementalExecution(incremental_schema, parse(query), **kwargs)
+    initial = execution.execute_initial()
+    return execution, initial, list(execution.execute_subsequent())
+
+
+def test_incremental_errors_in_nested_deferred_fragments():
+    _, initial, payloads = execute_incremental(
+        """
+        query {
+            item {
+              ... @defer(label: "item") {
+                name
+              }
+              child {
+                ... @defer(label: "child") {
+                  fail
+                }
+              }
+            }
+        }"""
+    )
+
+    assert initial.data == {"item": {"child": {}}}
+    # The error is only reported with the innermost fragment.
+    assert payloads == [
+        {
+            "incremental": [
+                {"data": {"name": "item"}, "path": ["item"], "label": "item"},
+                {
+                    "data": {"fail": None},
+                    "path": ["item", "child"],
+                    "label": "child",
+                    "errors": [
+                        {
+                            "message": "item child failed",
+                            "locations": [{"line": 9, "column": 19}],
+                            "path": ["item", "child", "fail"],
+                        }
+                    ],
+                },
+            ],
+            "hasNext": False,
+        }
+    ]
+
+
+def test_incremental_errors_in_streamed_items():
+    _, initial, payloads = execute_incremental(
+        """
+        query {
+            items @stream(initialCount: 1) {
+              name
+              fail
+            }
+        }"""
+    )
+
+    assert initial.data == {"items": [{"name": "item 0", "fail": None}]}
+    assert payloads == [
+        {
+            "incremental": [
+                {
+                    "items": [
+                        {"name": "item 1", "fail": None},
+                        {"name": "item 2", "fail": None},
+                    ],
+                    "path": ["items", 1],
+                    "errors": [
+                        {
+                            "message": "item {} failed".format(idx),
+                            "locations": [{"line": 5, "column": 15}],
+                            "path": ["items", idx, "fail"],
+                        }
+                        for idx in (1, 2)
+                    ],
+                }
+            ],
+            "hasNext": False,
+        }
+    ]
+
+
+def test_incremental_errors_without_path():
+    class FailingExecution(IncrementalExecution):
+        def _execute_fragments(self, records):
+            results, errors = super()._execute_fragments(records)
+            return results, errors + [Exception("fragments failed")]
+
+    execution = FailingExecution(
+        incremental_schema, parse("query { item { ... @defer { name } } }")
+    )
+    execution.execute_initial()
+
+    assert list(execution.execute_subsequent()) == [
+        {
+            "incremental": [{"data": {"name": "item"}, "path": ["item"]}],
+            "errors": [{"message": "fragments failed"}],
+            "hasNext": False,
+        }
+    ]
+
+
+def test_incremental_keeps_middleware_manager_options():
+    execution, initial, payloads = execute_incremental(
+        "query { item { ... @defer { name } } }",
+        middleware=MiddlewareManager(wrap_in_promise=False),
+    )
+
+    assert execution.exe_context.middleware.wrap_in_promise is False
+    assert initial.data == {"item": {}}
+    assert payloads == [
+        {
+            "incremental": [{"data": {"name": "item"}, "path": ["item"]}],
+            "hasNext": False,
+        }
+    ]
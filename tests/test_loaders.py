@@ -0,0 +1,232 @@
+import graphene
+import pytest
+from graphql_relay import to_global_id
+from rest_framework.utils import json
+
+from graphene_django_plus.fields import PlusConnectionField, PlusFilterConnectionField
+from graphene_django_plus.relay.node import PlusNode
+from graphene_django_plus.types import DjangoObjectType
+from tests.test_app.test_app.app.filters import BookFilter
+from tests.test_app.test_app.app.models import Book, Publisher
+from tests.test_app.test_app.app.types import BookType
+
+
+@pytest.mark.django_db()
+def test_foreign_key_loader(
+    django_assert_num_queries, publisher_factory, book_factory, graphql_client
+):
+    publisher_1 = publisher_factory()
+    publisher_2 = publisher_factory()
+    book_factory(title="one", publisher=publisher_1)
+    book_factory(title="two", publisher=publisher_2)
+    book_factory(title="three", publisher=publisher_1)
+    book_factory(title="four")
+
+    # books, publishers
+    with django_assert_num_queries(2):
+        response = graphql_client.execute(
+            """
+            query Books {
+                books {
+                  edges {
+                    node {
+                      title
+                      publisher {
+                        name
+                      }
+                    }
+                  }
+                }
+            }"""
+        )
+
+    assert json.loads(response.content) == {
+        "data": {
+            "books": {
+                "edges": [
+                    {"node": {"title": "one", "publisher": {"name": publisher_1.name}}},
+                    {"node": {"title": "two", "publisher": {"name": publisher_2.name}}},
+                    {"node": {"title": "three", "publisher": {"name": publisher_1.name}}},
+                    {"node": {"title": "four", "publisher": None}},
+                ]
+            }
+        }
+    }
+
+
+@pytest.mark.django_db()
+def test_children_loader(
+    django_assert_num_queries, publisher_factory, book_factory, graphql_client
+):
+    publisher_1 = publisher_factory()
+    publisher_2 = publisher_factory()
+    book_factory(title="one", publisher=publisher_1)
+    book_factory(title="two", publisher=publisher_1)
+
+    # publishers, books, books filtered by title
+    with django_assert_num_queries(3):
+        response = graphql_client.execute(
+            """
+            query Nodes($ids: [ID!]!) {
+                nodes(ids: $ids) {
+                  ... on PublisherType {
+                    books {
+                      title
+                    }
+                    alphaBooks: books(title: "o") {
+                      title
+                    }
+                  }
+                }
+            }""",
+            variables={
+                "ids": [
+                    to_global_id("PublisherType", publisher_1.pk),
+                    to_global_id("PublisherType", publisher_2.pk),
+                ]
+            },
+        )
+
+    assert json.loads(response.content) == {
+        "data": {
+            "nodes": [
+                {
+                    "books": [{"title": "one"}, {"title": "two"}],
+                    "alphaBooks": [{"title": "one"}],
+                },
+                {"books": [], "alphaBooks": []},
+            ]
+        }
+    }
+
+
+@pytest.mark.django_db()
+def test_many_to_many_loader(
+    django_assert_num_queries, author_factory, book_factory, graphql_client
+):
+    author_1 = author_factory()
+    author_2 = author_factory()
+    book_1 = book_factory(title="one")
+    book_2 = book_factory(title="two")
+    book_1.authors.add(author_1, author_2)
+    book_2.authors.add(author_2)
+
+    # books, authors
+    with django_assert_num_queries(2):
+        response = graphql_client.execute(
+            """
+            query Nodes($ids: [ID!]!) {
+                nodes(ids: $ids) {
+                  ... on BookType {
+                    authors {
+                      firstName
+                    }
+                  }
+                }
+            }""",
+            variables={
+                "ids": [
+                    to_global_id("BookType", book_1.pk),
+                    to_global_id("BookType", book_2.pk),
+                ]
+            },
+        )
+
+    assert json.loads(response.content) == {
+        "data": {
+            "nodes": [
+                {
+                    "authors": [
+                        {"firstName": author_1.first_name},
+                        {"firstName": author_2.first_name},
+                    ]
+                },
+                {"authors": [{"firstName": author_2.first_name}]},
+            ]
+        }
+    }
+
+
+
+class PublishedLoaderBookType(DjangoObjectType):
+    class Meta:
+        model = Book
+        skip_registry = True
+        interfaces = (PlusNode,)
+        fields = ("title",)
+
+    @classmethod
+    def get_queryset(cls, queryset, info):
+        return queryset.filter(publication_date__isnull=False)
+
+
+class LoaderPublisherType(DjangoObjectType):
+    books = PlusConnectionField(
+        PublishedLoaderBookType, permission_classes=[], throttle_classes=[]
+    )
+
+    class Meta:
+        model = Publisher
+        skip_registry = True
+        use_loaders = True
+        fields = ("name",)
+
+
+class FilteredLoaderPublisherType(DjangoObjectType):
+    books = PlusFilterConnectionField(
+        BookType, filterset_class=BookFilter, permission_classes=[], throttle_classes=[]
+    )
+
+    class Meta:
+        model = Publisher
+        skip_registry = True
+        use_loaders = True
+        fields = ("name",)
+
+
+class LoaderQuery(graphene.ObjectType):
+    publishers = graphene.List(LoaderPublisherType)
+    filtered_publishers = graphene.List(FilteredLoaderPublisherType)
+
+    def resolve_publishers(self, info):
+        return Publisher.objects.order_by("pk")
+
+    def resolve_filtered_publishers(self, info):
+        return Publisher.objects.order_by("pk")
+
+
+@pytest.mark.django_db()
+def test_connection_under_loader_type(publisher_factory, book_factory):
+    publisher = publisher_factory()
+    book_factory(title="one", publisher=publisher)
+    book_factory(title="two", publisher=publisher, publication_date=None)
+
+    result = graphene.Schema(query=LoaderQuery).execute(
+        """
+        query Publishers {
+            publishers {
+              books {
+                totalCount
+                edges {
+                  node {
+                    title
+                  }
+                }
+              }
+            }
+            filteredPublishers {
+              books(search: "t") {
+                totalCount
+              }
+            }
+        }""",
+        context_value={},
+    )
+
+    assert result.errors is None
+    assert result.data == {
+        "publishers": [
+            {"books": {"totalCount": 1, "edges": [{"node": {"title": "one"}}]}}
+        ],
+        "filteredPublishers": [{"books": {"totalCount": 1}}],
+    }
@@ -0,0 +1,61 @@
+import pytest
+from rest_framework.utils import json
+
+from graphene_django_plus.middleware import get_checked_root_fields
+from tests.test_app.test_app.schema import schema
+
+
+def test_checked_root_fields():
+    root_fields = get_checked_root_fields(schema)
+
+    assert root_fields["Query"] == frozenset(["otherPlain"])
+    assert root_fields["Mutation"] == frozenset()
+
+
+@pytest.mark.django_db()
+def test_root_field_permission_middleware(graphql_middleware_client, user_factory):
+    user = user_factory()
+
+    graphql_middleware_client.force_authenticate(user)
+
+    response = graphql_middleware_client.execute(
+        """
+        query Other {
+            otherPlain
+        }"""
+    )
+
+    assert response.status_code == 200
+    assert json.loads(response.content) == {
+        "data": {"otherPlain": None},
+        "errors": [
+            {
+                "locations": [{"column": 13, "line": 3}],
+                "message": "You do not have permission to perform this action.",
+                "path": ["otherPlain"],
+            }
+        ],
+    }
+
+
+@pytest.mark.django_db()
+def test_root_field_permission_middleware_allowed(
+    graphql_middleware_client, user_factory, publisher_factory
+):
+    publisher_factory(name="one")
+    user = user_factory(is_staff=True)
+
+    graphql_middleware_client.force_authenticate(user)
+
+    response = graphql_middleware_client.execute(
+        """
+        query Other {
+            otherPlain
+            publishers { name }
+        }"""
+    )
+
+    assert response.status_code == 200
+    assert json.loads(response.content) == {
+        "data": {"otherPlain": ["1", "2"], "publishers": [{"name": "one"}]}
+    }
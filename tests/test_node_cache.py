@@ -0,0 +1,129 @@
+import threading
+import time
+
+import pytest
+from django.core.cache import cache
+from graphql_relay import to_global_id
+from rest_framework.utils import json
+
+from graphene_django_plus.node_cache import NodeCache
+from graphene_django_plus.signals import bulk_changed
+from tests.test_app.test_app.app.models import Book
+from tests.test_app.test_app.app.types import PublisherType
+
+book_cache = NodeCache()
+book_cache.bind(Book, "pk")
+
+PUBLISHER_QUERY = """
+query Publisher($ids: [ID!]!) {
+    nodes(ids: $ids) {
+      ... on PublisherType {
+        name
+      }
+    }
+}"""
+
+
+@pytest.mark.django_db()
+def test_node_cache_is_shared_between_requests(
+    django_assert_num_queries, publisher_factory, graphql_client
+):
+    publisher = publisher_factory(name="cached")
+    node_cache = PublisherType._meta.node_cache
+    hits = node_cache.hits
+    variables = {"ids": [to_global_id("PublisherType", publisher.pk)]}
+
+    with django_assert_num_queries(1):
+        response = graphql_client.execute(PUBLISHER_QUERY, variables)
+    assert json.loads(response.content) == {"data": {"nodes": [{"name": "cached"}]}}
+
+    with django_assert_num_queries(0):
+        response = graphql_client.execute(PUBLISHER_QUERY, variables)
+    assert json.loads(response.content) == {"data": {"nodes": [{"name": "cached"}]}}
+    assert node_cache.hits == hits + 1
+
+
+@pytest.mark.django_db()
+def test_node_cache_is_invalidated_on_save(
+    django_assert_num_queries, publisher_factory, graphql_client
+):
+    publisher = publisher_factory(name="cached")
+    variables = {"ids": [to_global_id("PublisherType", publisher.pk)]}
+
+    graphql_client.execute(PUBLISHER_QUERY, variables)
+
+    publisher.name = "updated"
+    publisher.save()
+
+    with django_assert_num_queries(1):
+        response = graphql_client.execute(PUBLISHER_QUERY, variables)
+    assert json.loads(response.content) == {"data": {"nodes": [{"name": "updated"}]}}
+
+
+@pytest.mark.django_db()
+def test_node_cache_waits_for_the_loading_request(publisher_factory):
+    cache.clear()
+    publisher = publisher_factory(name="cached")
+    node_cache = PublisherType._meta.node_cache
+    hits = node_cache.hits
+    lock_key = "{}:lock".format(node_cache.get_key(publisher.pk))
+    _, version = node_cache.get_many([])
+
+    def release():
+        node_cache.set_many([publisher], version)
+        cache.delete(lock_key)
+
+    # Another request is loading the entry.
+    cache.add(lock_key, 1)
+    threading.Timer(0.1, release).start()
+
+    def load():
+        raise AssertionError("The entry should be read from the cache")
+
+    assert node_cache.get(publisher.pk, load).name == "cached"
+    assert node_cache.hits == hits + 1
+
+
+def test_node_cache_stops_waiting_when_the_lock_is_released():
+    cache.clear()
+    node_cache = PublisherType._meta.node_cache
+    lock_key = "{}:lock".format(node_cache.get_key(0))
+
+    # Another request is loading an id that doesn't exist.
+    cache.add(lock_key, 1)
+    threading.Timer(0.1, cache.delete, [lock_key]).start()
+
+    start = time.monotonic()
+    assert node_cache.get(0, lambda: None) is None
+    assert time.monotonic() - start < node_cache.lock_timeout
+
+
+@pytest.mark.django_db()
+def test_node_cache_is_invalidated_on_m2m_changed(book_factory, author_factory):
+    cache.clear()
+    book = book_factory()
+    author = author_factory()
+
+    _, version = book_cache.get_many([book.pk])
+    book_cache.set_many([book], version)
+    assert list(book_cache.get_many([book.pk])[0]) == [str(book.pk)]
+
+    book.authors.add(author)
+    assert book_cache.get_many([book.pk])[0] == {}
+
+    book_cache.set_many([book], book_cache.get_many([book.pk])[1])
+    author.book_set.remove(book)
+    assert book_cache.get_many([book.pk])[0] == {}
+
+
+@pytest.mark.django_db()
+def test_node_cache_is_invalidated_on_bulk_changed(book_factory):
+    cache.clear()
+    book = book_factory()
+
+    _, version = book_cache.get_many([book.pk])
+    book_cache.set_many([book], version)
+    assert list(book_cache.get_many([book.pk])[0]) == [str(book.pk)]
+
+    bulk_changed.send(sender=Book, instances=[book])
+    assert book_cache.get_many([book.pk])[0] == {}
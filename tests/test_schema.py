@@ -10,6 +10,10 @@ schema {
   mutation: Mutation
 }
 
+directive @defer(if: Boolean = true, label: String) on FRAGMENT_SPREAD | INLINE_FRAGMENT
+
+directive @stream(if: Boolean = true, label: String, initialCount: Int = 0) on FIELD
+
 type AuthorType implements PlusNode {
   firstName: String!
   lastName: String!
@@ -22,12 +26,19 @@ type BookType implements PlusNode {
   id: ID!
   publisher: PublisherType
   allAuthors: [AuthorType!]
+  authors: [AuthorType!]
+}
+
+type BookTypeAggregates {
+  count: Int!
+  numPages: NumericAggregate
 }
 
 type BookTypeConnection {
   pageInfo: PageInfo!
   edges: [BookTypeEdge]!
   totalCount: Int!
+  aggregates: BookTypeAggregates!
 }
 
 type BookTypeEdge {
@@ -35,6 +46,19 @@ type BookTypeEdge {
   cursor: String!
 }
 
+type BookTypeFacetedConnection {
+  pageInfo: PageInfo!
+  edges: [BookTypeFacetedEdge]!
+  totalCount: Int!
+  facets: [Facet!]!
+  aggregates: BookTypeAggregates!
+}
+
+type BookTypeFacetedEdge {
+  node: BookType
+  cursor: String!
+}
+
 input CreateRelayBookInput {
   title: String!
   clientMutationId: String
@@ -46,20 +70,59 @@ type CreateRelayBookPayload {
   clientMutationId: String
 }
 
+input CreateRelayBooksInput {
+  items: [CreateRelayBooksItemInput!]!
+  clientMutationId: String
+}
+
+type CreateRelayBooksItem {
+  book: BookType
+}
+
+input CreateRelayBooksItemInput {
+  title: String!
+}
+
+type CreateRelayBooksPayload {
+  items: [CreateRelayBooksItem!]
+  errors: [ErrorType]
+  clientMutationId: String
+}
+
 type ErrorType {
   field: String
   messages: [String!]!
   path: [String!]
 }
 
+type Facet {
+  name: String!
+  values: [FacetValue!]!
+}
+
+type FacetValue {
+  value: String
+  count: Int!
+}
+
 type Mutation {
   createRelayBook(input: CreateRelayBookInput!): CreateRelayBookPayload
   createRelayBookAdmin(input: CreateRelayBookInput!): CreateRelayBookPayload
   createRelayBookThrottle(input: CreateRelayBookInput!): CreateRelayBookPayload
+  createRelayBooks(input: CreateRelayBooksInput!): CreateRelayBooksPayload
   updateRelayBook(input: UpdateRelayBookInput!): UpdateRelayBookPayload
   updateRelayBookAdmin(input: UpdateRelayBookInput!): UpdateRelayBookPayload
   updateRelayBookThrottle(input: UpdateRelayBookInput!): UpdateRelayBookPayload
   updateRelayBookPartial(input: UpdateRelayBookPartialInput!): UpdateRelayBookPartialPayload
+  updateRelayBooks(input: UpdateRelayBooksInput!): UpdateRelayBooksPayload
+  updateRelayBooksPartial(input: UpdateRelayBooksPartialInput!): UpdateRelayBooksPartialPayload
+}
+
+type NumericAggregate {
+  sum: Float
+  avg: Float
+  min: Float
+  max: Float
 }
 
 type PageInfo {
@@ -78,6 +141,9 @@ type PublisherType implements PlusNode {
   address: String!
   id: ID!
   allBooks: [BookType!]
+  books(title: String): [BookType!]
+  bookList: [BookType!]
+  publishedBooks: [BookType!]
 }
 
 type Query {
@@ -87,12 +153,24 @@ type Query {
   booksAsAdmin(before: String, after: String, first: Int, last: Int): BookTypeConnection
   bookThrottled(id: ID!): BookType
   booksThrottled(before: String, after: String, first: Int, last: Int): BookTypeConnection
-  booksFiltered(before: String, after: String, first: Int, last: Int, search: String): BookTypeConnection
-  booksFilteredAsAdmin(before: String, after: String, first: Int, last: Int, search: String): BookTypeConnection
-  booksFilteredThrottled(before: String, after: String, first: Int, last: Int, search: String): BookTypeConnection
+  booksFiltered(before: String, after: String, first: Int, last: Int, search: String, publisher: ID): BookTypeConnection
+  booksFilteredAsAdmin(before: String, after: String, first: Int, last: Int, search: String, publisher: ID): BookTypeConnection
+  booksFilteredThrottled(before: String, after: String, first: Int, last: Int, search: String, publisher: ID): BookTypeConnection
+  booksKeyset(before: String, after: String, first: Int, last: Int): BookTypeConnection
+  booksCapped(before: String, after: String, first: Int, last: Int): BookTypeConnection
+  booksFilteredCached(before: String, after: String, first: Int, last: Int, search: String, publisher: ID): BookTypeConnection
+  booksFaceted(before: String, after: String, first: Int, last: Int, search: String, publisher: ID): BookTypeFacetedConnection
+  booksPublished(before: String, after: String, first: Int, last: Int, search: String, publisher: ID): BookTypeFacetedConnection
   other: [String]
   otherAsAdmin: [String]
+  otherCounted: [String]
+  otherUncached: [String]
   otherThrottle: [String]
+  otherPlain: [String]
+  publishers: [PublisherType]
+  booksByTitle(before: String, after: String, first: Int, last: Int): BookTypeConnection
+  nodes(ids: [ID!]!): [PlusNode]!
+  nodesAsAdmin(ids: [ID!]!): [PlusNode]!
 }
 
 input UpdateRelayBookInput {
@@ -118,5 +196,49 @@ type UpdateRelayBookPayload {
   errors: [ErrorType]
   clientMutationId: String
 }
+
+input UpdateRelayBooksInput {
+  items: [UpdateRelayBooksItemInput!]!
+  clientMutationId: String
+}
+
+type UpdateRelayBooksItem {
+  title: String
+  numPages: Int
+}
+
+input UpdateRelayBooksItemInput {
+  title: String!
+  numPages: Int
+  id: ID!
+}
+
+input UpdateRelayBooksPartialInput {
+  items: [UpdateRelayBooksPartialItemInput!]!
+  clientMutationId: String
+}
+
+type UpdateRelayBooksPartialItem {
+  title: String
+  numPages: Int
+}
+
+input UpdateRelayBooksPartialItemInput {
+  title: String
+  numPages: Int
+  id: ID!
+}
+
+type UpdateRelayBooksPartialPayload {
+  items: [UpdateRelayBooksPartialItem!]
+  errors: [ErrorType]
+  clientMutationId: String
+}
+
+type UpdateRelayBooksPayload {
+  items: [UpdateRelayBooksItem!]
+  errors: [ErrorType]
+  clientMutationId: String
+}
 """.lstrip()
     )
@@ -0,0 +1,135 @@
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from rest_framework.exceptions import Throttled
+from rest_framework.test import APIRequestFactory
+from rest_framework.throttling import AnonRateThrottle
+
+from graphene_django_plus.permissions import enforce_throttle_classes
+from graphene_django_plus.throttling import (
+    FixedWindowAnonRateThrottle,
+    SlidingWindowAnonRateThrottle,
+)
+
+
+class Clock:
+    now = 600.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture()
+def clock():
+    cache.clear()
+    return Clock()
+
+
+def make_throttle(throttle_class, clock):
+    class Throttle(throttle_class):
+        rate = "3/min"
+        timer = clock
+
+    return Throttle()
+
+
+def request_throttle(throttle_class, clock):
+    request = APIRequestFactory().get("/")
+    request.user = AnonymousUser()
+    throttle = make_throttle(throttle_class, clock)
+    return throttle.allow_request(request, None), throttle
+
+
+def test_fixed_window_throttle(clock):
+    for _ in range(3):
+        assert request_throttle(FixedWindowAnonRateThrottle, clock)[0]
+
+    clock.now += 20
+    allowed, throttle = request_throttle(FixedWindowAnonRateThrottle, clock)
+    assert not allowed
+    assert throttle.wait() == 40
+
+    # Throttled requests aren't counted and the count resets with the window
+    clock.now += 40
+    for _ in range(3):
+        assert request_throttle(FixedWindowAnonRateThrottle, clock)[0]
+    assert not request_throttle(FixedWindowAnonRateThrottle, clock)[0]
+
+
+def test_sliding_window_throttle(clock):
+    clock.now += 30
+    for _ in range(3):
+        assert request_throttle(SlidingWindowAnonRateThrottle, clock)[0]
+
+    allowed, throttle = request_throttle(SlidingWindowAnonRateThrottle, clock)
+    assert not allowed
+    # A third of the window must slide out of the next one
+    assert throttle.wait() == pytest.approx(30 + 20)
+
+    # Half of the previous window still counts, 1.5 + 1 requests
+    clock.now += 60
+    assert request_throttle(SlidingWindowAnonRateThrottle, clock)[0]
+    allowed, throttle = request_throttle(SlidingWindowAnonRateThrottle, clock)
+    assert not allowed
+    assert throttle.wait() == pytest.approx(10)
+
+    clock.now += 10
+    assert request_throttle(SlidingWindowAnonRateThrottle, clock)[0]
+    assert not request_throttle(SlidingWindowAnonRateThrottle, clock)[0]
+
+
+def test_counter_throttle_without_rate(clock):
+    class Throttle(FixedWindowAnonRateThrottle):
+        rate = None
+        timer = clock
+
+    request = APIRequestFactory().get("/")
+    for _ in range(5):
+        assert Throttle().allow_request(request, None)
+
+
+class HookedThrottle(AnonRateThrottle):
+    rate = "1/min"
+    scope = "hooked"
+    successes = 0
+    failures = 0
+
+    def throttle_success(self):
+        HookedThrottle.successes += 1
+        return super().throttle_success()
+
+    def throttle_failure(self):
+        HookedThrottle.failures += 1
+        return super().throttle_failure()
+
+
+class OtherHookedThrottle(HookedThrottle):
+    scope = "other_hooked"
+
+    def get_cache_key(self, request, view):
+        return "other:" + super().get_cache_key(request, view)
+
+
+def test_field_throttles_use_their_hooks(clock, monkeypatch):
+    request = APIRequestFactory().get("/")
+    request.user = AnonymousUser()
+    HookedThrottle.successes = HookedThrottle.failures = 0
+
+    get_many_calls = []
+    get_many = cache.get_many
+
+    def counted_get_many(keys, *args, **kwargs):
+        get_many_calls.append(list(keys))
+        return get_many(keys, *args, **kwargs)
+
+    monkeypatch.setattr(cache, "get_many", counted_get_many)
+    throttle_classes = [HookedThrottle, OtherHookedThrottle]
+
+    enforce_throttle_classes({"request": request, "throttle_cache": {}}, throttle_classes)
+    assert (HookedThrottle.successes, HookedThrottle.failures) == (2, 0)
+    # The histories of both throttles are read together.
+    assert len(get_many_calls) == 1 and len(get_many_calls[0]) == 2
+
+    with pytest.raises(Throttled):
+        enforce_throttle_classes({"request": request, "throttle_cache": {}}, throttle_classes)
+    assert (HookedThrottle.successes, HookedThrottle.failures) == (2, 2)